@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Content-hashed compilation cache for the contracts in src/.
+
+The key is a hash of the source of the contract and of every module it imports (resolved
+transitively from its import statements), the Vyper and titanoboa versions and the compiler
+settings (experimental_codegen, optimize). Nothing is parsed or analyzed to compute it, so a
+hit costs one hash per source file and an unpickle. titanoboa's own cache runs the full
+semantic analysis on every load to fingerprint the module.
+
+Each entry stores the titanoboa CompilerData (with its source map) as a pickle, for
+deployment, and the ABI, bytecode, runtime bytecode and source map as JSON, for tools that
+only need the artifacts. Deployers are also memoized per process, so repeated loads of the
+same build in a benchmark compile and unpickle once.
+
+The API mirrors titanoboa: load, loads, load_partial, loads_partial, plus compile_artifacts
+for the JSON artifacts.
+
+Usage: python3 scripts/compile_cache.py <contract.vy> [--venom] [--optimize gas|codesize|none]
+       [--cache-dir DIR]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import re
+from importlib.metadata import version
+from pathlib import Path
+
+import vyper
+from vyper.compiler import output
+from vyper.compiler.settings import OptimizationLevel
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".compile_cache"
+
+# Bumped whenever the stored entry format changes, invalidates every cached entry
+FORMAT_VERSION = 1
+
+IMPORT_RE = re.compile(r"^\s*import\s+([\w.]+)", re.MULTILINE)
+FROM_IMPORT_RE = re.compile(r"^\s*from\s+(\.*)([\w.]*)\s+import\s+(\w+)", re.MULTILINE)
+
+# Deployers already loaded in this process, by cache key
+_deployers = {}
+
+
+def _find_module(base: Path, dotted: str) -> Path | None:
+    relative = Path(*dotted.split("."))
+    for suffix in (".vy", ".vyi"):
+        candidate = base / relative.with_suffix(suffix)
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+def _imports(source: str, path: Path) -> list:
+    """Files imported by `source`, skipping builtin interfaces (ethereum.ercs) that have no file."""
+    found = []
+    for name in IMPORT_RE.findall(source):
+        found.append(_find_module(path.parent, name) or _find_module(SRC_DIR, name))
+    for dots, package, name in FROM_IMPORT_RE.findall(source):
+        dotted = f"{package}.{name}" if package else name
+        if dots:
+            base = path.parent
+            for _ in range(len(dots) - 1):
+                base = base.parent
+            found.append(_find_module(base, dotted))
+        else:
+            found.append(_find_module(path.parent, dotted) or _find_module(SRC_DIR, dotted))
+    return [p for p in found if p is not None]
+
+
+def dependencies(source: str, path: Path) -> dict:
+    """{resolved path: source} of every module imported by `source`, transitively."""
+    seen = {}
+    pending = _imports(source, path)
+    while pending:
+        module = pending.pop()
+        if module in seen:
+            continue
+        seen[module] = module.read_text()
+        pending.extend(_imports(seen[module], module))
+    return seen
+
+
+def compiler_args(experimental_codegen: bool | None = None, optimize: str | None = None) -> dict:
+    """Settings passed to the compiler. None leaves the setting to the source's pragmas."""
+    args = {}
+    if experimental_codegen is not None:
+        args['experimental_codegen'] = experimental_codegen
+    if optimize is not None:
+        args['optimize'] = OptimizationLevel.from_string(optimize)
+    return args
+
+
+def cache_key(source: str, path: Path, experimental_codegen: bool | None = None,
+              optimize: str | None = None) -> str:
+    path = Path(path).resolve()
+    sources = {str(path): source, **{str(p): s for p, s in dependencies(source, path).items()}}
+    spec = json.dumps({
+        'sources': {p: hashlib.sha256(s.encode()).hexdigest() for p, s in sorted(sources.items())},
+        'vyper': vyper.__version__,
+        # The pickled CompilerData is titanoboa's, boa itself has no __version__
+        'titanoboa': version('titanoboa'),
+        'experimental_codegen': experimental_codegen,
+        'optimize': optimize,
+        'version': FORMAT_VERSION,
+    }, sort_keys=True)
+    return f"{path.stem}-{hashlib.sha256(spec.encode()).hexdigest()[:16]}"
+
+
+def _write(path: Path, data: bytes) -> None:
+    # Write then rename so parallel test workers never read a partial file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def artifacts(data) -> dict:
+    """ABI, bytecode and source map of a CompilerData, JSON-serializable."""
+    source_map = output.build_source_map_output(data)
+    return {
+        'abi': output.build_abi_output(data),
+        'bytecode': "0x" + data.bytecode.hex(),
+        'bytecode_runtime': "0x" + data.bytecode_runtime.hex(),
+        'source_map': {
+            'pc_pos_map': source_map['pc_pos_map'],
+            'pc_jump_map': source_map['pc_jump_map'],
+            'error_map': source_map['error_map'],
+        },
+    }
+
+
+def loads_partial(source: str, filename: str | Path, experimental_codegen: bool | None = None,
+                  optimize: str | None = None, cache_dir: Path = DEFAULT_CACHE_DIR):
+    """titanoboa VyperDeployer for `source`, compiled once per key. `filename` resolves imports."""
+    from boa.contracts.vyper.vyper_contract import VyperDeployer
+    from boa.interpret import compiler_data
+
+    filename = str(Path(filename).resolve())
+    key = cache_key(source, Path(filename), experimental_codegen, optimize)
+    if key in _deployers:
+        return _deployers[key]
+
+    entry = Path(cache_dir) / f"{key}.pickle"
+    if entry.exists():
+        data = pickle.loads(entry.read_bytes())
+    else:
+        args = compiler_args(experimental_codegen, optimize)
+        data = compiler_data(source, filename, filename, VyperDeployer, **args)
+        _write(Path(cache_dir) / f"{key}.json", json.dumps(artifacts(data)).encode())
+        _write(entry, pickle.dumps(data))
+
+    _deployers[key] = VyperDeployer(data, filename=filename)
+    return _deployers[key]
+
+
+def load_partial(path: str | Path, experimental_codegen: bool | None = None,
+                 optimize: str | None = None, cache_dir: Path = DEFAULT_CACHE_DIR):
+    return loads_partial(Path(path).read_text(), path, experimental_codegen, optimize, cache_dir)
+
+
+def warm(path: str | Path, experimental_codegen: bool | None = None, optimize: str | None = None,
+         cache_dir: Path = DEFAULT_CACHE_DIR) -> None:
+    """Compile the contract at `path` into the cache if it is missing, without loading an entry."""
+    source = Path(path).read_text()
+    key = cache_key(source, Path(path), experimental_codegen, optimize)
+    if not (Path(cache_dir) / f"{key}.pickle").exists():
+        loads_partial(source, path, experimental_codegen, optimize, cache_dir)
+
+
+def loads(source: str, *args, filename: str | Path, experimental_codegen: bool | None = None,
+          optimize: str | None = None, **kwargs):
+    """Deploy `source` like boa.loads, compiling through the cache."""
+    return loads_partial(source, filename, experimental_codegen, optimize).deploy(*args, **kwargs)
+
+
+def load(path: str | Path, *args, experimental_codegen: bool | None = None,
+         optimize: str | None = None, **kwargs):
+    """Deploy the contract at `path` like boa.load, compiling through the cache."""
+    return load_partial(path, experimental_codegen, optimize).deploy(*args, **kwargs)
+
+
+def compile_artifacts(path: str | Path, experimental_codegen: bool | None = None,
+                      optimize: str | None = None, cache_dir: Path = DEFAULT_CACHE_DIR) -> dict:
+    """JSON artifacts (abi, bytecode, bytecode_runtime, source_map) of the contract at `path`."""
+    source = Path(path).read_text()
+    key = cache_key(source, Path(path), experimental_codegen, optimize)
+    entry = Path(cache_dir) / f"{key}.json"
+    if not entry.exists():
+        deployer = loads_partial(source, path, experimental_codegen, optimize, cache_dir)
+        _write(entry, json.dumps(artifacts(deployer.compiler_data)).encode())
+    return json.loads(entry.read_text())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a contract into the cache")
+    parser.add_argument("contract", type=Path)
+    parser.add_argument("--venom", action="store_true", help="experimental codegen")
+    parser.add_argument("--optimize", choices=["gas", "codesize", "none"], default=None)
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    result = compile_artifacts(args.contract, args.venom or None, args.optimize, args.cache_dir)
+    key = cache_key(args.contract.read_text(), args.contract, args.venom or None, args.optimize)
+    runtime_size = (len(result['bytecode_runtime']) - 2) // 2
+    print(f"{args.cache_dir / key}.json: {runtime_size} runtime bytes")
+
+
+if __name__ == "__main__":
+    main()
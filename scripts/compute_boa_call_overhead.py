@@ -1,22 +1,23 @@
 #!/usr/bin/env python3
 """
-Measure external call overhead in titanoboa.
+Measure external call overhead in titanoboa, per build.
 
-titanoboa measures external calls; Foundry measures library functions.
-This script measures the constant overhead (~118 gas) to subtract from
-titanoboa results for fair comparison.
+titanoboa measures external calls; Foundry measures library functions. Rather than
+subtracting one constant (noop() gas) from every result, this splits each call's gas into
+dispatch, ABI decode, compute and ABI encode from its opcode trace (scripts/gas_accounting.py)
+and prints the split for a noop() probe and for every Gaussian external, per build.
+The compute column is the figure to compare against Foundry.
+
+Usage: python3 scripts/compute_boa_call_overhead.py
 """
 
-import boa
-import statistics
 from pathlib import Path
 
+import compile_cache
+import gas_accounting
+from gas_benchmark import BENCHMARK_INPUTS, BUILDS, load_gaussian
 
-def measure_call_overhead():
-    """Measure external call overhead in titanoboa."""
-
-    # Create minimal test contract
-    source = """
+PROBE = """
 @external
 @pure
 def noop() -> uint256:
@@ -31,62 +32,39 @@ def simple_computation() -> uint256:
     return z
 """
 
-    contract = boa.loads(source)
-
-    # Measure baseline (noop)
-    print("Measuring external call overhead in titanoboa...")
-    print()
+# Foundry's erfc (pure computation)
+SOLGAUSS_ERFC = 688
 
-    results = []
-    for _ in range(10):
-        contract.noop()
-        results.append(contract._computation.get_gas_used())
 
-    baseline = int(statistics.mean(results))
-    baseline_min = min(results)
-    baseline_max = max(results)
-
-    print("noop() - External function with no computation:")
-    print(f"  avg: {baseline}, min: {baseline_min}, max: {baseline_max}")
-    print()
+def measure_call_overhead():
+    """{build: {function: mean gas per category}} for the probe and the Gaussian externals."""
+    results = {}
+    for build, (contract, experimental_codegen) in BUILDS.items():
+        probe = compile_cache.loads(PROBE, filename=Path(__file__).parent / "call_overhead.vy",
+                                    experimental_codegen=experimental_codegen)
+        gaussian = load_gaussian(experimental_codegen, contract)
+        rows = {
+            'noop': gas_accounting.account(probe, 'noop', [()]),
+            'simple_comp': gas_accounting.account(probe, 'simple_computation', [()]),
+        }
+        for function, inputs in BENCHMARK_INPUTS.items():
+            rows[function] = gas_accounting.account(gaussian, function, inputs)
+        results[build] = rows
+    return results
 
-    # Measure with computation
-    results = []
-    for _ in range(10):
-        contract.simple_computation()
-        results.append(contract._computation.get_gas_used())
 
-    with_comp = int(statistics.mean(results))
-    comp_cost = with_comp - baseline
+if __name__ == "__main__":
+    print("Measuring external call overhead in titanoboa...")
+    results = measure_call_overhead()
+    for build, rows in results.items():
+        gas_accounting.print_breakdown(build, rows)
 
-    print("simple_computation() - External function with computation:")
-    print(f"  avg: {with_comp}, computation cost: {comp_cost}")
     print()
-
     print("=" * 70)
-    print("RESULT: External call overhead in titanoboa")
+    print("HOW TO USE: compare the compute column, not total minus noop()")
     print("=" * 70)
-    print(f"Call overhead: {baseline} gas")
-    print()
-    print("HOW TO USE:")
-    print(f"  pure_computation_cost = titanoboa_total - {baseline}")
-    print()
-    print("EXAMPLE:")
-    print(f"  erfc (titanoboa): 1030 gas total")
-    print(f"  erfc (pure comp): 1030 - {baseline} = {1030 - baseline} gas")
-    print()
-    print("COMPARISON:")
-    print(f"  solgauss (Foundry): 688 gas (already pure computation)")
-    print(f"  vygauss (titanoboa): {1030 - baseline} gas (after subtracting overhead)")
-    print()
-
-    return baseline
-
-
-if __name__ == "__main__":
-    overhead = measure_call_overhead()
-
-    # Write the constant to a file so other scripts can use it
-    overhead_file = Path(__file__).parent / ".boa_call_overhead"
-    overhead_file.write_text(str(overhead))
-    print(f"Overhead value saved to {overhead_file}")
+    for build, rows in results.items():
+        erfc = rows['erfc']
+        overhead = erfc['total'] - erfc['compute']
+        print(f"  {build:<10} erfc: {erfc['total']:.0f} total, {overhead:.0f} dispatch + ABI, "
+              f"{erfc['compute']:.0f} compute vs solgauss {SOLGAUSS_ERFC}")
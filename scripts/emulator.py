@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Bit-exact Python emulator of src/gaussian_core.vy.
+
+Reproduces _sqrt, _ln_wad, _erfc_internal, _erfinv_internal and _erfcinv_internal, and the
+cdf and ppf externals of src/gaussian.vy, with the EVM semantics the Vyper code relies on:
+unsafe_* wrap to int256/uint256, >> on int256 is an arithmetic shift, unsafe_div truncates
+towards zero and returns 0 on division by zero. Checked operations and asserts raise Revert.
+
+Constants are parsed from src/gaussian_core.vy, so the emulator follows coefficient changes.
+
+The batch_* functions evaluate NumPy arrays of inputs at once (object dtype, so every element
+keeps exact 256-bit integer arithmetic). Like the *_batch contract functions, a batch raises
+Revert if any element reverts. NumPy is only needed for the batch functions.
+
+Usage: python3 scripts/emulator.py <function> <args...>
+"""
+
+import re
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CORE_PATH = Path(__file__).parent.parent / "src" / "gaussian_core.vy"
+
+INT256_MIN = -(2**255)
+INT256_MAX = 2**255 - 1
+UINT256_MAX = 2**256 - 1
+
+
+class Revert(Exception):
+    """The contract would revert, the message is the Vyper assert reason (empty for checks)."""
+
+
+def load_constants(path: Path = CORE_PATH) -> dict:
+    """`NAME: constant(type) = expr` lines of a Vyper source, evaluated in order."""
+    pattern = re.compile(r"^([A-Z][A-Z0-9_]*): constant\(u?int256\) = ([^#]+)")
+    constants = {}
+    for line in path.read_text().splitlines():
+        match = pattern.match(line)
+        if match:
+            constants[match.group(1)] = eval(match.group(2), {"__builtins__": {}}, constants)
+    return constants
+
+
+C = load_constants()
+POW = C["POW"]
+
+
+def _is_array(*values) -> bool:
+    return np is not None and any(isinstance(v, np.ndarray) for v in values)
+
+
+def _wrap(x):
+    """Reduce to int256 two's complement, as every unsafe_* on int256 does."""
+    return ((x + 2**255) & UINT256_MAX) - 2**255
+
+
+def _where(cond, a, b):
+    if _is_array(cond, a, b):
+        return np.where(cond, a, b).astype(object)
+    return a if cond else b
+
+
+def _mul(a, b):
+    return _wrap(a * b)
+
+
+def _add(a, b):
+    return _wrap(a + b)
+
+
+def _sub(a, b):
+    return _wrap(a - b)
+
+
+def _shl(a, n):
+    return _wrap(a << n)
+
+
+def _sdiv(a, b):
+    """EVM SDIV: truncate towards zero, x / 0 = 0, -2^255 / -1 = -2^255."""
+    if _is_array(a, b):
+        # np.where cannot take scalars beyond int64, only build it for array divisors
+        b_nonzero = np.where(b == 0, 1, b).astype(object) if _is_array(b) else (b or 1)
+        q = abs(a) // abs(b_nonzero)
+        q = np.where((a < 0) != (b_nonzero < 0), -q, q).astype(object)
+        return _wrap(np.where(b == 0, 0, q).astype(object))
+    if b == 0:
+        return 0
+    q = abs(a) // abs(b)
+    return _wrap(-q if (a < 0) != (b < 0) else q)
+
+
+def _to_uint256(x):
+    """convert(x, uint256) from int256, reverts on negative values."""
+    if (x < 0).any() if _is_array(x) else x < 0:
+        raise Revert("")
+    return x
+
+
+def _to_int256(x):
+    """convert(x, int256) from uint256, reverts above INT256_MAX."""
+    if (x > INT256_MAX).any() if _is_array(x) else x > INT256_MAX:
+        raise Revert("")
+    return x
+
+
+def _abs(x):
+    """(x ^ mask) - mask with a checked subtraction, reverts only for -2^255."""
+    if (x == INT256_MIN).any() if _is_array(x) else x == INT256_MIN:
+        raise Revert("")
+    return abs(x)
+
+
+def _rational(z, num, den):
+    """
+    num(z) / den(z) as written in gaussian_core.vy: both start with `unsafe_sub(z, C0)` and
+    continue with `unsafe_add/sub(unsafe_mul(acc, z) >> POW, Ci)`, signs folded into the constants.
+    """
+    p = _sub(z, num[0])
+    for c in num[1:]:
+        p = _add(_mul(p, z) >> POW, c)
+    q = _sub(z, den[0])
+    for c in den[1:]:
+        q = _add(_mul(q, z) >> POW, c)
+    return p, q
+
+
+ERFC_NUM = [C["ERFC_NUM_0"]] + [
+    s * C[f"ERFC_NUM_{i}"] for i, s in enumerate([1, -1, 1, -1, 1, 1, 1, -1, 1, -1], 1)
+]
+ERFC_DEN = [C["ERFC_DEN_0"], C["ERFC_DEN_1"], -C["ERFC_DEN_2"], C["ERFC_DEN_3"]]
+
+ERFINV1_NUM = [C["ERFINV1_NUM_0"]] + [
+    s * C[f"ERFINV1_NUM_{i}"] for i, s in enumerate([-1, 1, -1, -1, 1, -1, 1], 1)
+]
+ERFINV1_DEN = [C["ERFINV1_DEN_0"]] + [
+    s * C[f"ERFINV1_DEN_{i}"] for i, s in enumerate([1, 1, -1, -1, 1, -1], 1)
+]
+ERFINV2_NUM = [C["ERFINV2_NUM_0"], -C["ERFINV2_NUM_1"], C["ERFINV2_NUM_2"], -C["ERFINV2_NUM_3"]]
+ERFINV2_DEN = [C["ERFINV2_DEN_0"], C["ERFINV2_DEN_1"], -C["ERFINV2_DEN_2"], C["ERFINV2_DEN_3"]]
+
+
+def _erfc_body(z):
+    """_erfc_internal for 0 <= z < ERFC_UPPER, before the sign handling."""
+    num, denom = _rational(z, ERFC_NUM, ERFC_DEN)
+    return _to_uint256(_sdiv(_mul(C["ERFC_SCALE"], num), denom))
+
+
+def _erfinv_body_1(z):
+    num, denom = _rational(z, ERFINV1_NUM, ERFINV1_DEN)
+    return _sdiv(_mul(C["ERFINV1_SCALE"], num), denom)
+
+
+def _erfinv_body_2(z):
+    num, denom = _rational(z, ERFINV2_NUM, ERFINV2_DEN)
+    return _sdiv(_mul(C["ERFINV2_SCALE"], num), denom)
+
+
+def _erfinv_body_3(z):
+    """Tail of _erfinv_internal, branch-free so it runs on scalars and arrays alike."""
+    w = _sub(C["POW96_VAL"], z)
+    if (w <= 0).any() if _is_array(w) else w <= 0:
+        raise Revert("erfinv undefined")
+
+    # Solady bit scan on the uint256 w, w < 2^128 here
+    lz = _where(w > 2**64 - 1, 64, 0)
+    lz = lz | _where((w >> lz) > 2**32 - 1, 32, 0)
+    lz = lz | _where((w >> lz) > 2**16 - 1, 16, 0)
+    lz = lz | _where((w >> lz) > 2**8 - 1, 8, 0)
+    lz = lz ^ ((C["LN_LOOKUP"] >> (248 - 8 * ((C["LN_MAGIC"] >> (w >> lz)) & 31))) & 255)
+
+    m = _to_int256(((w << lz) & UINT256_MAX) >> 159)
+    k = _sub(lz, 158)
+    halve = m > C["SQRT2_96"]
+    m = _where(halve, m >> 1, m)
+    k = _where(halve, _sub(k, 1), k)
+
+    s = _sdiv(_shl(_sub(m, C["POW96_VAL"]), POW), _add(m, C["POW96_VAL"]))
+    s2 = _mul(s, s) >> POW
+    p = _add(_mul(C["ERFINV3_LN_0"], s2) >> POW, C["ERFINV3_LN_1"])
+    p = _add(_mul(p, s2) >> POW, C["ERFINV3_LN_2"])
+    p = _add(_mul(p, s2) >> POW, C["ERFINV3_LN_3"])
+    ln = _sub(_mul(k, C["LN2_96"]), _mul(s, p) >> POW)
+
+    r = _add(C["ERFINV3_SQRT_A"], _mul(C["ERFINV3_SQRT_B"], ln) >> POW)
+    ln = _shl(ln, POW)
+    for _ in range(3):
+        r = _add(r, _sdiv(ln, r)) >> 1
+    r = _sub(r, C["ERFINV3_R_OFFSET"])
+
+    num = _add(_mul(C["ERFINV3_NUM_0"], r) >> POW, C["ERFINV3_NUM_1"])
+    for i in range(2, 8):
+        num = _add(_mul(num, r) >> POW, C[f"ERFINV3_NUM_{i}"])
+    denom = _add(_mul(C["ERFINV3_DEN_0"], r) >> POW, C["ERFINV3_DEN_1"])
+    for i in range(2, 8):
+        denom = _add(_mul(denom, r) >> POW, C[f"ERFINV3_DEN_{i}"])
+
+    return _sdiv(_mul(num, C["ERFINV3_SCALE"]), denom)
+
+
+def sqrt(x: int) -> int:
+    """_sqrt: floor(sqrt(x)) for uint256 x."""
+    if x == 0:
+        return 0
+
+    r = 0
+    if x > 2**128 - 1:
+        r = 128
+    if (x >> r) > 2**64 - 1:
+        r += 64
+    if (x >> r) > 2**32 - 1:
+        r += 32
+    if (x >> r) > 2**16 - 1:
+        r += 16
+
+    z = 181 << (r >> 1)
+    z = ((z * ((x >> r) + 65536)) & UINT256_MAX) >> 18
+    for _ in range(7):
+        z = ((z + x // z) & UINT256_MAX) >> 1
+
+    if x // z < z:
+        z -= 1
+    return z
+
+
+def ln_wad(x: int) -> int:
+    """_ln_wad: ln(x) for WAD x > 0, WAD result."""
+    if x <= 0:
+        raise Revert("ln undefined")
+
+    r = 0
+    if x > 2**128 - 1:
+        r = 128
+    if (x >> r) > 2**64 - 1:
+        r |= 64
+    if (x >> r) > 2**32 - 1:
+        r |= 32
+    if (x >> r) > 2**16 - 1:
+        r |= 16
+    if (x >> r) > 2**8 - 1:
+        r |= 8
+    r ^= (C["LN_LOOKUP"] >> (248 - 8 * ((C["LN_MAGIC"] >> (x >> r)) & 31))) & 255
+
+    x_reduced = ((x << r) & UINT256_MAX) >> 159
+
+    p = _add(C["LN_P0"], x_reduced)
+    p = _add(_mul(p, x_reduced) >> 96, C["LN_P1"])
+    p = _add(_mul(p, x_reduced) >> 96, C["LN_P2"])
+    p = _sub(_mul(p, x_reduced) >> 96, C["LN_P3"])
+    p = _sub(_mul(p, x_reduced) >> 96, C["LN_P4"])
+    p = _sub(_mul(p, x_reduced) >> 96, C["LN_P5"])
+    p = _sub(_mul(p, x_reduced), C["LN_P6"] << 96)
+
+    q = _add(x_reduced, C["LN_Q0"])
+    for i in range(1, 7):
+        q = _add(_mul(x_reduced, q) >> 96, C[f"LN_Q{i}"])
+
+    p = _sdiv(p, q)
+    p = _mul(C["LN_SCALE"], p)
+    p = _add(p, _mul(C["LN_LN2_SCALE"], _sub(159, r)))
+    p = _add(p, C["LN_OFFSET"])
+    return p >> 174
+
+
+def erfc(x: int) -> int:
+    """_erfc_internal: input 2^96, output WAD."""
+    z = _abs(x)
+    y = _erfc_body(z) if z < C["ERFC_UPPER"] else 0
+    if x < 0:
+        y = (C["TWO"] - y) & UINT256_MAX
+    return y
+
+
+def erfinv(x: int) -> int:
+    """_erfinv_internal: input 2^96, output WAD."""
+    z = _abs(x)
+    if z < C["ERFINV_0_99"]:
+        y = _erfinv_body_1(z)
+    elif z < C["ERFINV_0_9999"]:
+        y = _erfinv_body_2(z)
+    else:
+        y = _erfinv_body_3(z)
+    return -y if x < 0 else y
+
+
+def erfcinv(x: int) -> int:
+    """_erfcinv_internal: input and output WAD."""
+    return erfinv(_sdiv(_shl(_sub(C["ONE_SIGNED"], x), POW), C["ONE_SIGNED"]))
+
+
+def cdf(x: int, u: int, o: int) -> int:
+    """gaussian.vy cdf, all values WAD."""
+    z = _sdiv(_mul(_sub(u, x), C["INV_SQRT2_96"]), _to_int256(o))
+    return erfc(z) >> 1
+
+
+def ppf(x: int, u: int, o: int) -> int:
+    """gaussian.vy ppf, all values WAD."""
+    erfcinv_val = erfcinv(_mul(2, x))
+    return _sub(u, _sdiv(_mul(_mul(o, C["SQRT2_WAD"]), erfcinv_val), C["ONE_SQUARED"]))
+
+
+def _as_array(xs):
+    if np is None:
+        raise ImportError("batch functions need numpy")
+    return np.array([int(x) for x in xs], dtype=object)
+
+
+def batch_erfc(xs):
+    """erfc of every element of xs, as an object array."""
+    x = _as_array(xs)
+    z = _abs(x)
+    y = np.zeros(len(x), dtype=object)
+    body = z < C["ERFC_UPPER"]
+    y[body] = _erfc_body(z[body])
+    return np.where(x < 0, (C["TWO"] - y) & UINT256_MAX, y).astype(object)
+
+
+def batch_erfinv(xs):
+    """erfinv of every element of xs, as an object array."""
+    x = _as_array(xs)
+    z = _abs(x)
+    y = np.zeros(len(x), dtype=object)
+    r1 = z < C["ERFINV_0_99"]
+    r2 = ~r1 & (z < C["ERFINV_0_9999"])
+    r3 = ~r1 & ~r2
+    y[r1] = _erfinv_body_1(z[r1])
+    y[r2] = _erfinv_body_2(z[r2])
+    if r3.any():
+        y[r3] = _erfinv_body_3(z[r3])
+    return np.where(x < 0, -y, y).astype(object)
+
+
+def batch_erfcinv(xs):
+    """erfcinv of every element of xs, as an object array."""
+    x = _as_array(xs)
+    return batch_erfinv(_sdiv(_shl(_sub(C["ONE_SIGNED"], x), POW), C["ONE_SIGNED"]))
+
+
+def batch_cdf(xs, u: int, o: int):
+    """cdf of every element of xs for one (u, o), as an object array."""
+    x = _as_array(xs)
+    z = _sdiv(_mul(_sub(u, x), C["INV_SQRT2_96"]), _to_int256(o))
+    return batch_erfc(z) >> 1
+
+
+def batch_ppf(xs, u: int, o: int):
+    """ppf of every element of xs for one (u, o), as an object array."""
+    x = _as_array(xs)
+    erfcinv_val = batch_erfcinv(_mul(2, x))
+    return _sub(u, _sdiv(_mul(_mul(o, C["SQRT2_WAD"]), erfcinv_val), C["ONE_SQUARED"]))
+
+
+FUNCTIONS = {
+    "erfc": erfc,
+    "erfinv": erfinv,
+    "erfcinv": erfcinv,
+    "cdf": cdf,
+    "ppf": ppf,
+    "ln_wad": ln_wad,
+    "sqrt": sqrt,
+}
+
+
+if __name__ == "__main__":
+    result = FUNCTIONS[sys.argv[1]](*(int(a, 0) for a in sys.argv[2:]))
+    print(f"0x{result & UINT256_MAX:064x}")
@@ -1,13 +1,6 @@
-from mpmath import erf, mpf, floor
 import sys
-
-
-def erfc(x):
-    return mpf(1) - erf(x)
+from oracle_server import call
 
 
 if __name__ == "__main__":
-    x = mpf(sys.argv[1]) / 10**18
-
-    _erfc = int(floor(erfc(x) * 10**18))
-    print(f"0x{_erfc:064x}")
+    print(call("erfc", sys.argv[1:2]))
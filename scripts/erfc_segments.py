@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Fit the piecewise erfc used by src/gaussian_segmented.vy.
+
+erfc(z) on [0, ERFC_UPPER) is split into 8 segments of width 0.5 (the last one
+runs to ERFC_UPPER). Each segment gets a near-minimax (Chebyshev) polynomial in
+t = z - center. Coefficients are WAD-scaled, and t is 2^96-scaled, so Horner
+steps of the form p = (p * t >> 96) + c produce erfc directly in WAD.
+
+Prints the Vyper constants and the max error of the quantized polynomials
+against mpmath on a dense grid.
+"""
+
+from mpmath import mp, mpf, erfc, chebyfit, nint
+
+mp.dps = 40
+
+POW96 = 2**96
+WAD = 10**18
+ERFC_UPPER = 321056282956553358679555000716
+
+# Target error of the real-valued fit, quantization adds ~1e-18 per Horner step
+FIT_TOLERANCE = 2e-9
+
+
+def segments() -> list:
+    """(start, end, center) of each segment, all 2^96-scaled."""
+    half = POW96 // 2
+    segs = [(i * half, (i + 1) * half, i * half + half // 2) for i in range(7)]
+    segs.append((7 * half, ERFC_UPPER, 7 * half + half // 2))
+    return segs
+
+
+def fit_segment(start: int, end: int, center: int) -> list:
+    """Lowest-degree polynomial within FIT_TOLERANCE, WAD coefficients, constant term first."""
+    c = mpf(center) / POW96
+    interval = [mpf(start) / POW96 - c, mpf(end) / POW96 - c]
+    for degree in range(3, 14):
+        poly, err = chebyfit(lambda t: erfc(c + t), interval, degree + 1, error=True)
+        if err < FIT_TOLERANCE:
+            break
+    return [int(nint(a * WAD)) for a in reversed(poly)]
+
+
+def evaluate(coeffs: list, t: int) -> int:
+    """Horner evaluation as done on-chain (arithmetic shift floors like the EVM's SAR)."""
+    p = coeffs[-1]
+    for c in reversed(coeffs[:-1]):
+        p = ((p * t) >> 96) + c
+    return p
+
+
+def max_error(start: int, end: int, center: int, coeffs: list, samples: int = 2000) -> float:
+    worst = 0
+    for i in range(samples + 1):
+        z = start + (end - 1 - start) * i // samples
+        expected = erfc(mpf(z) / POW96) * WAD
+        worst = max(worst, abs(evaluate(coeffs, z - center) - expected))
+    return float(worst / WAD)
+
+
+def main():
+    for n, (start, end, center) in enumerate(segments()):
+        coeffs = fit_segment(start, end, center)
+        err = max_error(start, end, center, coeffs)
+        print(f"# [{start / POW96:.4f}, {end / POW96:.4f}): degree {len(coeffs) - 1}, "
+              f"max error {err:.2e}")
+        print(f"ERFC_SEG{n}_MID: constant(int256) = {center}")
+        for i, c in enumerate(coeffs):
+            print(f"ERFC_SEG{n}_{i}: constant(int256) = {c}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
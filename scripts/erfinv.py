@@ -1,13 +1,6 @@
-from mpmath import erfinv, mpf, floor
 import sys
+from oracle_server import call
 
 
 if __name__ == "__main__":
-    x = mpf(sys.argv[1]) / 10**18
-    try:
-        _erfinv = int(floor(erfinv(x) * 10**18))
-    except:
-        _erfinv = 0
-    if _erfinv < 0:
-        _erfinv = (1 << 256) + _erfinv
-    print(f"0x{_erfinv:064x}")
+    print(call("erfinv", sys.argv[1:2]))
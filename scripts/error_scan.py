@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Exhaustive error scan of gaussian.vy.
+
+Sweeps erfc, erfinv, erfcinv, cdf, ppf and _ln_wad over named regions. Each function has
+dense windows around every branch boundary (ERFC_UPPER, ERFINV_0_99, ERFINV_0_9999, zero,
+the powers of two of _ln_wad's bit scan) plus linear sweeps of the bodies and log-spaced
+tails. Contract outputs come from the bit-exact emulator (scripts/emulator.py) and are
+compared with mpmath (reference_tables.reference).
+
+Regions are cut into shards and scanned on a process pool. A shard returns only running
+statistics, and shard results are streamed to <out>.shards.jsonl as they finish, so memory
+stays flat for any number of points. Gas per region is measured through titanoboa on an
+evenly spaced sample of the same inputs.
+
+Writes a JSON report with max/mean absolute error, the worst input and the gas range per
+region, and prints it as a table.
+
+Usage: python3 scripts/error_scan.py [--scale S] [--workers N] [--functions F ...] [--venom]
+       [--dps DPS] [--shard-size N] [--gas-samples N] [--out PATH]
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+from dataclasses import asdict, dataclass
+from multiprocessing import Pool
+from pathlib import Path
+
+from mpmath import mp, mpf
+
+import emulator
+from emulator import C, Revert
+from reference_tables import reference
+
+WAD = 10**18
+POW96 = 2**96
+INT256_MAX = 2**255 - 1
+
+# Half width of the dense windows around branch boundaries: 2^-40 in 2^96 scaling
+WINDOW_96 = 2**56
+WINDOW_WAD = 10**6
+
+# Input that gives z = ERFC_UPPER in cdf(x, 0, WAD): x = ERFC_UPPER * sqrt(2) in WAD
+CDF_CUTOFF = C["ERFC_UPPER"] * C["SQRT2_WAD"] // POW96
+
+# Exposes the gaussian_core internal without an external in gaussian.vy
+HARNESS = """
+import gaussian_core
+
+@external
+@pure
+def ln_wad(x: int256) -> int256:
+    return gaussian_core._ln_wad(x)
+"""
+
+
+@dataclass(frozen=True)
+class Region:
+    """
+    n inputs of one function.
+    linear: a + (b - a) * i / (n - 1)
+    log: a + sign * b^(i / (n - 1)), offsets from 1 to b
+    pow2: 2^k + d for k in [0, 255) and |d| <= a, n = 255 * (2a + 1)
+    """
+    function: str
+    name: str
+    kind: str
+    a: int
+    b: int
+    n: int
+    sign: int = 1
+    u: int = 0
+    o: int = WAD
+
+    def point(self, i: int) -> int:
+        if self.kind == "linear":
+            return self.a + (self.b - self.a) * i // max(self.n - 1, 1)
+        if self.kind == "log":
+            offset = round(math.exp(math.log(self.b) * i / max(self.n - 1, 1)))
+            # The float rounds a span of 2^255 - 1 up to 2^255, past int256
+            return min(self.a + self.sign * offset, INT256_MAX)
+        if self.kind == "pow2":
+            width = 2 * self.a + 1
+            return max(2 ** (i // width) + i % width - self.a, 1)
+        raise ValueError(f"unknown region kind {self.kind}")
+
+
+def linear(function: str, name: str, start: int, stop: int, n: int, **kwargs) -> Region:
+    return Region(function, name, "linear", start, stop, n, **kwargs)
+
+
+def log_spaced(function: str, name: str, anchor: int, span: int, n: int, sign: int = 1,
+               **kwargs) -> Region:
+    return Region(function, name, "log", anchor, span, n, sign, **kwargs)
+
+
+def regions(scale: float) -> list:
+    """Every scanned region, point counts multiplied by scale."""
+    def n(count: int) -> int:
+        return max(int(count * scale), 2)
+
+    upper = C["ERFC_UPPER"]
+    b1 = C["ERFINV_0_99"]
+    b2 = C["ERFINV_0_9999"]
+    return [
+        linear("erfc", "body [0, ERFC_UPPER)", 0, upper - 1, n(400_000)),
+        linear("erfc", "body (-ERFC_UPPER, 0)", -(upper - 1), -1, n(200_000)),
+        linear("erfc", "0 +- 2^-40", -WINDOW_96, WINDOW_96, n(50_000)),
+        linear("erfc", "ERFC_UPPER +- 2^-40", upper - WINDOW_96, upper + WINDOW_96, n(100_000)),
+        linear("erfc", "-ERFC_UPPER +- 2^-40", -upper - WINDOW_96, -upper + WINDOW_96,
+               n(50_000)),
+        log_spaced("erfc", "beyond ERFC_UPPER (log)", upper, 2**100, n(100_000)),
+        linear("erfinv", "range 1 [0, ERFINV_0_99)", 0, b1 - 1, n(300_000)),
+        linear("erfinv", "range 1 negative", -(b1 - 1), 0, n(100_000)),
+        linear("erfinv", "ERFINV_0_99 +- 2^-40", b1 - WINDOW_96, b1 + WINDOW_96, n(100_000)),
+        linear("erfinv", "range 2 [ERFINV_0_99, ERFINV_0_9999)", b1, b2 - 1, n(200_000)),
+        linear("erfinv", "ERFINV_0_9999 +- 2^-40", b2 - WINDOW_96, b2 + WINDOW_96, n(100_000)),
+        linear("erfinv", "range 3 [ERFINV_0_9999, 1)", b2, POW96 - 1, n(200_000)),
+        log_spaced("erfinv", "range 3 tail, 1 - x log-spaced", POW96, POW96 - b2, n(200_000),
+                   sign=-1),
+        linear("erfcinv", "body (0, 2)", 1, 2 * WAD - 1, n(300_000)),
+        log_spaced("erfcinv", "x -> 0 (log)", 0, 10**16, n(100_000)),
+        log_spaced("erfcinv", "x -> 2 (log)", 2 * WAD, 10**16, n(100_000), sign=-1),
+        linear("cdf", "body [-6, 6] (u=0, o=1)", -6 * WAD, 6 * WAD, n(400_000)),
+        linear("cdf", "cutoff +- 1e-12", CDF_CUTOFF - WINDOW_WAD, CDF_CUTOFF + WINDOW_WAD,
+               n(50_000)),
+        linear("cdf", "-cutoff +- 1e-12", -CDF_CUTOFF - WINDOW_WAD, -CDF_CUTOFF + WINDOW_WAD,
+               n(50_000)),
+        log_spaced("cdf", "x -> -inf (log)", -CDF_CUTOFF, 10**30, n(50_000), sign=-1),
+        linear("ppf", "body (0, 1) (u=0, o=1)", 1, WAD - 1, n(400_000)),
+        log_spaced("ppf", "p -> 0 (log)", 0, 10**16, n(200_000)),
+        log_spaced("ppf", "p -> 1 (log)", WAD, 10**16, n(200_000), sign=-1),
+        log_spaced("ln_wad", "full range (log)", 0, 2**255 - 1, n(200_000)),
+        linear("ln_wad", "1 +- 1e-6", WAD - 10**12, WAD + 10**12, n(100_000)),
+        Region("ln_wad", "bit scan 2^k +- d", "pow2", max(int(64 * scale), 1), 0,
+               255 * (2 * max(int(64 * scale), 1) + 1)),
+    ]
+
+
+def evaluate(region: Region, xs: list) -> list:
+    """Emulator outputs for xs, None where the contract reverts."""
+    batch = {
+        "erfc": emulator.batch_erfc,
+        "erfinv": emulator.batch_erfinv,
+        "erfcinv": emulator.batch_erfcinv,
+        "cdf": lambda v: emulator.batch_cdf(v, region.u, region.o),
+        "ppf": lambda v: emulator.batch_ppf(v, region.u, region.o),
+    }.get(region.function)
+    if batch is not None:
+        try:
+            return [int(y) for y in batch(xs)]
+        except Revert:
+            pass
+
+    scalar = emulator.FUNCTIONS[region.function]
+    args = (region.u, region.o) if region.function in ("cdf", "ppf") else ()
+    ys = []
+    for x in xs:
+        try:
+            ys.append(scalar(x, *args))
+        except Revert:
+            ys.append(None)
+    return ys
+
+
+def scan_shard(task: tuple) -> dict:
+    """Error statistics of region points [start, stop)."""
+    region_index, region, start, stop, dps = task
+    mp.dps = dps
+    xs = [region.point(i) for i in range(start, stop)]
+    stats = {"region": region_index, "points": 0, "reverts": 0, "max": 0.0, "sum": 0.0,
+             "worst_input": None}
+    for x, y in zip(xs, evaluate(region, xs)):
+        if y is None:
+            stats["reverts"] += 1
+            continue
+        # Outputs are WAD, so the error is in units of the function value
+        error = float(abs(mpf(y) - reference(region.function, x, region.u, region.o) * WAD)) / WAD
+        stats["points"] += 1
+        stats["sum"] += error
+        if error > stats["max"] or stats["worst_input"] is None:
+            stats["max"] = error
+            stats["worst_input"] = str(x)
+    return stats
+
+
+def measure_gas(region: Region, gaussian, harness, samples: int) -> tuple:
+    """
+    (min, max, reverts) gas of the contract call over `samples` evenly spaced region inputs.
+    Inputs where the contract reverts are counted and left out of the range.
+    """
+    from boa import BoaError
+
+    gas = []
+    reverts = 0
+    for j in range(samples):
+        x = region.point(j * (region.n - 1) // max(samples - 1, 1))
+        try:
+            if region.function == "ln_wad":
+                harness.ln_wad(x)
+                gas.append(harness._computation.get_gas_used())
+            elif region.function in ("cdf", "ppf"):
+                getattr(gaussian, region.function)(x, region.u, region.o)
+                gas.append(gaussian._computation.get_gas_used())
+            else:
+                getattr(gaussian, region.function)(x)
+                gas.append(gaussian._computation.get_gas_used())
+        except BoaError:
+            reverts += 1
+    if not gas:
+        return None, None, reverts
+    return min(gas), max(gas), reverts
+
+
+def print_report(rows: list) -> None:
+    print("\n| Function | Region                                  |    Points |  Max error | "
+          "Mean error | Worst input                      | Gas range   |")
+    print("|----------|-----------------------------------------|-----------|------------|"
+          "------------|----------------------------------|-------------|")
+    for r in rows:
+        gas = f"{r['gas_min']}-{r['gas_max']}" if r['gas_min'] is not None else "-"
+        print(f"| {r['function']:8} | {r['region'][:39]:39} | {r['points']:9} | "
+              f"{r['max_abs_error']:10.3e} | {r['mean_abs_error']:10.3e} | "
+              f"{str(r['worst_input'])[:32]:32} | {gas:11} |")
+    skipped = [r for r in rows if r["gas_reverts"]]
+    if skipped:
+        print("\nGas samples left out because the call reverted:")
+        for r in skipped:
+            print(f"  {r['function']} {r['region']}: {r['gas_reverts']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan gaussian.vy errors per input region")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiplier on the points per region (1.0 is ~4.5M points)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--functions", nargs="*", default=None)
+    parser.add_argument("--venom", action="store_true", help="measure gas on the Venom build")
+    parser.add_argument("--dps", type=int, default=40)
+    parser.add_argument("--shard-size", type=int, default=2000)
+    parser.add_argument("--gas-samples", type=int, default=32)
+    parser.add_argument("--out", type=Path, default=Path("error_scan_report.json"))
+    args = parser.parse_args()
+
+    scan = [r for r in regions(args.scale) if not args.functions or r.function in args.functions]
+    tasks = [
+        (i, region, start, min(start + args.shard_size, region.n), args.dps)
+        for i, region in enumerate(scan)
+        for start in range(0, region.n, args.shard_size)
+    ]
+    total = sum(r.n for r in scan)
+    print(f"Scanning {total} points in {len(scan)} regions, {len(tasks)} shards, "
+          f"{args.workers} workers")
+
+    merged = [{"points": 0, "reverts": 0, "max": 0.0, "sum": 0.0, "worst_input": None}
+              for _ in scan]
+    started = time.time()
+    shards_path = args.out.with_suffix(".shards.jsonl")
+    with open(shards_path, "w") as shards, Pool(args.workers) as pool:
+        for done, stats in enumerate(pool.imap_unordered(scan_shard, tasks), 1):
+            shards.write(json.dumps(stats) + "\n")
+            m = merged[stats["region"]]
+            m["points"] += stats["points"]
+            m["reverts"] += stats["reverts"]
+            m["sum"] += stats["sum"]
+            if stats["worst_input"] is not None and (m["worst_input"] is None
+                                                     or stats["max"] > m["max"]):
+                m["max"] = stats["max"]
+                m["worst_input"] = stats["worst_input"]
+            if done % max(len(tasks) // 20, 1) == 0:
+                print(f"  {done}/{len(tasks)} shards, {time.time() - started:.0f}s")
+
+    import compile_cache
+
+    src = Path(__file__).parent.parent / "src"
+    gaussian = compile_cache.load(src / "gaussian.vy", experimental_codegen=args.venom)
+    harness = compile_cache.loads(HARNESS, filename=src / "error_scan_harness.vy",
+                                  experimental_codegen=args.venom)
+
+    rows = []
+    for region, m in zip(scan, merged):
+        gas_min, gas_max, gas_reverts = measure_gas(region, gaussian, harness, args.gas_samples)
+        rows.append({
+            "function": region.function,
+            "region": region.name,
+            "spec": asdict(region),
+            "points": m["points"],
+            "reverts": m["reverts"],
+            "max_abs_error": m["max"],
+            "mean_abs_error": m["sum"] / m["points"] if m["points"] else 0.0,
+            "worst_input": m["worst_input"],
+            "gas_min": gas_min,
+            "gas_max": gas_max,
+            "gas_reverts": gas_reverts,
+        })
+
+    report = {
+        "settings": {**vars(args), "out": str(args.out), "points": total,
+                     "seconds": round(time.time() - started, 1)},
+        "regions": rows,
+    }
+    args.out.write_text(json.dumps(report, indent=2, default=str))
+    print_report(rows)
+    print(f"\nReport: {args.out}, shard stats: {shards_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Trace-derived gas accounting of external calls.
+
+Splits the execution gas of a call into selector dispatch, ABI decoding, computation and ABI
+encoding from the opcode trace and titanoboa's per-PC gas (the profiling gas meter):
+
+    dispatch    everything up to the jump into the function: selector matching, the
+                calldatasize and callvalue checks. Ends at the last JUMPI before the first
+                argument read (or, without arguments, before the first body instruction).
+    abi_decode  calldata reads of the arguments: every CALLDATALOAD / CALLDATACOPY after the
+                selector read, with the PUSH of its offset, wherever it happens: Venom may
+                load an argument only once the epilogue needs it. Length checks of dynamic
+                arrays are left in compute.
+    abi_encode  the epilogue after the last instruction the source map attributes to the
+                function body or an internal function: storing the return value and RETURN.
+                The standard build writes the result in place, Venom stores it into fresh
+                memory and pays its expansion here.
+    compute     the rest, i.e. the function body and every internal call.
+
+This replaces subtracting a constant noop() call overhead: dispatch depends on the build
+(standard or Venom), the number of externals and the selector's position, and differs per
+function. Summed, the four parts equal the execution gas of the call.
+
+Usage: python3 scripts/gas_accounting.py [--builds B ...]
+"""
+
+import argparse
+import statistics
+from contextlib import contextmanager
+
+import boa
+from boa.vm.gas_meters import ProfilingGasMeter
+from vyper import ast as vy_ast
+from vyper.evm.opcodes import get_opcodes
+
+CATEGORIES = ('dispatch', 'abi_decode', 'compute', 'abi_encode')
+
+# Opcode byte: mnemonic
+OPCODES = {value[0]: name for name, value in get_opcodes().items()}
+CALLDATA_READS = {'CALLDATALOAD', 'CALLDATACOPY'}
+
+
+@contextmanager
+def profiling():
+    """Record gas per PC for calls made inside the block."""
+    previous = boa.env.get_gas_meter_class()
+    boa.env.set_gas_meter_class(ProfilingGasMeter)
+    try:
+        yield
+    finally:
+        boa.env.set_gas_meter_class(previous)
+
+
+def _is_push(name: str | None) -> bool:
+    return name is not None and name.startswith("PUSH")
+
+
+def _in_body(node) -> bool:
+    """Source map node inside a function body, not the external's signature or return."""
+    if node is None or isinstance(node, (vy_ast.FunctionDef, vy_ast.arguments, vy_ast.arg)):
+        return False
+    fn = node.get_ancestor(vy_ast.FunctionDef)
+    if fn is None:
+        return False
+    external = any(getattr(d, "id", None) == "external" for d in fn.decorator_list)
+    return not (external and isinstance(node, vy_ast.Return))
+
+
+def classify_steps(trace: list, code: bytes, source_map: dict) -> list:
+    """Category of every step of `trace` (a list of PCs)."""
+    names = [OPCODES.get(code[pc]) if pc < len(code) else None for pc in trace]
+    body = [i for i, pc in enumerate(trace) if _in_body(source_map.get(pc))]
+    reads = [i for i, name in enumerate(names) if name in CALLDATA_READS]
+
+    # The first calldata read is the selector, the next one the first argument. Venom's source
+    # map can attribute a dispatcher jump target to the body, so a JUMPDEST does not enter it
+    first_body = [i for i in body if names[i] != "JUMPDEST"][:1]
+    entry_candidates = first_body + reads[1:2]
+    entry = min(entry_candidates) if entry_candidates else len(trace)
+    jumps = [i for i in range(entry) if names[i] == "JUMPI"]
+    dispatch_end = jumps[-1] + 1 if jumps else 0
+    epilogue = body[-1] + 1 if body else len(trace)
+
+    steps = ['compute'] * len(trace)
+    for i in range(len(trace)):
+        if i < dispatch_end:
+            steps[i] = 'dispatch'
+        elif i >= epilogue:
+            steps[i] = 'abi_encode'
+    for i in reads[1:]:
+        if i >= dispatch_end:
+            steps[i] = 'abi_decode'
+            if i > 0 and _is_push(names[i - 1]) and steps[i - 1] != 'dispatch':
+                steps[i - 1] = 'abi_decode'
+    return steps
+
+
+def breakdown(contract) -> dict:
+    """{category: gas} of the contract's last call, which must have run under profiling()."""
+    computation = contract._computation
+    meter = computation._gas_meter
+    if not isinstance(meter, ProfilingGasMeter):
+        raise RuntimeError("call the contract inside gas_accounting.profiling()")
+
+    trace = computation.code._trace
+    # Venom's runtime can differ from compiler_data.bytecode_runtime, read the executed code
+    code = computation.code._raw_code_bytes
+    steps = classify_steps(trace, code, contract.source_map["pc_raw_ast_map"])
+
+    # Gas is recorded per PC, so a PC is charged to the category of its first execution
+    category_of = {}
+    for pc, category in zip(trace, steps):
+        category_of.setdefault(pc, category)
+    result = dict.fromkeys(CATEGORIES, 0)
+    for pc, gas in meter._gas_used_of.items():
+        result[category_of.get(pc, 'compute')] += gas
+    return result
+
+
+def account(contract, function: str, inputs: list) -> dict:
+    """Mean gas per category (and 'total') over calls of `function` with each args tuple."""
+    fn = getattr(contract, function)
+    rows = []
+    with profiling():
+        for args in inputs:
+            fn(*args)
+            row = breakdown(contract)
+            row['total'] = contract._computation.get_gas_used()
+            rows.append(row)
+    return {key: round(statistics.mean(r[key] for r in rows), 1) for key in (*CATEGORIES, 'total')}
+
+
+def print_breakdown(build: str, results: dict) -> None:
+    print(f"\n{build}")
+    print(f"| {'Function':<12} | {'total':>7} | {'dispatch':>8} | {'decode':>7} | {'compute':>8} "
+          f"| {'encode':>7} |")
+    print(f"|{'-' * 14}|{'-' * 9}|{'-' * 10}|{'-' * 9}|{'-' * 10}|{'-' * 9}|")
+    for function, r in results.items():
+        print(f"| {function:<12} | {r['total']:>7.0f} | {r['dispatch']:>8.0f} | "
+              f"{r['abi_decode']:>7.0f} | {r['compute']:>8.0f} | {r['abi_encode']:>7.0f} |")
+
+
+def main():
+    from gas_benchmark import BENCHMARK_INPUTS, BUILDS, load_gaussian
+
+    parser = argparse.ArgumentParser(description="Dispatch / ABI / compute gas per function")
+    parser.add_argument("--builds", nargs="*", default=list(BUILDS), choices=list(BUILDS))
+    args = parser.parse_args()
+
+    for build in args.builds:
+        contract, experimental_codegen = BUILDS[build]
+        gaussian = load_gaussian(experimental_codegen, contract)
+        results = {
+            function: account(gaussian, function, inputs)
+            for function, inputs in BENCHMARK_INPUTS.items()
+        }
+        print_breakdown(build, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,18 @@ Gas benchmark for vygauss.
 
 Compares standard Vyper vs Venom compiler vs solgauss (Solidity) baseline.
 
-titanoboa measures external calls (~118 gas overhead). Subtract this from
-results before comparing with Foundry. See compute_boa_call_overhead.py.
+titanoboa measures external calls, including selector dispatch and ABI decoding and
+encoding. Foundry measures library functions. The solgauss comparison uses the computation
+gas of each call, split from the rest by opcode trace per build (see gas_accounting.py).
 """
 
+import argparse
 import boa
+import compile_cache
+import gas_accounting
+import json
+from eth_abi import encode
+from mpmath import mp, erfc, exp, log, mpf, sqrt
 from pathlib import Path
 import statistics
 
@@ -24,195 +31,560 @@ SOLGAUSS_BASELINE = {
     'ppf': 2001,
 }
 
-# External call overhead in titanoboa (measured constant)
-# To get pure computation cost: total_gas - CALL_OVERHEAD
-CALL_OVERHEAD = 118
+# Builds compared for bytecode size and deployment cost: (source in src/, experimental codegen)
+# gaussian_compact.vy sets optimize codesize and Venom with pragmas
+BUILDS = {
+    'standard': ("gaussian.vy", False),
+    'venom': ("gaussian.vy", True),
+    'codesize': ("gaussian_compact.vy", True),
+}
+
+# Vyper optimization levels crossed with both codegens in benchmark_matrix
+OPTIMIZE_MODES = ('gas', 'codesize', 'none')
+
+# Batch sizes for the *_batch functions (MAX_BATCH in gaussian.vy is 128)
+BATCH_SIZES = [1, 8, 32, 128]
+
+
+def tx_intrinsic_gas(data: bytes, create: bool = False) -> int:
+    """Gas charged before execution: base, calldata and, for deployments, CREATE and initcode."""
+    gas = 21000 + sum(16 if b else 4 for b in data)
+    if create:
+        gas += 32000 + 2 * ((len(data) + 31) // 32)
+    return gas
 
 
 def to_x96(x_wad: int) -> int:
     return (x_wad << 96) // WAD
 
 
-def benchmark_gaussian(experimental_codegen: bool = False):
+# Inputs of benchmark_gaussian
+
+# erfc
+ERFC_INPUTS = [
+    to_x96(0),
+    to_x96(WAD // 10),
+    to_x96(WAD // 2),
+    to_x96(WAD),
+    to_x96(2 * WAD),
+    to_x96(3 * WAD),
+    to_x96(4 * WAD),
+    to_x96(-WAD // 10),
+    to_x96(-WAD),
+    to_x96(-2 * WAD),
+]
+
+# erfinv range 1
+ERFINV_R1_INPUTS = [
+    to_x96(0),
+    to_x96(WAD // 10),
+    to_x96(WAD // 2),
+    to_x96(int(0.9 * WAD)),
+    to_x96(int(0.95 * WAD)),
+    to_x96(-WAD // 2),
+]
+
+# erfinv range 2
+ERFINV_R2_INPUTS = [
+    to_x96(int(0.97 * WAD)),
+    to_x96(int(0.98 * WAD)),
+    to_x96(int(-0.97 * WAD)),
+    to_x96(int(-0.98 * WAD)),
+]
+
+# erfinv range 3
+ERFINV_R3_INPUTS = [
+    to_x96(int(0.99 * WAD)),
+    to_x96(int(0.995 * WAD)),
+    to_x96(int(0.999 * WAD)),
+    to_x96(int(0.9999 * WAD)),
+    to_x96(int(-0.99 * WAD)),
+]
+
+# erfcinv
+ERFCINV_INPUTS = [
+    WAD,
+    WAD + WAD // 10,
+    WAD // 2,
+    3 * WAD // 2,
+    int(0.01 * WAD),
+    int(0.1 * WAD),
+    int(1.9 * WAD),
+]
+
+# cdf
+CDF_INPUTS = [
+    (0, 0, WAD),
+    (WAD, 0, WAD),
+    (-WAD, 0, WAD),
+    (2 * WAD, WAD, WAD),
+    (0, -WAD, 2 * WAD),
+    (3 * WAD, 0, WAD),
+    (-3 * WAD, 0, WAD),
+]
+
+# log_cdf, also past ERFC_UPPER where cdf rounds to 0
+LOG_CDF_INPUTS = CDF_INPUTS + [
+    (-6 * WAD, 0, WAD),
+    (-10 * WAD, 0, WAD),
+    (-40 * WAD, 0, WAD),
+]
+
+# log_sf(x, u, o) = log_cdf(2u - x, u, o), the same standardized arguments mirrored
+LOG_SF_INPUTS = [(2 * u - x, u, o) for x, u, o in LOG_CDF_INPUTS]
+
+# ppf
+PPF_INPUTS = [
+    (WAD // 4, 0, WAD),
+    (WAD // 2, 0, WAD),
+    (3 * WAD // 4, 0, WAD),
+    (int(0.1 * WAD), 0, WAD),
+    (int(0.9 * WAD), 0, WAD),
+    (int(0.01 * WAD), 0, WAD),
+    (int(0.99 * WAD), 0, WAD),
+]
+
+# Args per external for the trace-derived breakdown (gas_accounting), same inputs as above
+BENCHMARK_INPUTS = {
+    'erfc': [(x,) for x in ERFC_INPUTS],
+    'erfinv': [(x,) for x in ERFINV_R1_INPUTS + ERFINV_R2_INPUTS + ERFINV_R3_INPUTS],
+    'erfcinv': [(x,) for x in ERFCINV_INPUTS],
+    'cdf': CDF_INPUTS,
+    'pdf': CDF_INPUTS,
+    'ppf': PPF_INPUTS,
+    'log_cdf': LOG_CDF_INPUTS,
+    'log_sf': LOG_SF_INPUTS,
+    'erfc_fast': [(x,) for x in ERFC_INPUTS],
+    'cdf_fast': CDF_INPUTS,
+    'ppf_fast': PPF_INPUTS,
+}
+
+# Rows of benchmark_gaussian: (result label, external, args per call). The fast tier takes
+# the same inputs as the full-precision functions
+GAUSSIAN_BENCHMARKS = [
+    ('erfc', 'erfc', BENCHMARK_INPUTS['erfc']),
+    ('erfinv_r1', 'erfinv', [(x,) for x in ERFINV_R1_INPUTS]),
+    ('erfinv_r2', 'erfinv', [(x,) for x in ERFINV_R2_INPUTS]),
+    ('erfinv_r3', 'erfinv', [(x,) for x in ERFINV_R3_INPUTS]),
+    ('erfinv_all', 'erfinv', BENCHMARK_INPUTS['erfinv']),
+    ('erfcinv', 'erfcinv', BENCHMARK_INPUTS['erfcinv']),
+    ('cdf', 'cdf', CDF_INPUTS),
+    ('pdf', 'pdf', CDF_INPUTS),
+    ('cdf_pdf', 'cdf_pdf', CDF_INPUTS),
+    ('ppf', 'ppf', PPF_INPUTS),
+    ('log_cdf', 'log_cdf', LOG_CDF_INPUTS),
+    ('log_sf', 'log_sf', LOG_SF_INPUTS),
+    ('erfc_fast', 'erfc_fast', BENCHMARK_INPUTS['erfc']),
+    ('cdf_fast', 'cdf_fast', CDF_INPUTS),
+    ('ppf_fast', 'ppf_fast', PPF_INPUTS),
+]
+
+# Fast tier externals of gaussian.vy: full-precision function -> (fast external, error bound)
+FAST_TIER = {
+    'erfc': ('erfc_fast', "2e-6"),
+    'cdf': ('cdf_fast', "1e-6"),
+    'ppf': ('ppf_fast', "1e-6 * o"),
+}
+
+
+def black_scholes_reference(s: int, k: int, t: int, v: int, r: int) -> tuple:
+    """(call, put) in WAD from mpmath at 50 digits."""
+    mp.dps = 50
+    s_f, k_f, t_f, v_f, r_f = (mpf(a) / WAD for a in (s, k, t, v, r))
+    d1 = (log(s_f / k_f) + (r_f + v_f**2 / 2) * t_f) / (v_f * sqrt(t_f))
+    d2 = d1 - v_f * sqrt(t_f)
+    strike_pv = k_f * exp(-r_f * t_f)
+    call = s_f * erfc(-d1 / sqrt(2)) / 2 - strike_pv * erfc(-d2 / sqrt(2)) / 2
+    return int(call * WAD), int((call - s_f + strike_pv) * WAD)
+
+
+def load_gaussian(experimental_codegen: bool = False, contract: str = "gaussian.vy",
+                  optimize: str | None = None):
+    """Deploy gaussian.vy (or another build of it) with optional Venom compiler."""
+    contract_path = Path(__file__).parent.parent / "src" / contract
+
+    # Load from the path so `import gaussian_core` resolves, optional experimental codegen (Venom)
+    # optimize None leaves the level to the source's pragma (gas when there is none)
+    return compile_cache.load(contract_path, experimental_codegen=experimental_codegen,
+                              optimize=optimize)
+
+
+def stats(gas_list: list) -> dict:
+    """min / max / avg / median of a list of per-call gas figures."""
+    return {
+        'min': min(gas_list),
+        'max': max(gas_list),
+        'avg': int(statistics.mean(gas_list)),
+        'median': int(statistics.median(gas_list)),
+    }
+
+
+def benchmark_gaussian(experimental_codegen: bool = False, contract: str = "gaussian.vy",
+                       optimize: str | None = None):
     """Benchmark vygauss with optional Venom compiler."""
-    contract_path = Path(__file__).parent.parent / "src" / "gaussian.vy"
-    source = contract_path.read_text()
-
-    # Load with optional experimental codegen (Venom)
-    gaussian = boa.loads(
-        source,
-        name="gaussian_benchmark",
-        compiler_args={'experimental_codegen': experimental_codegen}
-    )
+    gaussian = load_gaussian(experimental_codegen, contract, optimize)
 
     results = {}
+    for label, function, inputs in GAUSSIAN_BENCHMARKS:
+        fn = getattr(gaussian, function)
+        gas_data = []
+        for args in inputs:
+            fn(*args)
+            gas_data.append(gaussian._computation.get_gas_used())
+        results[label] = stats(gas_data)
 
-    # erfc
-    erfc_inputs = [
-        to_x96(0),
-        to_x96(WAD // 10),
-        to_x96(WAD // 2),
-        to_x96(WAD),
-        to_x96(2 * WAD),
-        to_x96(3 * WAD),
-        to_x96(4 * WAD),
-        to_x96(-WAD // 10),
-        to_x96(-WAD),
-        to_x96(-2 * WAD),
+    return results
+
+
+def benchmark_black_scholes(experimental_codegen: bool = False):
+    """Gas of black_scholes.vy and max error against mpmath, relative to max(spot, strike)."""
+    contract_path = Path(__file__).parent.parent / "src" / "black_scholes.vy"
+    bs = compile_cache.load(contract_path, experimental_codegen=experimental_codegen)
+
+    # (spot, strike, time, volatility, rate)
+    bs_inputs = [
+        (100 * WAD, 100 * WAD, WAD, WAD // 5, WAD // 20),
+        (100 * WAD, 80 * WAD, WAD // 2, 3 * WAD // 10, 0),
+        (100 * WAD, 150 * WAD, 2 * WAD, WAD // 2, WAD // 10),
+        (2000 * WAD, 2500 * WAD, WAD // 12, 8 * WAD // 10, -WAD // 100),
+        (WAD, WAD, WAD // 365, WAD // 10, 0),
     ]
 
-    gas_data = []
-    for x in erfc_inputs:
-        gaussian.erfc(x)
-        gas_data.append(gaussian._computation.get_gas_used())
-    results['erfc'] = {
-        'min': min(gas_data),
-        'max': max(gas_data),
-        'avg': int(statistics.mean(gas_data)),
-        'median': int(statistics.median(gas_data)),
+    results = {}
+    for func in ['bs_call', 'bs_put', 'bs_call_put', 'bs_call_put_greeks']:
+        gas_data = []
+        max_error = 0
+        for args in bs_inputs:
+            out = getattr(bs, func)(*args)
+            gas_data.append(bs._computation.get_gas_used())
+
+            call, put = black_scholes_reference(*args)
+            if func == 'bs_call':
+                errors = [out - call]
+            elif func == 'bs_put':
+                errors = [out - put]
+            else:
+                errors = [out[0] - call, out[1] - put]
+            notional = max(args[0], args[1])
+            max_error = max(max_error, *(abs(e) / notional for e in errors))
+
+        results[func] = {**stats(gas_data), 'max_error': max_error}
+
+    return results
+
+
+def print_black_scholes_results(standard: dict, venom: dict) -> None:
+    """Print Black-Scholes gas (avg total) and max error against mpmath."""
+    print("\n| Function           | Std avg | Venom avg | max error / notional |")
+    print("|--------------------|---------|-----------|----------------------|")
+
+    for func in standard:
+        print(f"| {func:18} | {standard[func]['avg']:7} | {venom[func]['avg']:9} | "
+              f"{standard[func]['max_error']:20.1e} |")
+
+
+def benchmark_batch(experimental_codegen: bool = False):
+    """Per-element gas of the *_batch functions for each size in BATCH_SIZES."""
+    gaussian = load_gaussian(experimental_codegen)
+
+    erfc_inputs = [to_x96(x) for x in [0, WAD // 2, WAD, 2 * WAD, 3 * WAD, -WAD, -2 * WAD]]
+    erfinv_inputs = [to_x96(int(x * WAD)) for x in [0, 0.1, 0.5, 0.9, 0.97, 0.995, -0.5]]
+    cdf_inputs = [0, WAD, -WAD, 2 * WAD, -2 * WAD, 3 * WAD, -3 * WAD]
+    ppf_inputs = [int(x * WAD) for x in [0.25, 0.5, 0.75, 0.1, 0.9, 0.01, 0.99]]
+
+    calls = {
+        'erfc': (gaussian.erfc_batch, erfc_inputs, ()),
+        'erfinv': (gaussian.erfinv_batch, erfinv_inputs, ()),
+        'cdf': (gaussian.cdf_batch, cdf_inputs, (0, WAD)),
+        'ppf': (gaussian.ppf_batch, ppf_inputs, (0, WAD)),
     }
 
-    # erfinv range 1
-    erfinv_r1_inputs = [
-        to_x96(0),
-        to_x96(WAD // 10),
-        to_x96(WAD // 2),
-        to_x96(int(0.9 * WAD)),
-        to_x96(int(0.95 * WAD)),
-        to_x96(-WAD // 2),
-    ]
+    results = {}
+    for func, (fn, inputs, args) in calls.items():
+        results[func] = {}
+        for n in BATCH_SIZES:
+            xs = [inputs[i % len(inputs)] for i in range(n)]
+            fn(xs, *args)
+            results[func][n] = gaussian._computation.get_gas_used() / n
+
+    return results
 
-    gas_data = []
-    for x in erfinv_r1_inputs:
-        gaussian.erfinv(x)
-        gas_data.append(gaussian._computation.get_gas_used())
-    results['erfinv_r1'] = {
-        'min': min(gas_data),
-        'max': max(gas_data),
-        'avg': int(statistics.mean(gas_data)),
-        'median': int(statistics.median(gas_data)),
+
+def benchmark_segmented(experimental_codegen: bool = False):
+    """erfc gas of gaussian.vy vs gaussian_segmented.vy in every input region."""
+    contract_path = Path(__file__).parent.parent / "src" / "gaussian_segmented.vy"
+    segmented = compile_cache.load(contract_path, experimental_codegen=experimental_codegen)
+    gaussian = load_gaussian(experimental_codegen)
+
+    # One region per 0.5-wide segment, the saturated tail and the negative side
+    regions = {
+        f"[{i / 2:.1f}, {(i + 1) / 2:.1f})": [to_x96(i * WAD // 2 + j * WAD // 8) for j in range(4)]
+        for i in range(8)
     }
+    regions[">= ERFC_UPPER"] = [to_x96(x) for x in [5 * WAD, 10 * WAD]]
+    regions["negative"] = [to_x96(-x) for x in [WAD // 4, WAD, 2 * WAD, 3 * WAD]]
+
+    results = {}
+    for region, inputs in regions.items():
+        results[region] = {}
+        for name, contract in [('rational', gaussian), ('segmented', segmented)]:
+            gas_data = []
+            for x in inputs:
+                contract.erfc(x)
+                gas_data.append(contract._computation.get_gas_used())
+            results[region][name] = int(statistics.mean(gas_data))
+
+    return results
+
+
+def print_segmented_comparison(standard: dict, venom: dict) -> None:
+    """Print erfc avg total gas per input region for the rational and segmented builds."""
+    print("\n| Region        | Std rational | Std segmented | Venom rational | Venom segmented |")
+    print("|---------------|--------------|---------------|----------------|-----------------|")
+
+    for region in standard:
+        std, ven = standard[region], venom[region]
+        print(f"| {region:13} | {std['rational']:12} | {std['segmented']:13} | "
+              f"{ven['rational']:14} | {ven['segmented']:15} |")
 
-    # erfinv range 2
-    erfinv_r2_inputs = [
-        to_x96(int(0.97 * WAD)),
-        to_x96(int(0.98 * WAD)),
-        to_x96(int(-0.97 * WAD)),
-        to_x96(int(-0.98 * WAD)),
-    ]
 
-    gas_data = []
-    for x in erfinv_r2_inputs:
-        gaussian.erfinv(x)
-        gas_data.append(gaussian._computation.get_gas_used())
-    results['erfinv_r2'] = {
-        'min': min(gas_data),
-        'max': max(gas_data),
-        'avg': int(statistics.mean(gas_data)),
-        'median': int(statistics.median(gas_data)),
+def benchmark_inlined(experimental_codegen: bool = False):
+    """Example consumer gas with gaussian_core inlined vs calling a deployed gaussian.vy."""
+    examples = Path(__file__).parent.parent / "src" / "examples"
+    inlined = compile_cache.load(
+        examples / "range_probability.vy", experimental_codegen=experimental_codegen
+    )
+
+    calls = {
+        'probability_in_range': (-WAD, WAD, 0, WAD),
+        'quantile': (975 * WAD // 1000, 0, WAD),
     }
 
-    # erfinv range 3
-    erfinv_r3_inputs = [
-        to_x96(int(0.99 * WAD)),
-        to_x96(int(0.995 * WAD)),
-        to_x96(int(0.999 * WAD)),
-        to_x96(int(0.9999 * WAD)),
-        to_x96(int(-0.99 * WAD)),
-    ]
+    results = {}
+    for func, args in calls.items():
+        getattr(inlined, func)(*args)
+        results[func] = {'inlined': inlined._computation.get_gas_used()}
+
+        # Fresh gaussian.vy per function: first call pays EIP-2929 cold access, second is warm
+        external = compile_cache.load(
+            examples / "range_probability_external.vy",
+            load_gaussian(experimental_codegen).address,
+            experimental_codegen=experimental_codegen,
+        )
+
+        for key in ['external_cold', 'external_warm']:
+            getattr(external, func)(*args)
+            results[func][key] = external._computation.get_gas_used()
+
+    return results
+
 
-    gas_data = []
-    for x in erfinv_r3_inputs:
-        gaussian.erfinv(x)
-        gas_data.append(gaussian._computation.get_gas_used())
-    results['erfinv_r3'] = {
-        'min': min(gas_data),
-        'max': max(gas_data),
-        'avg': int(statistics.mean(gas_data)),
-        'median': int(statistics.median(gas_data)),
+def print_inlined_comparison(standard: dict, venom: dict) -> None:
+    """Print inlined vs external-call consumer gas for both compilers."""
+    print("\n| Function             | Build    | inlined | external (warm) | external (cold) |")
+    print("|----------------------|----------|---------|-----------------|-----------------|")
+
+    for func in standard:
+        for label, results in [('Standard', standard), ('Venom', venom)]:
+            r = results[func]
+            print(f"| {func:20} | {label:8} | {r['inlined']:7} | {r['external_warm']:15} | "
+                  f"{r['external_cold']:15} |")
+
+
+def benchmark_normal_distribution(experimental_codegen: bool = False):
+    """normal_distribution.vy instance vs gaussian.vy for a fixed (u, o): execution and calldata."""
+    src = Path(__file__).parent.parent / "src"
+    u, o = 1000 * WAD, 50 * WAD
+
+    gaussian = load_gaussian(experimental_codegen)
+    partial = compile_cache.load_partial(
+        src / "normal_distribution.vy", experimental_codegen=experimental_codegen
+    )
+    factory = compile_cache.load(
+        src / "normal_distribution_factory.vy",
+        partial.deploy_as_blueprint().address,
+        experimental_codegen=experimental_codegen,
+    )
+
+    # Deploying the full initcode in a transaction vs create_from_blueprint through the factory
+    direct = partial.deploy(u, o)
+    initcode = partial.compiler_data.bytecode + encode(['int256', 'uint256'], [u, o])
+    instance = partial.at(factory.create(u, o))
+    results = {
+        'deploy': {
+            'direct': direct._computation.get_gas_used() + tx_intrinsic_gas(initcode, create=True),
+            'factory': factory._computation.get_gas_used()
+            + tx_intrinsic_gas(factory.create.prepare_calldata(u, o)),
+        },
     }
 
-    # erfinv all ranges
-    erfinv_all_inputs = erfinv_r1_inputs + erfinv_r2_inputs + erfinv_r3_inputs
-
-    gas_data = []
-    for x in erfinv_all_inputs:
-        gaussian.erfinv(x)
-        gas_data.append(gaussian._computation.get_gas_used())
-    results['erfinv_all'] = {
-        'min': min(gas_data),
-        'max': max(gas_data),
-        'avg': int(statistics.mean(gas_data)),
-        'median': int(statistics.median(gas_data)),
+    calls = {
+        'cdf': [(x,) for x in [u, u + o, u - o, u + 2 * o, u - 3 * o]],
+        'ppf': [(p,) for p in [WAD // 2, WAD // 4, 3 * WAD // 4, WAD // 100, 99 * WAD // 100]],
     }
+    for func, inputs in calls.items():
+        gas = {'gaussian': [], 'instance': [], 'gaussian_calldata': [], 'instance_calldata': []}
+        for args in inputs:
+            getattr(gaussian, func)(*args, u, o)
+            gas['gaussian'].append(gaussian._computation.get_gas_used())
+            gas['gaussian_calldata'].append(
+                tx_intrinsic_gas(getattr(gaussian, func).prepare_calldata(*args, u, o)) - 21000
+            )
+            getattr(instance, func)(*args)
+            gas['instance'].append(instance._computation.get_gas_used())
+            gas['instance_calldata'].append(
+                tx_intrinsic_gas(getattr(instance, func).prepare_calldata(*args)) - 21000
+            )
+        results[func] = {key: int(statistics.mean(values)) for key, values in gas.items()}
 
-    # erfcinv
-    erfcinv_inputs = [
-        WAD,
-        WAD + WAD // 10,
-        WAD // 2,
-        3 * WAD // 2,
-        int(0.01 * WAD),
-        int(0.1 * WAD),
-        int(1.9 * WAD),
-    ]
+    return results
+
+
+def print_normal_distribution_results(standard: dict, venom: dict) -> None:
+    """Print per-call and deployment gas for normal_distribution.vy."""
+    print("\n| Function | Build    | gaussian.vy exec | instance exec | gaussian.vy calldata "
+          "| instance calldata |")
+    print("|----------|----------|------------------|---------------|----------------------"
+          "|-------------------|")
+    for func in ['cdf', 'ppf']:
+        for label, results in [('Standard', standard), ('Venom', venom)]:
+            r = results[func]
+            print(f"| {func:8} | {label:8} | {r['gaussian']:16} | {r['instance']:13} | "
+                  f"{r['gaussian_calldata']:20} | {r['instance_calldata']:17} |")
+
+    print("\n| Deployment (total incl. intrinsic) | Standard | Venom   |")
+    print("|------------------------------------|----------|---------|")
+    for key, label in [('direct', 'direct deploy'), ('factory', 'factory.create (blueprint)')]:
+        print(f"| {label:34} | {standard['deploy'][key]:8} | {venom['deploy'][key]:7} |")
+
+
+def new_transaction() -> None:
+    """Clear transient storage, as the end of a transaction does.
+
+    titanoboa runs each top-level call as a message without the end-of-transaction cleanup,
+    so transient storage otherwise carries over from one call to the next.
+    """
+    boa.env.evm.vm.state.clear_transient_storage()
+
+
+def benchmark_memo(experimental_codegen: bool = False):
+    """gaussian_memo.vy plain / miss / hit gas, measured inside one call by memo_caller.vy."""
+    src = Path(__file__).parent.parent / "src"
+    memo = compile_cache.load(src / "gaussian_memo.vy", experimental_codegen=experimental_codegen)
+    # The caller stays on the standard codegen: its Venom build reads the same msg.gas delta
+    # for every call
+    caller = compile_cache.load(src / "examples" / "memo_caller.vy", memo.address)
+
+    results = {}
+    for func, inputs in [('cdf', CDF_INPUTS), ('ppf', PPF_INPUTS)]:
+        gas = {'plain': [], 'miss': [], 'hit': []}
+        for args in dict.fromkeys(inputs):
+            # One transaction per input: plain, then the same arguments cached twice
+            new_transaction()
+            _, (plain, miss, hit) = getattr(caller, f"{func}_twice")(*args)
+            gas['plain'].append(plain)
+            gas['miss'].append(miss)
+            gas['hit'].append(hit)
+        results[func] = {key: int(statistics.mean(values)) for key, values in gas.items()}
+
+    return results
 
-    gas_data = []
-    for x in erfcinv_inputs:
-        gaussian.erfcinv(x)
-        gas_data.append(gaussian._computation.get_gas_used())
-    results['erfcinv'] = {
-        'min': min(gas_data),
-        'max': max(gas_data),
-        'avg': int(statistics.mean(gas_data)),
-        'median': int(statistics.median(gas_data)),
+
+def print_memo_results(standard: dict, venom: dict) -> None:
+    """Print memoized hit / miss gas against the plain call and the call count where it pays off.
+
+    All three are measured inside one external call, call overhead included, so the break-even
+    holds for repeated calls within a transaction.
+    """
+    print("\n| Function | Build    | plain | miss | hit | cheaper from |")
+    print("|----------|----------|-------|------|-----|--------------|")
+    for func in ['cdf', 'ppf']:
+        for label, results in [('Standard', standard), ('Venom', venom)]:
+            r = results[func]
+            # n calls with the same arguments: n * plain vs miss + (n - 1) * hit
+            calls = (r['miss'] - r['plain']) // (r['plain'] - r['hit']) + 2
+            print(f"| {func:8} | {label:8} | {r['plain']:5} | {r['miss']:4} | {r['hit']:3} | "
+                  f"{calls:6} calls |")
+
+
+# Functions shown per build in the size and matrix tables
+BUILD_FUNCS = ['erfc', 'erfinv_all', 'erfcinv', 'cdf', 'ppf', 'pdf']
+
+
+def benchmark_build(experimental_codegen: bool, contract: str = "gaussian.vy",
+                    optimize: str | None = None) -> dict:
+    """Bytecode size, deployment gas and per-call gas of one build."""
+    gaussian = load_gaussian(experimental_codegen, contract, optimize)
+    initcode = gaussian.compiler_data.bytecode
+    return {
+        'runtime_size': len(gaussian.compiler_data.bytecode_runtime),
+        'initcode_size': len(initcode),
+        'deploy': gaussian._computation.get_gas_used() + tx_intrinsic_gas(initcode, create=True),
+        'calls': benchmark_gaussian(experimental_codegen, contract, optimize),
     }
 
-    # cdf
-    cdf_inputs = [
-        (0, 0, WAD),
-        (WAD, 0, WAD),
-        (-WAD, 0, WAD),
-        (2 * WAD, WAD, WAD),
-        (0, -WAD, 2 * WAD),
-        (3 * WAD, 0, WAD),
-        (-3 * WAD, 0, WAD),
-    ]
 
-    gas_data = []
-    for x, u, o in cdf_inputs:
-        gaussian.cdf(x, u, o)
-        gas_data.append(gaussian._computation.get_gas_used())
-    results['cdf'] = {
-        'min': min(gas_data),
-        'max': max(gas_data),
-        'avg': int(statistics.mean(gas_data)),
-        'median': int(statistics.median(gas_data)),
+def benchmark_builds():
+    """Bytecode size, deployment gas and per-call avg gas for every build in BUILDS."""
+    return {
+        build: benchmark_build(experimental_codegen, contract)
+        for build, (contract, experimental_codegen) in BUILDS.items()
     }
 
-    # ppf
-    ppf_inputs = [
-        (WAD // 4, 0, WAD),
-        (WAD // 2, 0, WAD),
-        (3 * WAD // 4, 0, WAD),
-        (int(0.1 * WAD), 0, WAD),
-        (int(0.9 * WAD), 0, WAD),
-        (int(0.01 * WAD), 0, WAD),
-        (int(0.99 * WAD), 0, WAD),
-    ]
 
-    gas_data = []
-    for x, u, o in ppf_inputs:
-        gaussian.ppf(x, u, o)
-        gas_data.append(gaussian._computation.get_gas_used())
-    results['ppf'] = {
-        'min': min(gas_data),
-        'max': max(gas_data),
-        'avg': int(statistics.mean(gas_data)),
-        'median': int(statistics.median(gas_data)),
+def benchmark_matrix():
+    """benchmark_build for gaussian.vy at every codegen x optimize mode, compiled via the cache."""
+    return {
+        f"{'venom' if experimental_codegen else 'standard'}/{optimize}":
+            benchmark_build(experimental_codegen, optimize=optimize)
+        for experimental_codegen in (False, True)
+        for optimize in OPTIMIZE_MODES
     }
 
-    return results
+
+def print_build_results(results: dict) -> None:
+    """Print size and deployment cost next to avg call gas for each build."""
+    width = max(8, *(len(build) for build in results))
+    print(f"\n| {'Build':{width}} | runtime B | deploy gas | "
+          + " | ".join(f"{f:>10}" for f in BUILD_FUNCS) + " |")
+    print(f"|{'-' * (width + 2)}|-----------|------------|"
+          + "|".join("-" * 12 for _ in BUILD_FUNCS) + "|")
+
+    for build, r in results.items():
+        calls = " | ".join(f"{r['calls'][f]['avg']:10}" for f in BUILD_FUNCS)
+        print(f"| {build:{width}} | {r['runtime_size']:9} | {r['deploy']:10} | {calls} |")
+
+
+def print_best_builds(results: dict) -> None:
+    """Cheapest build for bytecode size, deployment and each function's avg call gas."""
+    columns = [
+        ('runtime bytes', lambda r: r['runtime_size']),
+        ('deploy gas', lambda r: r['deploy']),
+    ]
+    columns += [(f, lambda r, f=f: r['calls'][f]['avg']) for f in BUILD_FUNCS]
+
+    print("\n| Metric        | Best build        |   Value | Worst build       |   Value |")
+    print("|---------------|-------------------|---------|-------------------|---------|")
+    for label, metric in columns:
+        ranked = sorted(results, key=lambda build: metric(results[build]))
+        best, worst = ranked[0], ranked[-1]
+        print(f"| {label:13} | {best:17} | {metric(results[best]):7} | {worst:17} | "
+              f"{metric(results[worst]):7} |")
+
+
+def print_break_even(matrix: dict) -> None:
+    """Calls after which optimize gas pays back the deployment codesize saves, per codegen."""
+    print()
+    for codegen in ('standard', 'venom'):
+        gas, codesize = matrix[f"{codegen}/gas"], matrix[f"{codegen}/codesize"]
+        saved = gas['deploy'] - codesize['deploy']
+        extra = sum(codesize['calls'][f]['avg'] - gas['calls'][f]['avg'] for f in BUILD_FUNCS)
+        extra /= len(BUILD_FUNCS)
+        if saved <= 0 or extra <= 0:
+            print(f"{codegen}: one build is cheaper on both, no break-even")
+            continue
+        print(f"{codegen}: codesize saves {saved} deploy gas and costs {extra:.0f} gas per call, "
+              f"optimize gas is cheaper after {saved / extra:.0f} calls")
 
 
 def print_results(label: str, results: dict) -> None:
@@ -220,46 +592,123 @@ def print_results(label: str, results: dict) -> None:
     print(f"\n{label}")
     print("=" * 80)
 
-    # Print individual results
-    for func in ['erfc', 'erfinv_r1', 'erfinv_r2', 'erfinv_r3', 'erfinv_all', 'erfcinv', 'cdf', 'ppf']:
+    for func, _, _ in GAUSSIAN_BENCHMARKS:
         if func not in results:
             continue
-        stats = results[func]
+        r = results[func]
         print(f"\n{func}:")
-        print(f"  min: {stats['min']:6}, max: {stats['max']:6}, avg: {stats['avg']:6}, median: {stats['median']:6}")
+        print(f"  min: {r['min']:6}, max: {r['max']:6}, avg: {r['avg']:6}, "
+              f"median: {r['median']:6}")
+
+
+def benchmark_breakdown(experimental_codegen: bool = False, contract: str = "gaussian.vy",
+                        optimize: str | None = None) -> dict:
+    """Mean dispatch / ABI / compute gas per external over BENCHMARK_INPUTS, from the trace."""
+    gaussian = load_gaussian(experimental_codegen, contract, optimize)
+    return {
+        function: gas_accounting.account(gaussian, function, inputs)
+        for function, inputs in BENCHMARK_INPUTS.items()
+    }
 
 
 def print_comparison(standard: dict, venom: dict) -> None:
-    """Print side-by-side comparison with Solidity baseline."""
+    """Print computation gas of each build, from benchmark_breakdown, against solgauss."""
     print("\n" + "=" * 90)
-    print("COMPARISON (pure computation = total - 118 gas call overhead)")
+    print("COMPARISON (computation gas from the opcode trace, dispatch and ABI excluded)")
     print("=" * 90)
     print()
 
-    print("| Function  | Solidity | Std Pure | Std vs Sol | Venom Pure | Venom vs Sol |")
-    print("|-----------|----------|----------|------------|------------|--------------|")
+    print("| Function  | Solidity | Std compute | Std vs Sol | Venom compute | Venom vs Sol |")
+    print("|-----------|----------|-------------|------------|---------------|--------------|")
 
     for func in ['erfc', 'erfcinv', 'cdf', 'ppf']:
-        if func not in standard or func not in venom:
-            continue
-
         sol = SOLGAUSS_BASELINE.get(func)
-        if sol is None:
+        if sol is None or func not in standard or func not in venom:
             continue
 
-        std_pure = standard[func]['avg'] - CALL_OVERHEAD
-        venom_pure = venom[func]['avg'] - CALL_OVERHEAD
+        std_pure = standard[func]['compute']
+        venom_pure = venom[func]['compute']
 
         std_vs_sol = (std_pure - sol) / sol * 100
         venom_vs_sol = (venom_pure - sol) / sol * 100
 
-        std_vs_str = f"{std_vs_sol:+.0f}%"
-        venom_vs_str = f"{venom_vs_sol:+.0f}%"
+        print(f"| {func:9} | {sol:8} | {std_pure:11.0f} | {std_vs_sol:+9.0f}% | "
+              f"{venom_pure:13.0f} | {venom_vs_sol:+11.0f}% |")
+
+
+def print_fused_comparison(standard: dict, venom: dict) -> None:
+    """Print fused cdf_pdf against separate cdf and pdf calls (avg total gas)."""
+    print("\n| Build    | cdf + pdf (2 calls) | cdf_pdf (fused) | saving |")
+    print("|----------|---------------------|-----------------|--------|")
+
+    for label, results in [("standard", standard), ("Venom", venom)]:
+        separate = results['cdf']['avg'] + results['pdf']['avg']
+        fused = results['cdf_pdf']['avg']
+        saving = (separate - fused) / separate * 100
+        print(f"| {label:8} | {separate:19} | {fused:15} | {saving:5.0f}% |")
+
+
+def print_log_results(standard: dict, venom: dict) -> None:
+    """Print log_cdf / log_sf next to cdf (total gas), one call instead of cdf plus a log."""
+    print("\n| Function | Std avg | Std max | Venom avg | Venom max |")
+    print("|----------|---------|---------|-----------|-----------|")
+
+    for func in ['cdf', 'log_cdf', 'log_sf']:
+        print(f"| {func:8} | {standard[func]['avg']:7} | {standard[func]['max']:7} | "
+              f"{venom[func]['avg']:9} | {venom[func]['max']:9} |")
 
-        print(f"| {func:9} | {sol:8} | {std_pure:8} | {std_vs_str:>10} | {venom_pure:10} | {venom_vs_str:>12} |")
+
+def print_fast_comparison(standard: dict, venom: dict) -> None:
+    """Print computation gas of the fast tier against the full-precision functions."""
+    print("\n| Function | Fast bound | Std full | Std fast | saving | Venom full | Venom fast "
+          "| saving |")
+    print("|----------|------------|----------|----------|--------|------------|------------"
+          "|--------|")
+
+    for func, (fast, bound) in FAST_TIER.items():
+        std_full, std_fast = standard[func]['compute'], standard[fast]['compute']
+        venom_full, venom_fast = venom[func]['compute'], venom[fast]['compute']
+        std_saving = (std_full - std_fast) / std_full * 100
+        venom_saving = (venom_full - venom_fast) / venom_full * 100
+        print(f"| {func:8} | {bound:>10} | {std_full:8.0f} | {std_fast:8.0f} | "
+              f"{std_saving:5.0f}% | {venom_full:10.0f} | {venom_fast:10.0f} | "
+              f"{venom_saving:5.0f}% |")
+
+
+def print_batch_results(single: dict, batch: dict) -> None:
+    """Print per-element batch gas next to the single-call average."""
+    print("\n| Function | single avg | " + " | ".join(f"n={n:<5}" for n in BATCH_SIZES) + " |")
+    print("|----------|------------|" + "|".join("---------" for _ in BATCH_SIZES) + "|")
+
+    for func, per_size in batch.items():
+        single_key = 'erfinv_all' if func == 'erfinv' else func
+        cells = " | ".join(f"{per_size[n]:7.0f}" for n in BATCH_SIZES)
+        print(f"| {func:8} | {single[single_key]['avg']:10} | {cells} |")
+
+
+def print_matrix(matrix: dict) -> None:
+    print("\n" + "=" * 90)
+    print("OPTIMIZATION MATRIX (gaussian.vy, codegen x optimize, deploy gas incl. intrinsic)")
+    print("=" * 90)
+    print_build_results(matrix)
+    print_best_builds(matrix)
+    print_break_even(matrix)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="vygauss gas benchmarks")
+    parser.add_argument("--matrix", action="store_true",
+                        help="only the codegen x optimize matrix")
+    parser.add_argument("--out", type=Path, default=None, help="write the matrix as JSON")
+    args = parser.parse_args()
+
+    if args.matrix:
+        matrix = benchmark_matrix()
+        print_matrix(matrix)
+        if args.out is not None:
+            args.out.write_text(json.dumps(matrix, indent=2))
+        return
+
     print("\nvygauss Gas Benchmarks - Vyper 0.4.3+")
     print("=" * 80)
 
@@ -272,13 +721,92 @@ def main():
     print_results("VENOM COMPILER RESULTS", venom_results)
 
     # Print comparison
-    print_comparison(standard_results, venom_results)
+    standard_breakdown = benchmark_breakdown(experimental_codegen=False)
+    venom_breakdown = benchmark_breakdown(experimental_codegen=True)
+    gas_accounting.print_breakdown("STANDARD (avg gas per call)", standard_breakdown)
+    gas_accounting.print_breakdown("VENOM (avg gas per call)", venom_breakdown)
+    print_comparison(standard_breakdown, venom_breakdown)
+
+    print("\n" + "=" * 90)
+    print("log_cdf / log_sf vs cdf (log_cdf inputs include -6, -10 and -40 sigma)")
+    print("=" * 90)
+    print_log_results(standard_results, venom_results)
+
+    print("\n" + "=" * 90)
+    print("FAST TIER vs FULL PRECISION (computation gas, full precision error < 1e-8)")
+    print("=" * 90)
+    print_fast_comparison(standard_breakdown, venom_breakdown)
+
+    print("\n" + "=" * 90)
+    print("FUSED cdf_pdf vs SEPARATE cdf + pdf")
+    print("=" * 90)
+    print_fused_comparison(standard_results, venom_results)
+
+    print("\n" + "=" * 90)
+    print("BYTECODE SIZE AND DEPLOYMENT (deploy gas includes CREATE and initcode calldata)")
+    print("=" * 90)
+    print_build_results(benchmark_builds())
+
+    matrix = benchmark_matrix()
+    print_matrix(matrix)
+    if args.out is not None:
+        args.out.write_text(json.dumps(matrix, indent=2))
+
+    print("\n" + "=" * 90)
+    print("SEGMENTED erfc (gaussian_segmented.vy) vs RATIONAL by input region")
+    print("=" * 90)
+    print_segmented_comparison(
+        benchmark_segmented(experimental_codegen=False),
+        benchmark_segmented(experimental_codegen=True),
+    )
+
+    print("\n" + "=" * 90)
+    print("INLINED gaussian_core vs EXTERNAL CALL to gaussian.vy (src/examples)")
+    print("=" * 90)
+    print_inlined_comparison(
+        benchmark_inlined(experimental_codegen=False),
+        benchmark_inlined(experimental_codegen=True),
+    )
+
+    print("\n" + "=" * 90)
+    print("NORMAL DISTRIBUTION INSTANCES (normal_distribution.vy, fixed u and o)")
+    print("=" * 90)
+    print_normal_distribution_results(
+        benchmark_normal_distribution(experimental_codegen=False),
+        benchmark_normal_distribution(experimental_codegen=True),
+    )
+
+    print("\n" + "=" * 90)
+    print("TRANSIENT MEMOIZATION (gaussian_memo.vy via memo_caller.vy, same arguments in one call)")
+    print("=" * 90)
+    print_memo_results(
+        benchmark_memo(experimental_codegen=False),
+        benchmark_memo(experimental_codegen=True),
+    )
+
+    print("\n" + "=" * 90)
+    print("BLACK-SCHOLES (black_scholes.vy)")
+    print("=" * 90)
+    print_black_scholes_results(
+        benchmark_black_scholes(experimental_codegen=False),
+        benchmark_black_scholes(experimental_codegen=True),
+    )
+
+    print("\n" + "=" * 90)
+    print("BATCH FUNCTIONS (gas per element, including the single call overhead)")
+    print("=" * 90)
+    for label, codegen, single in [
+        ("STANDARD", False, standard_results),
+        ("VENOM", True, venom_results),
+    ]:
+        print(f"\n{label}")
+        print_batch_results(single, benchmark_batch(experimental_codegen=codegen))
 
     print("\n" + "=" * 90)
     print("NOTES")
     print("=" * 90)
     print(f"""
-Call overhead: {CALL_OVERHEAD} gas (subtract from titanoboa results for pure computation)
+Computation gas: total minus dispatch and ABI encoding/decoding, per call from the opcode trace
 Venom: --experimental-codegen or compiler_args={{'experimental_codegen': True}}
 Solidity baseline from solgauss README
 """)
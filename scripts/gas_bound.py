@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""
+Static worst-case gas bound per external function.
+
+Explores every path of the deployed runtime bytecode from the selector dispatch to a RETURN,
+STOP or REVERT and reports the most expensive one. Every external except the batch functions
+is loop-free (the erfinv ranges, ERFC_UPPER, the bit scans of _ln_wad and the erfinv tail
+are plain branches), so the search terminates and the maximum is an upper bound on the
+execution gas of any call.
+
+The search carries an abstract state per basic block: the stack and memory with each value
+either a known constant or unknown, and the memory size. Constants are folded, which
+resolves jump targets (internal call return addresses, the dispatcher's jump table) and
+branches whose condition does not depend on the arguments. Every other JUMPI follows both
+edges. States are memoized, so merging branches do not multiply the work. Loops with a
+constant trip count are unrolled; a loop whose exit depends on the arguments raises
+AnalysisError, as do opcodes whose cost depends on state (storage, calls, logs).
+
+Calldata is the selector followed by unknown static arguments. The word at offset 0, which
+only the dispatcher reads, is taken as the selector with zero argument bytes.
+
+Gas is Cancun execution gas: the static cost of each opcode plus memory expansion, copy
+costs and EXP's exponent bytes. Intrinsic gas is excluded. A contract calling the library
+must forward at least the bound (plus 1/63 more than it keeps under EIP-150).
+
+Each bound is cross-checked against the largest gas observed over the gas_suite.py workloads
+and the gas_benchmark.py inputs (--no-check skips this), and the script exits with status 1
+if an observed call exceeds it. The bound can exceed the observed maximum where the worst
+path combines branches no single input takes (e.g. every step of a bit scan). The batch
+functions take dynamic arrays and are not analysed.
+
+Usage: python3 scripts/gas_bound.py [--builds B ...] [--functions F ...] [--calls N]
+       [--no-check] [--path FUNCTION]
+"""
+
+import argparse
+import bisect
+import random
+import sys
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+from vyper.evm.opcodes import get_opcodes
+from vyper.utils import method_id_int
+
+UINT256 = 2**256
+MASK = UINT256 - 1
+
+# Opcode byte: (mnemonic, pops, pushes, static gas)
+OPCODES = {value[0]: (name, *value[1:]) for name, value in get_opcodes().items()}
+
+TERMINATORS = {'STOP', 'RETURN', 'REVERT', 'INVALID'}
+
+# Times one block may repeat along a path: loops with a constant trip count are unrolled,
+# a loop whose exit depends on the arguments never repeats a state and hits this
+MAX_UNROLL = 256
+
+# Opcodes whose cost or result depends on state outside the call
+UNSUPPORTED = {
+    'SLOAD', 'SSTORE', 'TLOAD', 'TSTORE', 'CALL', 'CALLCODE', 'DELEGATECALL', 'STATICCALL',
+    'CREATE', 'CREATE2', 'SELFDESTRUCT', 'BALANCE', 'EXTCODESIZE', 'EXTCODECOPY', 'EXTCODEHASH',
+    'LOG0', 'LOG1', 'LOG2', 'LOG3', 'LOG4',
+}
+
+
+class AnalysisError(Exception):
+    pass
+
+
+def _signed(x: int) -> int:
+    return x - UINT256 if x >> 255 else x
+
+
+def _sdiv(a: int, b: int) -> int:
+    a, b = _signed(a), _signed(b)
+    if b == 0:
+        return 0
+    q = abs(a) // abs(b)
+    return (-q if (a < 0) != (b < 0) else q) & MASK
+
+
+def _smod(a: int, b: int) -> int:
+    a, b = _signed(a), _signed(b)
+    if b == 0:
+        return 0
+    r = abs(a) % abs(b)
+    return (-r if a < 0 else r) & MASK
+
+
+def _signextend(b: int, x: int) -> int:
+    if b >= 31:
+        return x
+    bits = 8 * (b + 1)
+    x &= (1 << bits) - 1
+    return (x - (1 << bits)) & MASK if x >> (bits - 1) else x
+
+
+# Constant folding, arguments in stack order (top first)
+FOLD = {
+    'ADD': lambda a, b: (a + b) & MASK,
+    'SUB': lambda a, b: (a - b) & MASK,
+    'MUL': lambda a, b: (a * b) & MASK,
+    'DIV': lambda a, b: a // b if b else 0,
+    'SDIV': _sdiv,
+    'MOD': lambda a, b: a % b if b else 0,
+    'SMOD': _smod,
+    'EXP': lambda a, b: pow(a, b, UINT256),
+    'SIGNEXTEND': _signextend,
+    'LT': lambda a, b: int(a < b),
+    'GT': lambda a, b: int(a > b),
+    'SLT': lambda a, b: int(_signed(a) < _signed(b)),
+    'SGT': lambda a, b: int(_signed(a) > _signed(b)),
+    'EQ': lambda a, b: int(a == b),
+    'ISZERO': lambda a: int(a == 0),
+    'AND': lambda a, b: a & b,
+    'OR': lambda a, b: a | b,
+    'XOR': lambda a, b: a ^ b,
+    'NOT': lambda a: a ^ MASK,
+    'BYTE': lambda i, x: (x >> (8 * (31 - i))) & 0xFF if i < 32 else 0,
+    'SHL': lambda s, x: (x << s) & MASK if s < 256 else 0,
+    'SHR': lambda s, x: x >> s if s < 256 else 0,
+    'SAR': lambda s, x: (_signed(x) >> min(s, 255)) & MASK,
+}
+
+
+def _memory_cost(words: int) -> int:
+    return 3 * words + words * words // 512
+
+
+def disassemble(code: bytes) -> dict:
+    """{pc: (mnemonic, pops, pushes, gas, immediate)} of every instruction."""
+    instructions = {}
+    pc = 0
+    while pc < len(code):
+        op = code[pc]
+        name, pops, pushes, gas = OPCODES.get(op, ('INVALID', 0, 0, 0))
+        size = op - 0x5F if 0x60 <= op <= 0x7F else 0
+        # vyper's table lists DUPn / SWAPn with the stack effect of DUP1 / SWAP1
+        if 0x80 <= op <= 0x8F:
+            pops, pushes = op - 0x7F, op - 0x7E
+        elif 0x90 <= op <= 0x9F:
+            pops = pushes = op - 0x8E
+        immediate = int.from_bytes(code[pc + 1:pc + 1 + size].ljust(size, b'\0'), 'big')
+        instructions[pc] = (name, pops, pushes, gas, immediate if size else None)
+        pc += 1 + size
+    return instructions
+
+
+class _Memory:
+    """Word-addressed memory, each word an int or None (unknown). Missing words are zero."""
+
+    def __init__(self, words=None):
+        self.words = dict(words or {})
+
+    def read(self, offset: int, size: int) -> list:
+        """Bytes of [offset, offset + size), each an int or None."""
+        out = []
+        for addr in range(offset, offset + size):
+            word = self.words.get(addr // 32, 0)
+            out.append(None if word is None else (word >> (8 * (31 - addr % 32))) & 0xFF)
+        return out
+
+    def write(self, offset: int, data: list) -> None:
+        end = offset + len(data)
+        for index in range(offset // 32, (end + 31) // 32):
+            base = 32 * index
+            if offset <= base and base + 32 <= end:
+                word = _join(data[base - offset:base - offset + 32])
+            else:
+                current = self.read(base, 32)
+                for addr in range(max(base, offset), min(base + 32, end)):
+                    current[addr - base] = data[addr - offset]
+                word = _join(current)
+            # Zero words are dropped so equal memories have equal keys
+            if word == 0:
+                self.words.pop(index, None)
+            else:
+                self.words[index] = word
+
+    def key(self) -> tuple:
+        return tuple(sorted(self.words.items()))
+
+
+def _join(data: list):
+    if any(byte is None for byte in data):
+        return None
+    return int.from_bytes(bytes(data), 'big')
+
+
+def _word(value) -> list:
+    return [None] * 32 if value is None else list(value.to_bytes(32, 'big'))
+
+
+class Analysis:
+    """Worst-case gas of one external: calldata is `selector` plus `calldatasize - 4` bytes."""
+
+    def __init__(self, code: bytes, selector: int, calldatasize: int):
+        self.code = code
+        self.instructions = disassemble(code)
+        self.jumpdests = {pc for pc, ins in self.instructions.items() if ins[0] == 'JUMPDEST'}
+        self.selector = selector
+        self.calldatasize = calldatasize
+        self._memo = {}
+        self._active = set()
+        self._visits = Counter()
+
+    def _calldata(self, offset: int, size: int) -> list:
+        if offset == 0 and size == 32:
+            return list((self.selector << 224).to_bytes(32, 'big'))
+        out = []
+        for addr in range(offset, offset + size):
+            if addr < 4:
+                out.append((self.selector >> (8 * (3 - addr))) & 0xFF)
+            else:
+                out.append(None if addr < self.calldatasize else 0)
+        return out
+
+    def _bytes(self, offset, size, pc) -> tuple:
+        if offset is None or size is None:
+            raise AnalysisError(f"unknown memory range at pc {pc}")
+        return offset, size
+
+    def run(self):
+        """(gas, branches) of the most expensive path from pc 0, see bound()."""
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, 20000))
+        try:
+            return self._block(0, (), _Memory(), 0)
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def _block(self, pc: int, stack: tuple, memory: _Memory, msize: int):
+        key = (pc, stack, msize, memory.key())
+        if key in self._memo:
+            return self._memo[key]
+        if key in self._active or self._visits[pc] >= MAX_UNROLL:
+            raise AnalysisError(f"loop at pc {pc} without a constant trip count")
+        self._active.add(key)
+        self._visits[pc] += 1
+        try:
+            result = self._execute(pc, list(stack), _Memory(memory.words), msize)
+        finally:
+            self._active.discard(key)
+            self._visits[pc] -= 1
+        self._memo[key] = result
+        return result
+
+    def _execute(self, pc, stack, memory, msize):
+        gas = 0
+
+        def expand(offset, size):
+            nonlocal gas, msize
+            if size == 0:
+                return
+            words = (offset + size + 31) // 32
+            if words > msize:
+                gas += _memory_cost(words) - _memory_cost(msize)
+                msize = words
+
+        while True:
+            if pc not in self.instructions:
+                # Running off the end of the code is STOP
+                return gas, []
+            name, pops, pushes, static, immediate = self.instructions[pc]
+            if name in UNSUPPORTED:
+                raise AnalysisError(f"{name} at pc {pc}")
+            if len(stack) < pops:
+                raise AnalysisError(f"stack underflow at pc {pc}")
+            gas += static
+            args = [stack.pop() for _ in range(pops)]
+            next_pc = pc + 1 + (0 if immediate is None else (self.code[pc] - 0x5F))
+
+            if name in TERMINATORS:
+                if name in ('RETURN', 'REVERT'):
+                    expand(*self._bytes(*args, pc))
+                # INVALID consumes all gas, an error path no successful call takes
+                return (gas if name != 'INVALID' else 0), []
+
+            if name == 'JUMP' or name == 'JUMPI':
+                target = args[0]
+                if target is None or target not in self.jumpdests:
+                    raise AnalysisError(f"unresolved jump target at pc {pc}")
+                edges = [target]
+                if name == 'JUMPI':
+                    condition = args[1]
+                    if condition == 0:
+                        edges = [next_pc]
+                    elif condition is None:
+                        edges = [target, next_pc]
+                best = None
+                for edge in edges:
+                    rest, branches = self._block(edge, tuple(stack), memory, msize)
+                    if len(edges) > 1:
+                        branches = [(pc, edge == target)] + branches
+                    if best is None or rest > best[0]:
+                        best = (rest, branches)
+                return gas + best[0], best[1]
+
+            if name.startswith('PUSH'):
+                stack.append(immediate if immediate is not None else 0)
+            elif name.startswith('DUP'):
+                stack.extend(reversed(args))
+                stack.append(args[-1])
+            elif name.startswith('SWAP'):
+                args[0], args[-1] = args[-1], args[0]
+                stack.extend(reversed(args))
+            elif name == 'POP' or name == 'JUMPDEST':
+                pass
+            elif name in FOLD:
+                if name == 'EXP':
+                    # 50 gas per byte of the exponent, 32 bytes when unknown
+                    exponent = args[1]
+                    gas += 50 * (32 if exponent is None else (exponent.bit_length() + 7) // 8)
+                known = all(a is not None for a in args)
+                stack.append(FOLD[name](*args) if known else None)
+            elif name == 'MLOAD':
+                offset, _ = self._bytes(args[0], 32, pc)
+                expand(offset, 32)
+                stack.append(_join(memory.read(offset, 32)))
+            elif name == 'MSTORE':
+                offset, _ = self._bytes(args[0], 32, pc)
+                expand(offset, 32)
+                memory.write(offset, _word(args[1]))
+            elif name == 'MSTORE8':
+                offset, _ = self._bytes(args[0], 1, pc)
+                expand(offset, 1)
+                memory.write(offset, [None if args[1] is None else args[1] & 0xFF])
+            elif name in ('CALLDATACOPY', 'CODECOPY', 'MCOPY'):
+                destination, size = self._bytes(args[0], args[2], pc)
+                source = args[1]
+                gas += 3 * ((size + 31) // 32)
+                expand(destination, size)
+                if name == 'MCOPY':
+                    self._bytes(source, size, pc)
+                    expand(source, size)
+                    data = memory.read(source, size)
+                elif source is None:
+                    data = [None] * size
+                elif name == 'CODECOPY':
+                    data = list(self.code[source:source + size].ljust(size, b'\0'))
+                else:
+                    data = self._calldata(source, size)
+                memory.write(destination, data)
+            elif name == 'SHA3':
+                offset, size = self._bytes(*args, pc)
+                gas += 6 * ((size + 31) // 32)
+                expand(offset, size)
+                stack.append(None)
+            elif name == 'CALLDATALOAD':
+                offset = args[0]
+                stack.append(None if offset is None else _join(self._calldata(offset, 32)))
+            elif name == 'CALLDATASIZE':
+                stack.append(self.calldatasize)
+            elif name == 'MSIZE':
+                stack.append(32 * msize)
+            elif name == 'PC':
+                stack.append(pc)
+            elif name == 'CODESIZE':
+                stack.append(len(self.code))
+            else:
+                stack.extend([None] * pushes)
+
+            pc = next_pc
+            if pc in self.jumpdests:
+                # Fall through into the next block
+                rest, branches = self._block(pc, tuple(stack), memory, msize)
+                return gas + rest, branches
+
+
+def _signature(entry: dict) -> str:
+    return f"{entry['name']}({','.join(i['type'] for i in entry['inputs'])})"
+
+
+def externals(abi: list) -> dict:
+    """{name: (selector, calldatasize)} of every external with static arguments."""
+    result = {}
+    for entry in abi:
+        if entry.get('type') != 'function':
+            continue
+        types = [i['type'] for i in entry['inputs']]
+        if any(t.endswith(']') or t in ('bytes', 'string') for t in types):
+            continue
+        result[entry['name']] = (method_id_int(_signature(entry)), 4 + 32 * len(entry['inputs']))
+    return result
+
+
+def bound(code: bytes, selector: int, calldatasize: int) -> tuple:
+    """
+    (worst-case execution gas, branches of the worst path).
+
+    The branches are (pc, jumped) for every JUMPI along the path whose condition depends on
+    the arguments.
+    """
+    return Analysis(code, selector, calldatasize).run()
+
+
+def contract_bounds(contract, functions=None) -> dict:
+    """{function: (gas, branches)} for the externals of a deployed boa contract."""
+    code = contract.env.get_code(contract.address)
+    targets = externals(contract.abi)
+    names = functions or list(targets)
+    return {name: bound(code, *targets[name]) for name in names if name in targets}
+
+
+# Externals sampled with the inputs of another function
+SAMPLED_AS = {
+    'pdf': 'cdf',
+    'cdf_pdf': 'cdf',
+    'log_cdf': 'cdf',
+    'log_sf': 'cdf',
+    'erfc_fast': 'erfc',
+    'cdf_fast': 'cdf',
+    'ppf_fast': 'ppf',
+}
+
+
+def sample_inputs(function: str, calls: int, seed: int = 0) -> list:
+    """Argument tuples of the gas_benchmark inputs and `calls` per gas_suite distribution."""
+    import gas_suite
+    from gas_benchmark import BENCHMARK_INPUTS
+
+    base = SAMPLED_AS.get(function, function)
+    inputs = list(BENCHMARK_INPUTS.get(base, []))
+    if base in gas_suite.FUNCTIONS:
+        to_args = gas_suite.FUNCTIONS[base][0]
+        for distribution, sample in gas_suite.DISTRIBUTIONS.items():
+            rng = random.Random(f"{seed}-{base}-{distribution}")
+            inputs += [to_args(sample(rng)) for _ in range(calls)]
+    return inputs
+
+
+def empirical_max(contract, function: str, calls: int) -> int | None:
+    """Largest gas over sample_inputs(function), None without inputs."""
+    fn = getattr(contract, function)
+    seen = []
+    for args in sample_inputs(function, calls):
+        fn(*args)
+        seen.append(contract._computation.get_gas_used())
+    return max(seen, default=None)
+
+
+def print_bounds(build: str, rows: dict) -> None:
+    print(f"\n{build}")
+    print(f"| {'Function':<12} | {'bound':>6} | {'observed max':>12} | {'slack':>6} |")
+    print(f"|{'-' * 14}|{'-' * 8}|{'-' * 14}|{'-' * 8}|")
+    for function, (gas, observed) in rows.items():
+        if observed is None:
+            print(f"| {function:<12} | {gas:>6} | {'-':>12} | {'-':>6} |")
+        else:
+            print(f"| {function:<12} | {gas:>6} | {observed:>12} | {gas - observed:>6} |")
+
+
+def print_path(contract, branches: list) -> None:
+    """Source line of every argument-dependent branch along the worst path."""
+    source_map = contract.source_map["pc_raw_ast_map"]
+    mapped = sorted(source_map)
+    for pc, jumped in branches:
+        # Venom maps few PCs, use the nearest mapped one at or before the JUMPI
+        i = bisect.bisect_right(mapped, pc)
+        node = source_map[mapped[i - 1]] if i else None
+        if node is None:
+            print(f"  pc {pc:<5} {'jump' if jumped else 'fall through'}")
+            continue
+        module = node.module_node
+        line = module.full_source_code.splitlines()[node.lineno - 1].strip()
+        location = f"{Path(module.resolved_path).name}:{node.lineno}"
+        print(f"  pc {pc:<5} {'jump' if jumped else 'fall through':<12} {location:<22} {line}")
+
+
+@lru_cache
+def _load(build: str):
+    from gas_benchmark import BUILDS, load_gaussian
+    contract, experimental_codegen = BUILDS[build]
+    return load_gaussian(experimental_codegen, contract)
+
+
+def main():
+    from gas_benchmark import BUILDS
+
+    parser = argparse.ArgumentParser(description="Static worst-case gas bound per external")
+    parser.add_argument("--builds", nargs="*", default=list(BUILDS), choices=list(BUILDS))
+    parser.add_argument("--functions", nargs="*", default=None)
+    parser.add_argument("--calls", type=int, default=500,
+                        help="calls per gas_suite workload for the observed maximum")
+    parser.add_argument("--no-check", action="store_true", help="skip the observed maximum")
+    parser.add_argument("--path", default=None, metavar="FUNCTION",
+                        help="print the branches of FUNCTION's worst path")
+    args = parser.parse_args()
+
+    failed = False
+    for build in args.builds:
+        contract = _load(build)
+        bounds = contract_bounds(contract, args.functions)
+        rows = {}
+        for function, (gas, _) in bounds.items():
+            observed = None if args.no_check else empirical_max(contract, function, args.calls)
+            rows[function] = (gas, observed)
+            failed |= observed is not None and observed > gas
+        print_bounds(build, rows)
+        if args.path in bounds:
+            print(f"\nWorst path of {args.path}:")
+            print_path(contract, bounds[args.path][1])
+
+    if failed:
+        print("\nAn observed call exceeded its static bound")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
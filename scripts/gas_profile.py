@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Source-line gas profiler for gaussian.vy.
+
+Runs randomized workloads through titanoboa with the profiling gas meter, which records the
+gas of every executed PC. Each PC is mapped back to a source line of gaussian.vy or
+gaussian_core.vy through the compiler's source map (PCs without an entry inherit the line of
+the last mapped PC in the trace, the same rule as boa's line profiler). Gas is then summed
+per line, per internal function and per section. A section is the run of lines under one
+comment inside a function, e.g. the bit scan, atanh series, Newton sqrt and rational of the
+erfinv tail.
+
+Prints a heatmap per workload (mean gas per call) and writes every line to a JSON file.
+
+Usage: python3 scripts/gas_profile.py [--venom] [--calls N] [--top N] [--workloads W ...]
+       [--out PATH]
+"""
+
+import argparse
+import json
+import random
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+import boa
+from vyper import ast as vy_ast
+
+from emulator import C
+from gas_benchmark import load_gaussian
+
+WAD = 10**18
+POW96 = 2**96
+
+ERFC_UPPER = C["ERFC_UPPER"]
+ERFINV_0_99 = C["ERFINV_0_99"]
+ERFINV_0_9999 = C["ERFINV_0_9999"]
+
+# PCs that run before the first mapped PC (selector dispatch, calldata checks)
+DISPATCH = "<dispatch>"
+
+# name: (external function, input sampler, extra arguments)
+WORKLOADS = {
+    'erfc': ('erfc', lambda r: r.randrange(-ERFC_UPPER + 1, ERFC_UPPER), ()),
+    'erfinv_r1': ('erfinv', lambda r: r.randrange(-ERFINV_0_99 + 1, ERFINV_0_99), ()),
+    'erfinv_r2': ('erfinv', lambda r: r.randrange(ERFINV_0_99, ERFINV_0_9999), ()),
+    'erfinv_r3': ('erfinv', lambda r: r.randrange(ERFINV_0_9999, POW96), ()),
+    'erfcinv': ('erfcinv', lambda r: r.randrange(1, 2 * WAD), ()),
+    'cdf': ('cdf', lambda r: r.randrange(-6 * WAD, 6 * WAD), (0, WAD)),
+    'ppf': ('ppf', lambda r: r.randrange(1, WAD), (0, WAD)),
+    'pdf': ('pdf', lambda r: r.randrange(-6 * WAD, 6 * WAD), (0, WAD)),
+    'cdf_pdf': ('cdf_pdf', lambda r: r.randrange(-6 * WAD, 6 * WAD), (0, WAD)),
+}
+
+
+@lru_cache(maxsize=None)
+def source_lines(path: str) -> list:
+    return Path(path).read_text().splitlines()
+
+
+def section_of(path: str, lineno: int, fn_lineno: int) -> str:
+    """Nearest full-line comment above `lineno` inside its function, '-' before the first one."""
+    lines = source_lines(path)
+    for n in range(lineno, fn_lineno, -1):
+        text = lines[n - 1].strip()
+        if text.startswith("#"):
+            return text.lstrip("# ")
+    return "-"
+
+
+def line_gas(contract) -> dict:
+    """{(module path, line, function, function line): gas} of the contract's last call."""
+    computation = contract._computation
+    source_map = contract.source_map["pc_raw_ast_map"]
+    owner = {}
+    node = None
+    for pc in computation.code._trace:
+        node = source_map.get(pc, node)
+        owner.setdefault(pc, node)
+
+    gas = defaultdict(int)
+    for pc, used in computation._gas_meter._gas_used_of.items():
+        node = owner.get(pc)
+        if node is None:
+            gas[("", 0, DISPATCH, 0)] += used
+            continue
+        fn = node.get_ancestor(vy_ast.FunctionDef)
+        key = (node.module_node.resolved_path, node.lineno,
+               fn.name if fn is not None else DISPATCH, fn.lineno if fn is not None else 0)
+        gas[key] += used
+    return gas
+
+
+def profile_workload(contract, name: str, calls: int, seed: int) -> dict:
+    """Mean gas per call by function, section and line over `calls` random inputs."""
+    fn_name, sample, extra = WORKLOADS[name]
+    rng = random.Random(seed)
+    fn = getattr(contract, fn_name)
+
+    totals = defaultdict(int)
+    total_gas = 0
+    for _ in range(calls):
+        fn(sample(rng), *extra)
+        total_gas += contract._computation.get_gas_used()
+        for key, used in line_gas(contract).items():
+            totals[key] += used
+
+    lines = []
+    functions = defaultdict(float)
+    sections = defaultdict(float)
+    for key, used in sorted(totals.items(), key=lambda kv: -kv[1]):
+        path, lineno, function, fn_lineno = key
+        gas = used / calls
+        section = section_of(path, lineno, fn_lineno) if fn_lineno else ""
+        functions[function] += gas
+        sections[(function, section)] += gas
+        lines.append({
+            'module': Path(path).name if path else "",
+            'line': lineno,
+            'function': function,
+            'section': section,
+            'source': source_lines(path)[lineno - 1].strip() if path else "",
+            'gas': round(gas, 1),
+        })
+
+    return {
+        'calls': calls,
+        'gas_per_call': round(total_gas / calls, 1),
+        'functions': {k: round(v, 1) for k, v in sorted(functions.items(), key=lambda kv: -kv[1])},
+        'sections': [
+            {'function': f, 'section': s, 'gas': round(g, 1)}
+            for (f, s), g in sorted(sections.items(), key=lambda kv: -kv[1])
+        ],
+        'lines': lines,
+    }
+
+
+def bar(gas: float, total: float, width: int = 20) -> str:
+    return "#" * round(width * gas / total) if total else ""
+
+
+def print_profile(name: str, profile: dict, top: int) -> None:
+    total = profile['gas_per_call']
+    print(f"\n=== {name}: {total:.0f} gas/call over {profile['calls']} calls ===")
+
+    print(f"\n{'Function':<24} {'Gas':>8} {'Share':>6}")
+    for function, gas in profile['functions'].items():
+        print(f"{function:<24} {gas:>8.1f} {100 * gas / total:>5.1f}% {bar(gas, total)}")
+
+    print(f"\n{'Function':<24} {'Section':<50} {'Gas':>8} {'Share':>6}")
+    for s in profile['sections']:
+        print(f"{s['function']:<24} {s['section'][:50]:<50} {s['gas']:>8.1f} "
+              f"{100 * s['gas'] / total:>5.1f}% {bar(s['gas'], total)}")
+
+    print(f"\n{'Line':<22} {'Gas':>8} {'Share':>6}  Source")
+    for line in profile['lines'][:top]:
+        where = f"{line['module']}:{line['line']}" if line['module'] else DISPATCH
+        print(f"{where:<22} {line['gas']:>8.1f} {100 * line['gas'] / total:>5.1f}%  "
+              f"{line['source'][:70]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-line gas profile of gaussian.vy")
+    parser.add_argument("--venom", action="store_true", help="profile the Venom build")
+    parser.add_argument("--contract", default="gaussian.vy", help="source in src/")
+    parser.add_argument("--calls", type=int, default=200, help="random inputs per workload")
+    parser.add_argument("--top", type=int, default=15, help="lines printed per workload")
+    parser.add_argument("--workloads", nargs="*", default=list(WORKLOADS),
+                        choices=list(WORKLOADS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=Path("gas_profile.json"))
+    args = parser.parse_args()
+
+    boa.env.enable_gas_profiling()
+    gaussian = load_gaussian(args.venom, args.contract)
+
+    profiles = {}
+    for name in args.workloads:
+        profiles[name] = profile_workload(gaussian, name, args.calls, args.seed)
+        print_profile(name, profiles[name], args.top)
+
+    report = {
+        'contract': args.contract,
+        'build': 'venom' if args.venom else 'standard',
+        'calls': args.calls,
+        'seed': args.seed,
+        'workloads': profiles,
+    }
+    args.out.write_text(json.dumps(report, indent=2))
+    print(f"\nProfile: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
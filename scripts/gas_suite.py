@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Workload-driven gas benchmark for vygauss.
+
+Every input is drawn as a probability p from a named distribution and mapped to the input of
+each function that corresponds to p (cdf gets the p-quantile, erfinv gets 1 - 2p, ...), so
+one distribution describes the same workload for every function. Each call is tagged with the
+branch it takes, and gas is reported as percentiles per function and per branch for every
+build in gas_benchmark.BUILDS.
+
+Results are written as JSON. With --baseline the run is compared to a stored result file and
+the script exits with status 1 if any p50, p95 or max regresses by more than --threshold.
+
+Usage: python3 scripts/gas_suite.py [--calls N] [--builds B ...] [--distributions D ...]
+       [--out PATH] [--baseline PATH] [--threshold PCT]
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+from pathlib import Path
+from statistics import NormalDist
+
+from emulator import C
+from gas_benchmark import BUILDS, load_gaussian
+
+WAD = 10**18
+POW96 = 2**96
+
+ERFC_UPPER = C["ERFC_UPPER"]
+ERFINV_0_99 = C["ERFINV_0_99"]
+ERFINV_0_9999 = C["ERFINV_0_9999"]
+
+NORMAL = NormalDist()
+
+# Probability samplers, p in (0, 1)
+DISTRIBUTIONS = {
+    # Uniform in probability space
+    'uniform': lambda r: r.uniform(1e-9, 1 - 1e-9),
+    # Bulk of the distribution only
+    'central': lambda r: r.uniform(0.05, 0.95),
+    # Left tail, log-uniform in [1e-12, 0.05], like VaR and liquidation thresholds
+    'var': lambda r: 10 ** r.uniform(-12, math.log10(0.05)),
+    # Both tails
+    'tails': lambda r: (lambda p: p if r.random() < 0.5 else 1 - p)(10 ** r.uniform(-12, -1.3)),
+}
+
+# Statistics compared against a baseline
+GATED = ('p50', 'p95', 'max')
+
+
+def erfinv_branch(x96: int) -> str:
+    z = abs(x96)
+    if z < ERFINV_0_99:
+        return 'range1'
+    return 'range2' if z < ERFINV_0_9999 else 'range3'
+
+
+def erfc_branch(x96: int) -> str:
+    return 'rational' if abs(x96) < ERFC_UPPER else 'saturated'
+
+
+# function: (arguments for probability p, branch of those arguments)
+# Standard normal throughout: u = 0, o = 1
+FUNCTIONS = {
+    'erfc': (
+        lambda p: (int(-NORMAL.inv_cdf(p) / math.sqrt(2) * POW96),),
+        lambda x: erfc_branch(x),
+    ),
+    'erfinv': (
+        lambda p: (int((1 - 2 * p) * POW96),),
+        lambda x: erfinv_branch(x),
+    ),
+    'erfcinv': (
+        lambda p: (max(int(2 * p * WAD), 1),),
+        lambda x: erfinv_branch((WAD - x) * POW96 // WAD),
+    ),
+    'cdf': (
+        lambda p: (int(NORMAL.inv_cdf(p) * WAD), 0, WAD),
+        lambda x, u, o: erfc_branch((u - x) * POW96 * WAD // (o * C["SQRT2_WAD"])),
+    ),
+    'ppf': (
+        lambda p: (min(max(int(p * WAD), 1), WAD - 1), 0, WAD),
+        lambda x, u, o: erfinv_branch((WAD - 2 * x) * POW96 // WAD),
+    ),
+}
+
+
+def percentiles(gas: list) -> dict:
+    gas = sorted(gas)
+    n = len(gas)
+    return {
+        'calls': n,
+        'min': gas[0],
+        'p50': gas[(n - 1) // 2],
+        'p95': gas[min(math.ceil(0.95 * n) - 1, n - 1)],
+        'max': gas[-1],
+        'mean': round(sum(gas) / n, 1),
+    }
+
+
+def run_workload(gaussian, function: str, distribution: str, calls: int, seed: int) -> dict:
+    """Percentiles of `calls` calls, overall and per branch."""
+    to_args, branch_of = FUNCTIONS[function]
+    sample = DISTRIBUTIONS[distribution]
+    rng = random.Random(f"{seed}-{function}-{distribution}")
+    fn = getattr(gaussian, function)
+
+    gas = []
+    by_branch = {}
+    for _ in range(calls):
+        args = to_args(sample(rng))
+        fn(*args)
+        used = gaussian._computation.get_gas_used()
+        gas.append(used)
+        by_branch.setdefault(branch_of(*args), []).append(used)
+
+    return {
+        'all': percentiles(gas),
+        'branches': {b: percentiles(g) for b, g in sorted(by_branch.items())},
+    }
+
+
+def run(builds: list, distributions: list, calls: int, seed: int) -> dict:
+    results = {}
+    for build in builds:
+        contract, experimental_codegen = BUILDS[build]
+        gaussian = load_gaussian(experimental_codegen, contract)
+        results[build] = {
+            distribution: {
+                function: run_workload(gaussian, function, distribution, calls, seed)
+                for function in FUNCTIONS
+            }
+            for distribution in distributions
+        }
+    return results
+
+
+def print_results(results: dict) -> None:
+    for build, by_distribution in results.items():
+        for distribution, by_function in by_distribution.items():
+            print(f"\n=== {build} / {distribution} ===")
+            print(f"| {'Function':<20} | {'calls':>6} | {'p50':>6} | {'p95':>6} | {'max':>6} |")
+            print(f"|{'-' * 22}|{'-' * 8}|{'-' * 8}|{'-' * 8}|{'-' * 8}|")
+            for function, result in by_function.items():
+                rows = [(function, result['all'])]
+                rows += [(f"  {b}", s) for b, s in result['branches'].items()]
+                for name, s in rows:
+                    print(f"| {name:<20} | {s['calls']:>6} | {s['p50']:>6} | {s['p95']:>6} "
+                          f"| {s['max']:>6} |")
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Print gated statistics that changed, return the regressions beyond threshold percent."""
+    regressions = []
+    print(f"\n=== Baseline comparison (threshold {threshold}%) ===")
+    for build, by_distribution in results.items():
+        for distribution, by_function in by_distribution.items():
+            for function, result in by_function.items():
+                old = baseline.get(build, {}).get(distribution, {}).get(function)
+                if old is None:
+                    continue
+                pairs = [(function, result['all'], old['all'])]
+                pairs += [
+                    (f"{function}/{b}", s, old['branches'][b])
+                    for b, s in result['branches'].items() if b in old['branches']
+                ]
+                for name, new_stats, old_stats in pairs:
+                    for stat in GATED:
+                        before, after = old_stats[stat], new_stats[stat]
+                        if before == after:
+                            continue
+                        change = 100 * (after - before) / before
+                        regressed = change > threshold
+                        flag = "REGRESSION" if regressed else ""
+                        print(f"{build:<9} {distribution:<8} {name:<18} {stat:<4} "
+                              f"{before:>6} -> {after:>6} ({change:+.2f}%) {flag}")
+                        if regressed:
+                            regressions.append((build, distribution, name, stat, before, after))
+    if not regressions:
+        print("No regressions")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Workload-driven gas benchmark")
+    parser.add_argument("--calls", type=int, default=2000, help="calls per function and workload")
+    parser.add_argument("--builds", nargs="*", default=['standard', 'venom'], choices=list(BUILDS))
+    parser.add_argument("--distributions", nargs="*", default=list(DISTRIBUTIONS),
+                        choices=list(DISTRIBUTIONS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=Path("gas_suite.json"))
+    parser.add_argument("--baseline", type=Path, default=None,
+                        help="result file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.0,
+                        help="allowed p50/p95/max increase over the baseline, in percent")
+    args = parser.parse_args()
+
+    settings = {'calls': args.calls, 'seed': args.seed}
+    results = run(args.builds, args.distributions, args.calls, args.seed)
+    print_results(results)
+    args.out.write_text(json.dumps({'settings': settings, 'results': results}, indent=2))
+    print(f"\nResults: {args.out}")
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline['settings'] != settings:
+            print(f"Warning: baseline settings {baseline['settings']} differ from {settings}, "
+                  "inputs are not identical")
+        if compare(results, baseline['results'], args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
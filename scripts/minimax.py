@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Rational minimax fitting for the erfc / erfinv approximations in gaussian_core.vy.
+
+Fits P(x) / Q(x) of a chosen numerator and denominator degree to a target over an interval
+with the rational Remez algorithm (mpmath, on a dense Chebyshev-spaced grid), quantizes the
+coefficients to one of the two layouts the contract uses and measures the error of the
+quantized approximation with the contract's integer arithmetic:
+
+    q96  monic P and Q with 2^96 coefficients in 2^96 x, y = SCALE * num / den
+         (ERFC_NUM_*, ERFINV1_*, ERFINV2_*)
+    wad  WAD coefficients in 2^96 x, y = num * SCALE / den (ERFINV3_*, LOG_ERFC_*)
+
+Coefficients are emitted as magnitudes with a Horner snippet that adds or subtracts each
+one, like the existing constants, ready to paste into gaussian_core.vy. Gas is measured by
+compiling the snippet into a harness through the compilation cache, minus the gas of an
+identity call, so it is the cost of the approximation alone.
+
+With --pareto every degree pair in the --num / --den ranges is fitted and a table of degree
+vs max error vs gas is printed, with the pairs that no other pair beats on both marked.
+
+Usage: python3 scripts/minimax.py <target> [--num N] [--den M] [--a A] [--b B]
+       [--layout q96|wad] [--prefix NAME] [--pareto] [--venom] [--no-gas] [--out PATH]
+"""
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from mpmath import (mp, mpf, cos, eig, erfc, erfinv, exp, im, inverse, matrix, nint, pi, re,
+                    sqrt)
+
+mp.dps = 60
+
+WAD = 10**18
+POW96 = 2**96
+INT256_MAX = 2**255 - 1
+
+# Offset of r = sqrt(-ln((1 - z) / 2)) - 1.6 in the erfinv tail
+R_OFFSET = mpf("1.6")
+ERFC_UPPER = 321056282956553358679555000716
+ERFINV_0_99 = 76059036013693764089802192322
+ERFINV_0_9999 = 78435880889121694217608510832
+
+# Grid the Remez iterations run on, and the grid the quantized error is checked on
+FIT_POINTS = 2000
+CHECK_POINTS = 4000
+MAX_ITERATIONS = 60
+
+# Bound on the largest coefficient of the wad layout, about the magnitude of ERFINV3_NUM_5
+WAD_HEADROOM = 10**22
+
+HARNESS_FILENAME = Path(__file__).parent / "minimax_harness.vy"
+
+
+def _tail(r):
+    """erfinv as a function of the tail variable r, z = 1 - 2 * exp(-(r + 1.6)^2)."""
+    return erfinv(1 - 2 * exp(-(r + R_OFFSET) ** 2))
+
+
+def _log_erfc_tail(s):
+    """ln(erfc(z)) + z^2 + ln(z * sqrt(pi)) as a function of s = 1 / z^2, 0 at s = 0."""
+    if s == 0:
+        return mpf(0)
+    z = 1 / sqrt(s)
+    return mp.log(erfc(z) * z * sqrt(pi)) + z**2
+
+
+@dataclass(frozen=True)
+class Target:
+    function: Callable
+    # Interval in real units
+    a: float | str
+    b: float | str
+    layout: str
+    prefix: str
+    description: str
+    # Degrees of the shipped approximation
+    num: int
+    den: int
+
+
+TARGETS = {
+    'erfc': Target(erfc, 0, mpf(ERFC_UPPER) / POW96, 'q96', 'ERFC',
+                   "erfc(z), z in [0, ERFC_UPPER)", 11, 4),
+    'erfinv1': Target(erfinv, 0, mpf(ERFINV_0_99) / POW96, 'q96', 'ERFINV1',
+                      "erfinv(z), z in [0, ERFINV_0_99)", 8, 7),
+    'erfinv2': Target(erfinv, mpf(ERFINV_0_99) / POW96, mpf(ERFINV_0_9999) / POW96, 'q96',
+                      'ERFINV2', "erfinv(z), z in [ERFINV_0_99, ERFINV_0_9999)", 4, 4),
+    # l = -ln((1 - z) / 2) runs from -ln(0.005) at ERFINV_0_9999 to ln(2^97) at z = 1 - 2^-96
+    'erfinv3': Target(_tail, sqrt(-mp.log(mpf("0.005"))) - R_OFFSET,
+                      sqrt(97 * mp.log(2)) - R_OFFSET, 'wad', 'ERFINV3',
+                      "erfinv tail in r = sqrt(-ln((1 - z) / 2)) - 1.6", 7, 7),
+    # ln(erfc(z)) past z = 0.5, where the body's absolute erfc error is too large relative to erfc
+    'log_erfc': Target(_log_erfc_tail, 0, 4, 'wad', 'LOG_ERFC',
+                       "ln(erfc(z)) + z^2 + ln(z * sqrt(pi)) in s = 1 / z^2", 6, 6),
+}
+
+
+@dataclass
+class Fit:
+    """Real coefficients in x, constant term first, and the Remez error of the fit."""
+    p: list
+    q: list
+    error: mpf
+    iterations: int
+
+
+def _poly(coeffs: list, x):
+    y = mpf(0)
+    for c in reversed(coeffs):
+        y = y * x + c
+    return y
+
+
+def _chebyshev_points(a, b, n: int) -> list:
+    """n points in [a, b], dense towards the ends where minimax errors peak."""
+    return [(a + b) / 2 - (b - a) / 2 * cos(pi * i / (n - 1)) for i in range(n)]
+
+
+def _solve_reference(xs: list, fs: list, n: int, m: int) -> tuple:
+    """
+    P and Q with P(x_i) - (f_i + (-1)^i E) Q(x_i) = 0 on the reference, Q > 0 on it.
+
+    A generalized eigenproblem A c = E B c in c = (p, q). Every real E is a rational that
+    levels the error on the reference, and the one without a sign change of Q is kept.
+    """
+    k = n + m + 2
+    a, b = matrix(k, k), matrix(k, k)
+    for i, (x, f) in enumerate(zip(xs, fs)):
+        s = 1 if i % 2 == 0 else -1
+        for j in range(n + 1):
+            a[i, j] = x**j
+        for j in range(m + 1):
+            a[i, n + 1 + j] = -f * x**j
+            b[i, n + 1 + j] = s * x**j
+    eigenvalues, vectors = eig(inverse(a) * b)
+
+    candidates = []
+    for index, mu in enumerate(eigenvalues):
+        if abs(mu) == 0 or abs(im(mu)) > abs(mu) * mpf(10) ** -20:
+            continue
+        c = [re(vectors[j, index]) for j in range(k)]
+        p, q = c[:n + 1], c[n + 1:]
+        values = [_poly(q, x) for x in xs]
+        if min(values) > 0 or max(values) < 0:
+            sign = 1 if values[0] > 0 else -1
+            norm = sign * max(abs(v) for v in values)
+            candidates.append((abs(1 / re(mu)), [v / norm for v in p], [v / norm for v in q]))
+    if not candidates:
+        raise ValueError("no pole-free rational levels the reference")
+    error, p, q = min(candidates, key=lambda c: c[0])
+    return p, q, error
+
+
+def _extrema(errors: list, k: int) -> list:
+    """Indices of k sign-alternating local extrema of the error, largest kept."""
+    # One extremum per run of equal sign
+    runs = []
+    for i, e in enumerate(errors):
+        if runs and (e >= 0) == (errors[runs[-1]] >= 0):
+            if abs(e) > abs(errors[runs[-1]]):
+                runs[-1] = i
+        else:
+            runs.append(i)
+    # Drop the smallest extremum with a neighbour (keeps alternation), or an end
+    while len(runs) > k:
+        if len(runs) - k == 1:
+            runs.pop(0 if abs(errors[runs[0]]) < abs(errors[runs[-1]]) else -1)
+            continue
+        smallest = min(range(len(runs)), key=lambda j: abs(errors[runs[j]]))
+        if smallest in (0, len(runs) - 1):
+            runs.pop(smallest)
+        else:
+            neighbour = min(smallest - 1, smallest + 1, key=lambda j: abs(errors[runs[j]]))
+            for j in sorted((smallest, neighbour), reverse=True):
+                runs.pop(j)
+    return runs
+
+
+def _iterate(ts: list, fs: list, n: int, m: int, reference: list) -> tuple:
+    """Remez exchange from `reference`. (best (p, q, max error), its reference, iterations)."""
+    k = n + m + 2
+    best = None
+    for iteration in range(1, MAX_ITERATIONS + 1):
+        try:
+            p, q, level = _solve_reference([ts[i] for i in reference],
+                                           [fs[i] for i in reference], n, m)
+        except ZeroDivisionError:
+            break  # singular system, the reference has collapsed
+        except ValueError:
+            break
+        denominators = [_poly(q, t) for t in ts]
+        if min(denominators) <= 0:
+            break  # Q has a root between the reference points
+        errors = [f - _poly(p, t) / d for t, f, d in zip(ts, fs, denominators)]
+        worst = max(abs(e) for e in errors)
+        if best is None or worst < best[2]:
+            best = (p, q, worst, reference, iteration)
+        if worst <= level * (1 + mpf(10) ** -4):
+            break
+        new = _extrema(errors, k)
+        if len(new) < k or new == reference:
+            break
+        reference = new
+    return best
+
+
+def remez(f: Callable, a, b, n: int, m: int, points: int = FIT_POINTS) -> Fit:
+    """
+    Minimax P / Q of degrees (n, m) to f on [a, b], absolute error.
+
+    Works in t = (2x - a - b) / (b - a) for conditioning and converts to x at the end. The
+    first reference is the alternation set of the degree n + m polynomial, which has the
+    same number of points and keeps the first rational pole-free far more often than
+    Chebyshev points. Returns the best fit seen if the exchange does not converge.
+    """
+    a, b = mpf(a), mpf(b)
+    mid, half = (a + b) / 2, (b - a) / 2
+    ts = _chebyshev_points(mpf(-1), mpf(1), points)
+    fs = [f(mid + half * t) for t in ts]
+
+    k = n + m + 2
+    reference = [round((points - 1) * (1 - cos(pi * i / (k - 1))) / 2) for i in range(k)]
+    if m:
+        polynomial = _iterate(ts, fs, n + m, 0, reference)
+        if polynomial is not None:
+            reference = polynomial[3]
+    best = _iterate(ts, fs, n, m, reference)
+
+    if best is None:
+        raise ValueError(f"no pole-free fit of degree ({n}, {m}) on [{float(a)}, {float(b)}]")
+    p, q, worst, _, iteration = best
+    return Fit(_to_x(p, mid, half), _to_x(q, mid, half), worst, iteration)
+
+
+def _to_x(coeffs: list, mid, half) -> list:
+    """Coefficients of sum c_j t^j with t = (x - mid) / half, as a polynomial in x."""
+    result = [mpf(0)] * len(coeffs)
+    # (x - mid)^j / half^j expanded binomially
+    for j, c in enumerate(coeffs):
+        scale = c / half**j
+        binomial = 1
+        for i in range(j + 1):
+            result[i] += scale * binomial * (-mid) ** (j - i)
+            binomial = binomial * (j - i) // (i + 1)
+    return result
+
+
+@dataclass
+class Quantized:
+    """Integer constants of one layout. num / den are signed, highest degree first."""
+    layout: str
+    num: list
+    den: list
+    # SCALE for WAD output
+    scale: int
+
+
+def quantize(fit: Fit, layout: str) -> Quantized:
+    p = list(reversed(fit.p))
+    q = list(reversed(fit.q))
+    if layout == 'q96':
+        # Monic: the leading coefficient is carried by SCALE, the rest are 2^96 scaled
+        ratio = p[0] / q[0]
+        num = [int(nint(c / p[0] * POW96)) for c in p[1:]]
+        den = [int(nint(c / q[0] * POW96)) for c in q[1:]]
+        return Quantized(layout, num, den, int(nint(ratio * WAD)))
+    if layout == 'wad':
+        # Common factor of P and Q cancels. A power of two keeps the largest constant within
+        # WAD_HEADROOM without pinning it to a round 10^22
+        largest = max(abs(c) for c in p + q)
+        norm = mpf(2) ** int(mp.floor(mp.log(WAD_HEADROOM / largest, 2)))
+        num = [int(nint(c * norm)) for c in p]
+        den = [int(nint(c * norm)) for c in q]
+        return Quantized(layout, num, den, WAD)
+    raise ValueError(f"unknown layout {layout}")
+
+
+def _sar(x: int) -> int:
+    """x >> 96 on a signed value, floors like the EVM's SAR."""
+    return x >> 96
+
+
+def _sdiv(a: int, b: int) -> int:
+    """EVM SDIV, truncates towards zero."""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+
+def evaluate(constants: Quantized, x: int, scale: int) -> int:
+    """The emitted Horner snippet with the EVM's integer semantics, x 2^96 scaled."""
+    intermediates = []
+    if constants.layout == 'q96':
+        num = x + constants.num[0] if constants.num else POW96
+        for c in constants.num[1:]:
+            num = _sar(num * x) + c
+            intermediates.append(num * x)
+        den = x + constants.den[0] if constants.den else POW96
+        for c in constants.den[1:]:
+            den = _sar(den * x) + c
+            intermediates.append(den * x)
+        intermediates.append(scale * num)
+        y = _sdiv(scale * num, den)
+    else:
+        num = constants.num[0]
+        for c in constants.num[1:]:
+            num = _sar(num * x) + c
+            intermediates.append(num * x)
+        den = constants.den[0]
+        for c in constants.den[1:]:
+            den = _sar(den * x) + c
+            intermediates.append(den * x)
+        intermediates.append(num * scale)
+        y = _sdiv(num * scale, den)
+    if any(abs(v) > INT256_MAX for v in intermediates):
+        raise OverflowError(f"int256 overflow at x = {x}")
+    return y
+
+
+def quantized_error(target: Target, constants: Quantized, a, b,
+                    points: int = CHECK_POINTS) -> tuple:
+    """(max absolute error in real units, worst 2^96 input) of the WAD output on [a, b)."""
+    low, high = int(nint(mpf(a) * POW96)), int(nint(mpf(b) * POW96)) - 1
+    worst, worst_x = mpf(0), low
+    inputs = {int(nint(x)) for x in _chebyshev_points(mpf(low), mpf(high), points)}
+    for x in sorted(inputs):
+        expected = target.function(mpf(x) / POW96) * WAD
+        error = abs(evaluate(constants, x, constants.scale) - expected)
+        if error > worst:
+            worst, worst_x = error, x
+    return float(worst / WAD), worst_x
+
+
+def _name(prefix: str, kind: str, i: int) -> str:
+    return f"{prefix}_{kind}_{i}"
+
+
+def _horner(variable: str, name: str, prefix: str, kind: str, coefficients: list,
+            monic: bool) -> list:
+    """Horner lines in the style of gaussian_core.vy, subtracting negative coefficients."""
+    def step(previous: str, i: int, c: int) -> str:
+        op = "unsafe_sub" if c < 0 else "unsafe_add"
+        return f"{op}((unsafe_mul({previous}, {variable}) >> POW), {_name(prefix, kind, i)})"
+
+    if monic:
+        if not coefficients:
+            return [f"{name}: int256 = POW96_VAL"]
+        op = "unsafe_sub" if coefficients[0] < 0 else "unsafe_add"
+        lines = [f"{name}: int256 = {op}({variable}, {_name(prefix, kind, 0)})"]
+        rest = enumerate(coefficients[1:], start=1)
+    else:
+        lines = [f"{name}: int256 = {_name(prefix, kind, 0)}"]
+        rest = enumerate(coefficients[1:], start=1)
+        if coefficients[0] < 0:
+            lines = [f"{name}: int256 = -{_name(prefix, kind, 0)}"]
+    lines += [f"{name} = {step(name, i, c)}" for i, c in rest]
+    return lines
+
+
+def vyper_constants(prefix: str, constants: Quantized) -> list:
+    lines = [f"# {prefix} coefficients - numerator"]
+    lines += [f"{_name(prefix, 'NUM', i)}: constant(int256) = {abs(c)}"
+              for i, c in enumerate(constants.num)]
+    lines += ["", f"# {prefix} coefficients - denominator"]
+    lines += [f"{_name(prefix, 'DEN', i)}: constant(int256) = {abs(c)}"
+              for i, c in enumerate(constants.den)]
+    lines += [
+        "",
+        f"{prefix}_SCALE: constant(int256) = {constants.scale}",
+    ]
+    return lines
+
+
+def vyper_snippet(prefix: str, constants: Quantized, variable: str = "z",
+                  scale: str = "SCALE") -> list:
+    monic = constants.layout == 'q96'
+    lines = _horner(variable, "num", prefix, "NUM", constants.num, monic)
+    lines += [""]
+    lines += _horner(variable, "denom", prefix, "DEN", constants.den, monic)
+    lines += [""]
+    if monic:
+        lines += [f"y = unsafe_div(unsafe_mul({prefix}_{scale}, num), denom)"]
+    else:
+        lines += [f"y = unsafe_div(unsafe_mul(num, {prefix}_{scale}), denom)"]
+    return lines
+
+
+def harness(prefix: str, constants: Quantized) -> str:
+    """Contract with the snippet as evaluate(x) and an identity call to subtract."""
+    snippet = vyper_snippet(prefix, constants, "x")
+    body = "\n".join(f"    {line}" if line else "" for line in snippet)
+    return "\n".join([
+        "# @version ^0.4.0",
+        "",
+        "POW: constant(uint256) = 96",
+        "POW96_VAL: constant(int256) = 79228162514264337593543950336",
+        *vyper_constants(prefix, constants),
+        "",
+        "",
+        "@external",
+        "@pure",
+        "def evaluate(x: int256) -> int256:",
+        "    y: int256 = 0",
+        body,
+        "    return y",
+        "",
+        "",
+        "@external",
+        "@pure",
+        "def identity(x: int256) -> int256:",
+        "    return x",
+        "",
+    ])
+
+
+def measure_gas(prefix: str, constants: Quantized, x: int, venom: bool = False) -> int:
+    import boa
+    import compile_cache
+
+    contract = compile_cache.loads(harness(prefix, constants), filename=HARNESS_FILENAME,
+                                   experimental_codegen=venom or None)
+    gas = []
+    for function in (contract.evaluate, contract.identity):
+        calldata = function.prepare_calldata(x)
+        computation = boa.env.execute_code(to_address=contract.address, data=calldata)
+        assert not computation.is_error, f"harness reverted at x = {x}"
+        gas.append(computation.get_gas_used())
+    return gas[0] - gas[1]
+
+
+def fit_and_check(target: Target, n: int, m: int, a, b, layout: str, prefix: str,
+                  gas: bool, venom: bool) -> dict:
+    fit = remez(target.function, a, b, n, m)
+    constants = quantize(fit, layout)
+    row = {'num': n, 'den': m, 'remez_error': float(fit.error), 'iterations': fit.iterations}
+    try:
+        row['max_error'], row['worst_input'] = quantized_error(target, constants, a, b)
+    except OverflowError as e:
+        row['max_error'], row['worst_input'] = None, str(e)
+    row['gas'] = None
+    if gas and row['max_error'] is not None:
+        row['gas'] = measure_gas(prefix, constants, int(nint((mpf(a) + mpf(b)) / 2 * POW96)),
+                                 venom)
+    row['constants'] = {'num': constants.num, 'den': constants.den, 'scale': constants.scale}
+    return row, constants
+
+
+def pareto(rows: list) -> list:
+    """Rows with a quantized error and gas that no other row matches or beats on both."""
+    valid = [r for r in rows if r['max_error'] is not None and r['gas'] is not None]
+    front = []
+    for r in valid:
+        dominated = any(
+            o is not r and o['max_error'] <= r['max_error'] and o['gas'] <= r['gas']
+            and (o['max_error'] < r['max_error'] or o['gas'] < r['gas'])
+            for o in valid
+        )
+        if not dominated:
+            front.append(r)
+    return front
+
+
+def print_table(rows: list, front: list) -> None:
+    print(f"| {'num':>3} | {'den':>3} | {'remez error':>11} | {'max error':>9} | {'gas':>5} | "
+          f"{'pareto':<6} |")
+    print(f"|{'-' * 5}|{'-' * 5}|{'-' * 13}|{'-' * 11}|{'-' * 7}|{'-' * 8}|")
+    for r in sorted(rows, key=lambda r: (r['gas'] is None, r['gas'] or 0, r['num'], r['den'])):
+        error = f"{r['max_error']:.2e}" if r['max_error'] is not None else "overflow"
+        gas = r['gas'] if r['gas'] is not None else "-"
+        mark = "*" if any(r is f for f in front) else ""
+        print(f"| {r['num']:>3} | {r['den']:>3} | {r['remez_error']:>11.2e} | {error:>9} | "
+              f"{gas:>5} | {mark:<6} |")
+
+
+def degrees(spec: str) -> list:
+    """'5' or '3-8'."""
+    low, _, high = spec.partition("-")
+    return list(range(int(low), int(high or low) + 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rational minimax coefficients for gaussian_core")
+    parser.add_argument("target", choices=list(TARGETS))
+    parser.add_argument("--num", default=None,
+                        help="numerator degree, or a range like 3-8 (default: shipped degree)")
+    parser.add_argument("--den", default=None,
+                        help="denominator degree, or a range like 0-4 (default: shipped degree)")
+    parser.add_argument("--a", type=mpf, default=None, help="interval start, real units")
+    parser.add_argument("--b", type=mpf, default=None, help="interval end, real units")
+    parser.add_argument("--layout", choices=['q96', 'wad'], default=None)
+    parser.add_argument("--prefix", default=None, help="constant name prefix")
+    parser.add_argument("--pareto", action="store_true", help="fit every degree pair")
+    parser.add_argument("--venom", action="store_true",
+                        help="measure gas with experimental codegen")
+    parser.add_argument("--no-gas", action="store_true", help="skip the gas measurement")
+    parser.add_argument("--out", type=Path, default=None, help="write the rows as JSON")
+    args = parser.parse_args()
+
+    target = TARGETS[args.target]
+    a = target.a if args.a is None else args.a
+    b = target.b if args.b is None else args.b
+    layout = args.layout or target.layout
+    prefix = args.prefix or target.prefix
+    # --pareto sweeps every pair up to the shipped degrees by default
+    low_num, low_den = (2, 0) if args.pareto else (target.num, target.den)
+    nums = degrees(args.num or f"{low_num}-{target.num}")
+    dens = degrees(args.den or f"{low_den}-{target.den}")
+
+    print(f"# {target.description}, [{float(a):.6g}, {float(b):.6g}], {layout} layout")
+    rows = []
+    constants = None
+    for n in nums:
+        for m in dens:
+            try:
+                row, constants = fit_and_check(target, n, m, a, b, layout, prefix,
+                                               not args.no_gas, args.venom)
+            except (ValueError, ZeroDivisionError) as e:
+                print(f"# ({n}, {m}): {e}")
+                continue
+            rows.append(row)
+
+    if args.pareto or len(rows) > 1:
+        print_table(rows, pareto(rows))
+    elif rows:
+        row = rows[0]
+        gas = f", {row['gas']} gas" if row['gas'] is not None else ""
+        error = f"{row['max_error']:.2e}" if row['max_error'] is not None else "overflow"
+        print(f"# degree ({row['num']}, {row['den']}): remez error {row['remez_error']:.2e}, "
+              f"quantized max error {error}{gas}")
+        print("\n".join(vyper_constants(prefix, constants)))
+        print()
+        print("\n".join(vyper_snippet(prefix, constants)))
+
+    if args.out is not None:
+        args.out.write_text(json.dumps(rows, indent=2, default=str))
+        print(f"\nResults: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Persistent batch mode for the reference oracles in scripts/reference_oracles.py.
+
+Requests are newline-delimited, a function name (erfc, erfinv, erfcinv, cdf, ppf) and its
+decimal arguments separated by spaces:
+
+    cdf 1000000000000000000 0 1000000000000000000
+
+Every request gets one response line, in order: the hex word the one-shot CLI prints, or
+"error: <message>". Blank lines are ignored. The server reads stdin by default, or accepts
+connections on a Unix socket (--socket) or a localhost TCP port (--port), each connection
+being a stream of requests. With --workers N requests are evaluated on a process pool.
+
+The one-shot CLIs (cdf.py, ppf.py, erfc.py, erfinv.py, erfcinv.py) are thin clients: with
+VYGAUSS_ORACLE set to a socket path or host:port they forward the call to a running server
+and never import mpmath, otherwise (or if the server is unreachable) they evaluate
+in-process. Interpreter start plus the mpmath import is most of a one-shot call.
+
+`benchmark` measures calls per second of the one-shot CLI, the thin client against a socket
+server and stdin batch mode with one and --workers processes.
+
+Usage: python3 scripts/oracle_server.py serve [--socket PATH | --port N] [--workers N]
+       [--chunksize N]
+       python3 scripts/oracle_server.py benchmark [--calls N] [--cli-calls N] [--workers N]
+"""
+
+import argparse
+import os
+import random
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing.pool import Pool
+from pathlib import Path
+
+# Socket path or host:port of a running server, read by the thin clients
+ENV_ADDRESS = "VYGAUSS_ORACLE"
+
+SCRIPTS_DIR = Path(__file__).parent
+
+WAD = 10**18
+
+
+def handle(line: str) -> str:
+    """Response to one request line."""
+    # Imported here so the thin clients, which only forward requests, skip mpmath
+    import reference_oracles
+
+    function, *args = line.split()
+    try:
+        return reference_oracles.evaluate(function, args)
+    except KeyError:
+        return f"error: unknown function {function}"
+    except Exception as e:
+        return f"error: {type(e).__name__}: {e}"
+
+
+def respond(lines, write, pool: Pool | None = None, chunksize: int = 1) -> int:
+    """Write one response per non-blank request line, in order. Returns the request count."""
+    requests = (line for line in lines if line.strip())
+    results = pool.imap(handle, requests, chunksize) if pool else map(handle, requests)
+    count = 0
+    for result in results:
+        write(result + "\n")
+        count += 1
+    return count
+
+
+def serve_stdin(pool: Pool | None, chunksize: int) -> None:
+    def write(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    respond(sys.stdin, write, pool, chunksize)
+
+
+def _handler(pool: Pool | None, chunksize: int):
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            lines = (line.decode() for line in self.rfile)
+            respond(lines, lambda text: self.wfile.write(text.encode()), pool, chunksize)
+
+    return Handler
+
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def serve_socket(address: str | int, pool: Pool | None, chunksize: int) -> None:
+    """Serve a Unix socket path, or a localhost port when `address` is an int."""
+    handler = _handler(pool, chunksize)
+    if isinstance(address, int):
+        server = TCPServer(("127.0.0.1", address), handler)
+    else:
+        Path(address).unlink(missing_ok=True)
+        server = UnixServer(address, handler)
+    with server:
+        print(f"Serving on {address}", file=sys.stderr, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if not isinstance(address, int):
+                Path(address).unlink(missing_ok=True)
+
+
+def connect(address: str, timeout: float | None = None) -> socket.socket:
+    """Socket to a server at a Unix socket path or host:port."""
+    host, _, port = address.rpartition(":")
+    if host and port.isdigit():
+        return socket.create_connection((host, int(port)), timeout=timeout)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    sock.connect(address)
+    return sock
+
+
+def call(function: str, args: list, address: str | None = None) -> str:
+    """
+    Hex word of one oracle call, from the server at `address` (default $VYGAUSS_ORACLE).
+
+    Falls back to evaluating in-process when no address is set or the server is unreachable.
+    Raises ValueError with the server's message for a request it rejects.
+    """
+    address = address or os.environ.get(ENV_ADDRESS)
+    if address:
+        try:
+            with connect(address) as sock:
+                sock.sendall(f"{function} {' '.join(args)}\n".encode())
+                response = sock.makefile().readline().strip()
+        except OSError:
+            response = ""
+        if response.startswith("error: "):
+            raise ValueError(response.removeprefix("error: "))
+        if response:
+            return response
+
+    import reference_oracles
+    return reference_oracles.evaluate(function, args)
+
+
+def requests(count: int, seed: int = 0) -> list:
+    """Request lines cycling through every oracle, with inputs where each is defined."""
+    rng = random.Random(seed)
+    makers = [
+        lambda: f"erfc {rng.randint(-5 * WAD, 5 * WAD)}",
+        lambda: f"erfinv {rng.randint(-WAD + 1, WAD - 1)}",
+        lambda: f"erfcinv {rng.randint(1, 2 * WAD - 1)}",
+        lambda: f"cdf {rng.randint(-10 * WAD, 10 * WAD)} {rng.randint(-WAD, WAD)} "
+                f"{rng.randint(WAD // 10, 10 * WAD)}",
+        lambda: f"ppf {rng.randint(1, WAD - 1)} {rng.randint(-WAD, WAD)} "
+                f"{rng.randint(WAD // 10, 10 * WAD)}",
+    ]
+    return [makers[i % len(makers)]() for i in range(count)]
+
+
+def _one_shot(lines: list, env: dict) -> list:
+    results = []
+    for line in lines:
+        function, *args = line.split()
+        out = subprocess.run([sys.executable, str(SCRIPTS_DIR / f"{function}.py"), *args],
+                             env=env, capture_output=True, text=True, check=True)
+        results.append(out.stdout.strip())
+    return results
+
+
+def _batch(lines: list, workers: int, chunksize: int) -> list:
+    command = [sys.executable, __file__, "serve", "--workers", str(workers),
+               "--chunksize", str(chunksize)]
+    out = subprocess.run(command, input="\n".join(lines) + "\n", capture_output=True, text=True,
+                         check=True)
+    return out.stdout.split()
+
+
+def _wait_for(address: str, server: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"oracle server exited with {server.returncode}")
+        try:
+            connect(address, timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError(f"oracle server not listening on {address}")
+
+
+def benchmark(calls: int, cli_calls: int, workers: int, chunksize: int) -> list:
+    """(mode, calls, seconds) per mode. Every mode must return the one-shot results."""
+    lines = requests(calls)
+    sample = lines[:cli_calls]
+    env = {k: v for k, v in os.environ.items() if k != ENV_ADDRESS}
+    rows = []
+
+    started = time.perf_counter()
+    expected = _one_shot(sample, env)
+    rows.append(("one-shot CLI", cli_calls, time.perf_counter() - started))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        address = str(Path(tmp) / "oracle.sock")
+        server = subprocess.Popen([sys.executable, __file__, "serve", "--socket", address],
+                                  stderr=subprocess.DEVNULL)
+        try:
+            _wait_for(address, server)
+            started = time.perf_counter()
+            results = _one_shot(sample, {**env, ENV_ADDRESS: address})
+            rows.append(("thin CLI + socket server", cli_calls, time.perf_counter() - started))
+            assert results == expected, "socket server results differ from the one-shot CLI"
+        finally:
+            server.terminate()
+            server.wait()
+
+    for n in sorted({1, workers}):
+        started = time.perf_counter()
+        results = _batch(lines, n, chunksize)
+        rows.append((f"stdin batch, {n} worker{'s' if n > 1 else ''}", calls,
+                     time.perf_counter() - started))
+        assert results[:cli_calls] == expected, "batch results differ from the one-shot CLI"
+    return rows
+
+
+def print_benchmark(rows: list) -> None:
+    base = rows[0][1] / rows[0][2]
+    print(f"| {'Mode':<26} | {'calls':>6} | {'seconds':>8} | {'calls/s':>8} | {'speedup':>7} |")
+    print(f"|{'-' * 28}|{'-' * 8}|{'-' * 10}|{'-' * 10}|{'-' * 9}|")
+    for mode, calls, seconds in rows:
+        rate = calls / seconds
+        print(f"| {mode:<26} | {calls:>6} | {seconds:>8.2f} | {rate:>8.0f} | "
+              f"{rate / base:>6.1f}x |")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent batch mode for the reference oracles")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="answer requests from stdin or a socket")
+    where = serve.add_mutually_exclusive_group()
+    where.add_argument("--socket", default=None, help="Unix socket path")
+    where.add_argument("--port", type=int, default=None, help="localhost TCP port")
+    serve.add_argument("--workers", type=int, default=1, help="evaluation processes")
+    serve.add_argument("--chunksize", type=int, default=1,
+                       help="requests per pool task; above 1 a chunk waits for that many lines")
+
+    bench = commands.add_parser("benchmark", help="throughput of every mode")
+    bench.add_argument("--calls", type=int, default=5000, help="requests in batch mode")
+    bench.add_argument("--cli-calls", type=int, default=50, help="CLI processes per CLI mode")
+    bench.add_argument("--workers", type=int, default=os.cpu_count())
+    bench.add_argument("--chunksize", type=int, default=64)
+    args = parser.parse_args()
+
+    if args.command == "benchmark":
+        print_benchmark(benchmark(args.calls, args.cli_calls, args.workers, args.chunksize))
+        return
+
+    pool = Pool(args.workers) if args.workers > 1 else None
+    try:
+        if args.socket is not None or args.port is not None:
+            serve_socket(args.port if args.port is not None else args.socket, pool,
+                         args.chunksize)
+        else:
+            serve_stdin(pool, args.chunksize)
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
+if __name__ == "__main__":
+    main()
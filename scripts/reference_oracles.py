@@ -0,0 +1,78 @@
+"""
+mpmath oracles behind the erfc, erfinv, erfcinv, cdf and ppf CLIs.
+
+Each oracle takes the CLI's decimal string arguments and returns the 32-byte hex word the
+CLI prints, two's complement for negative results. The arithmetic is unchanged from the
+original one-shot scripts, including ppf, erfinv and erfcinv returning 0 where mpmath fails
+and ppf / erfcinv parsing their inputs as floats, so results are bit-identical to the values
+Foundry fuzz campaigns were recorded against.
+"""
+
+from mpmath import erf, erfinv, fabs, floor, mpf, sqrt, workdps
+
+# Precision the one-shot scripts always ran at (mpmath's default)
+DPS = 15
+
+
+def word(value: int) -> str:
+    if value < 0:
+        value = (1 << 256) + value
+    return f"0x{value:064x}"
+
+
+def erfc(x):
+    return mpf(1) - erf(x)
+
+
+def cdf(x, u, o):
+    z = -(x - u) / (o * sqrt(2))
+    return erfc(z) / mpf(2)
+
+
+def erfc_word(x: str) -> str:
+    return word(int(floor(erfc(mpf(x) / 10**18) * 10**18)))
+
+
+def erfinv_word(x: str) -> str:
+    try:
+        result = int(floor(erfinv(mpf(x) / 10**18) * 10**18))
+    except Exception:
+        result = 0
+    return word(result)
+
+
+def erfcinv_word(x: str) -> str:
+    try:
+        result = int(floor(erfinv(1 - int(x) / 10**18) * 10**18))
+    except Exception:
+        result = 0
+    return word(result)
+
+
+def cdf_word(x: str, u: str, o: str) -> str:
+    x, u, o = (mpf(v) / 10**18 for v in (x, u, o))
+    return word(int(floor(fabs(cdf(x, u, o)) * 10**18)))
+
+
+def ppf_word(x: str, u: str, o: str) -> str:
+    x, u, o = (int(v) / 10**18 for v in (x, u, o))
+    try:
+        result = int(floor((u - o * sqrt(2) * erfinv(1 - (2 * x))) * 10**18))
+    except Exception:
+        result = 0
+    return word(result)
+
+
+ORACLES = {
+    'erfc': erfc_word,
+    'erfinv': erfinv_word,
+    'erfcinv': erfcinv_word,
+    'cdf': cdf_word,
+    'ppf': ppf_word,
+}
+
+
+def evaluate(function: str, args: list) -> str:
+    """Hex word of one oracle call. Raises KeyError, TypeError or ValueError on bad input."""
+    with workdps(DPS):
+        return ORACLES[function](*args)
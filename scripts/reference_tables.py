@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Golden mpmath reference tables for the accuracy tests.
+
+A grid is `num` evenly spaced integer inputs from `start` to `stop` (inclusive) for one
+function, in the contract's input scaling: 2^96 for erfc and erfinv, WAD for erfcinv, cdf,
+pdf, ppf, log_cdf, log_sf and ln_wad. cdf, pdf, ppf, log_cdf and log_sf also take the grid's
+(u, o). Expected values are floor(f(x) * 1e18) computed at `dps` digits. A grid with num = 1
+is a single cached value, which the tests use for their known-value cases.
+
+Tables are computed in parallel over a process pool and cached as .npz files of fixed-width
+32-byte two's complement integers. The file name is a hash of the grid spec and the
+precision, so a changed grid or dps never reuses a stale table.
+
+Usage: python3 scripts/reference_tables.py <function> <start> <stop> <num> [--u U] [--o O]
+       [--dps DPS] [--workers N] [--cache-dir DIR]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from mpmath import erf, erfc, erfinv, exp, floor, log, mp, mpf, pi, sqrt
+
+WAD = 10**18
+POW96 = 2**96
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "tests" / ".reference_tables"
+
+# Bumped whenever the reference definitions below change, invalidates every cached table
+FORMAT_VERSION = 1
+
+# Input scaling per function
+INPUT_SCALE = {
+    "erfc": POW96,
+    "erfinv": POW96,
+    "erfcinv": WAD,
+    "cdf": WAD,
+    "pdf": WAD,
+    "ppf": WAD,
+    "log_cdf": WAD,
+    "log_sf": WAD,
+    "ln_wad": WAD,
+}
+
+
+@dataclass(frozen=True)
+class Grid:
+    function: str
+    start: int
+    stop: int
+    num: int
+    u: int = 0
+    o: int = WAD
+    dps: int = 50
+
+    def key(self) -> str:
+        """Hash of the spec and FORMAT_VERSION, used as the cache file name."""
+        spec = json.dumps({**asdict(self), "version": FORMAT_VERSION}, sort_keys=True)
+        return f"{self.function}-{hashlib.sha256(spec.encode()).hexdigest()[:16]}"
+
+    def inputs(self) -> list:
+        if self.num == 1:
+            return [self.start]
+        span = self.stop - self.start
+        return [self.start + span * i // (self.num - 1) for i in range(self.num)]
+
+
+def reference(function: str, x: int, u: int, o: int):
+    """f(x) as an mpf at the current mp.dps, inputs in the contract's scaling."""
+    x_f = mpf(x) / INPUT_SCALE[function]
+    if function == "erfc":
+        return 1 - erf(x_f)
+    if function == "erfinv":
+        return erfinv(x_f)
+    if function == "erfcinv":
+        return erfinv(1 - x_f)
+    if function == "ln_wad":
+        return log(x_f)
+    u_f = mpf(u) / WAD
+    o_f = mpf(o) / WAD
+    if function == "cdf":
+        return (1 - erf((u_f - x_f) / (o_f * sqrt(2)))) / 2
+    if function == "pdf":
+        return exp(-(((x_f - u_f) / o_f) ** 2) / 2) / (o_f * sqrt(2 * pi))
+    if function == "ppf":
+        return u_f - o_f * sqrt(2) * erfinv(1 - 2 * x_f)
+    # erfc rather than 1 - erf, which cancels to 0 in the far tail
+    if function == "log_cdf":
+        return log(erfc((u_f - x_f) / (o_f * sqrt(2))) / 2)
+    if function == "log_sf":
+        return log(erfc((x_f - u_f) / (o_f * sqrt(2))) / 2)
+    raise ValueError(f"unknown function {function}")
+
+
+def _compute_chunk(args: tuple) -> list:
+    grid, xs = args
+    mp.dps = grid.dps
+    return [int(floor(reference(grid.function, x, grid.u, grid.o) * WAD)) for x in xs]
+
+
+def generate(grid: Grid, workers: int | None = None) -> tuple:
+    """(inputs, expected) as lists of Python ints, chunks computed in a process pool."""
+    if grid.function not in INPUT_SCALE:
+        raise ValueError(f"unknown function {grid.function}")
+    xs = grid.inputs()
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, -(-len(xs) // (4 * workers)))
+    chunks = [(grid, xs[i : i + chunk]) for i in range(0, len(xs), chunk)]
+    # A single-value grid is not worth starting a pool for
+    workers = min(workers, len(chunks))
+    if workers == 1:
+        results = map(_compute_chunk, chunks)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_compute_chunk, chunks))
+    return xs, [y for part in results for y in part]
+
+
+def encode_ints(values: list) -> np.ndarray:
+    """(n, 32) uint8 array of big-endian two's complement int256."""
+    raw = b"".join(v.to_bytes(32, "big", signed=True) for v in values)
+    return np.frombuffer(raw, dtype=np.uint8).reshape(len(values), 32)
+
+
+def decode_int(row: np.ndarray) -> int:
+    return int.from_bytes(row.tobytes(), "big", signed=True)
+
+
+class ReferenceTable:
+    """Encoded table, rows are decoded to Python ints only when accessed."""
+
+    def __init__(self, grid: Grid, inputs: np.ndarray, expected: np.ndarray):
+        self.grid = grid
+        self._inputs = inputs
+        self._expected = expected
+
+    def __len__(self) -> int:
+        return len(self._inputs)
+
+    def __getitem__(self, i: int) -> tuple:
+        return decode_int(self._inputs[i]), decode_int(self._expected[i])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def chunks(self, size: int):
+        """Lists of (x, expected) pairs of at most `size` rows, e.g. for the *_batch externals."""
+        for start in range(0, len(self), size):
+            yield [self[i] for i in range(start, min(start + size, len(self)))]
+
+
+def load(grid: Grid, cache_dir: Path = DEFAULT_CACHE_DIR, workers: int | None = None):
+    """Table for `grid` from the cache, generated and stored first if it is missing."""
+    path = Path(cache_dir) / f"{grid.key()}.npz"
+    if not path.exists():
+        xs, ys = generate(grid, workers)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so parallel test workers never read a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp, inputs=encode_ints(xs), expected=encode_ints(ys))
+        tmp.replace(path)
+    data = np.load(path)
+    return ReferenceTable(grid, data["inputs"], data["expected"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a cached mpmath reference table")
+    parser.add_argument("function", choices=sorted(INPUT_SCALE))
+    parser.add_argument("start", type=int)
+    parser.add_argument("stop", type=int)
+    parser.add_argument("num", type=int)
+    parser.add_argument("--u", type=int, default=0)
+    parser.add_argument("--o", type=int, default=WAD)
+    parser.add_argument("--dps", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    grid = Grid(args.function, args.start, args.stop, args.num, args.u, args.o, args.dps)
+    table = load(grid, args.cache_dir, args.workers)
+    print(f"{args.cache_dir / grid.key()}.npz: {len(table)} points")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# @version ^0.4.0
+
+# vygauss: Black-Scholes pricer for European options
+# Built on the gaussian_core.vy internals, ln(S/K), sigma * sqrt(T) and d1/d2 are computed once per call
+
+import gaussian_core
+
+ONE_SIGNED: constant(int256) = gaussian_core.ONE_SIGNED
+
+
+@internal
+@pure
+def _black_scholes(s: uint256, k: uint256, t: uint256, v: uint256, r: int256) -> (int256, int256, int256, int256, int256):
+    """
+    @notice Shared Black-Scholes work for call, put and greeks
+    @dev All values in WAD. Returns (call, put, N(d1), -d1 / sqrt(2) scaled by 2^96, sqrt(T))
+    """
+    spot: int256 = convert(s, int256)
+    strike: int256 = convert(k, int256)
+    vol: int256 = convert(v, int256)
+    time: int256 = convert(t, int256)
+
+    sqrt_t: int256 = convert(gaussian_core._sqrt(unsafe_mul(t, gaussian_core.ONE)), int256)
+    vol_sqrt_t: int256 = unsafe_div(unsafe_mul(vol, sqrt_t), ONE_SIGNED)
+    assert vol_sqrt_t > 0, "zero volatility or time"
+
+    # d1 = (ln(S / K) + (r + sigma^2 / 2) * T) / (sigma * sqrt(T)), d2 = d1 - sigma * sqrt(T)
+    ln_sk: int256 = gaussian_core._ln_wad(unsafe_div(unsafe_mul(spot, ONE_SIGNED), strike))
+    drift: int256 = unsafe_add(r, unsafe_div(unsafe_mul(vol, vol), 2 * ONE_SIGNED))
+    d1: int256 = unsafe_div(unsafe_mul(unsafe_add(ln_sk, unsafe_div(unsafe_mul(drift, time), ONE_SIGNED)), ONE_SIGNED), vol_sqrt_t)
+    d2: int256 = unsafe_sub(d1, vol_sqrt_t)
+
+    # N(d) = erfc(-d / sqrt(2)) / 2
+    z1: int256 = unsafe_div(unsafe_mul(-d1, gaussian_core.INV_SQRT2_96), ONE_SIGNED)
+    z2: int256 = unsafe_div(unsafe_mul(-d2, gaussian_core.INV_SQRT2_96), ONE_SIGNED)
+    n_d1: int256 = convert(gaussian_core._erfc_internal(z1) >> 1, int256)
+    n_d2: int256 = convert(gaussian_core._erfc_internal(z2) >> 1, int256)
+
+    # Discounted strike K * e^(-rT)
+    discount: int256 = gaussian_core._exp_wad(-unsafe_div(unsafe_mul(r, time), ONE_SIGNED))
+    strike_pv: int256 = unsafe_div(unsafe_mul(strike, discount), ONE_SIGNED)
+
+    call: int256 = unsafe_div(unsafe_sub(unsafe_mul(spot, n_d1), unsafe_mul(strike_pv, n_d2)), ONE_SIGNED)
+    call = max(call, 0)
+
+    # Put-call parity: P = C - S + K * e^(-rT)
+    put: int256 = max(unsafe_add(unsafe_sub(call, spot), strike_pv), 0)
+
+    return call, put, n_d1, z1, sqrt_t
+
+
+@external
+@pure
+def bs_call(s: uint256, k: uint256, t: uint256, v: uint256, r: int256) -> uint256:
+    call: int256 = 0
+    put: int256 = 0
+    n_d1: int256 = 0
+    z1: int256 = 0
+    sqrt_t: int256 = 0
+    call, put, n_d1, z1, sqrt_t = self._black_scholes(s, k, t, v, r)
+    return convert(call, uint256)
+
+
+@external
+@pure
+def bs_put(s: uint256, k: uint256, t: uint256, v: uint256, r: int256) -> uint256:
+    call: int256 = 0
+    put: int256 = 0
+    n_d1: int256 = 0
+    z1: int256 = 0
+    sqrt_t: int256 = 0
+    call, put, n_d1, z1, sqrt_t = self._black_scholes(s, k, t, v, r)
+    return convert(put, uint256)
+
+
+@external
+@pure
+def bs_call_put(s: uint256, k: uint256, t: uint256, v: uint256, r: int256) -> (uint256, uint256):
+    call: int256 = 0
+    put: int256 = 0
+    n_d1: int256 = 0
+    z1: int256 = 0
+    sqrt_t: int256 = 0
+    call, put, n_d1, z1, sqrt_t = self._black_scholes(s, k, t, v, r)
+    return convert(call, uint256), convert(put, uint256)
+
+
+@external
+@pure
+def bs_call_put_greeks(s: uint256, k: uint256, t: uint256, v: uint256, r: int256) -> (uint256, uint256, int256, int256, uint256):
+    """
+    @notice Returns (call, put, call delta, put delta, vega), vega per unit of volatility
+    """
+    call: int256 = 0
+    put: int256 = 0
+    n_d1: int256 = 0
+    z1: int256 = 0
+    sqrt_t: int256 = 0
+    call, put, n_d1, z1, sqrt_t = self._black_scholes(s, k, t, v, r)
+
+    # Vega = S * phi(d1) * sqrt(T), phi(d1) from the same 2^96 argument as N(d1)
+    phi_d1: uint256 = gaussian_core._pdf_internal(z1, ONE_SIGNED)
+    vega: uint256 = unsafe_div(unsafe_mul(unsafe_div(unsafe_mul(s, phi_d1), gaussian_core.ONE), convert(sqrt_t, uint256)), gaussian_core.ONE)
+
+    return convert(call, uint256), convert(put, uint256), n_d1, unsafe_sub(n_d1, ONE_SIGNED), vega
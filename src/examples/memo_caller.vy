@@ -0,0 +1,122 @@
+# @version ^0.4.0
+
+# vygauss example: a consumer of a deployed gaussian_memo.vy that repeats cdf_cached and
+# ppf_cached inside one external call, so the cache lives exactly as long as it would on
+# chain. Each call is timed with msg.gas, call overhead included, for the memo benchmark in
+# scripts/gas_benchmark.py
+
+interface GaussianMemo:
+    def cdf(x: int256, u: int256, o: uint256) -> uint256: pure
+    def ppf(x: int256, u: int256, o: int256) -> int256: pure
+    def cdf_cached(x: int256, u: int256, o: uint256) -> uint256: nonpayable
+    def ppf_cached(x: int256, u: int256, o: int256) -> int256: nonpayable
+
+interface MemoCaller:
+    def cdf_cached_gas(x: int256, u: int256, o: uint256) -> (uint256, uint256): nonpayable
+    def ppf_cached_gas(x: int256, u: int256, o: int256) -> (int256, uint256): nonpayable
+
+MEMO: public(immutable(GaussianMemo))
+
+
+@deploy
+def __init__(memo: address):
+    MEMO = GaussianMemo(memo)
+
+
+@external
+def cdf_twice(x: int256, u: int256, o: uint256) -> (uint256[3], uint256[3]):
+    """
+    @notice cdf, then cdf_cached twice with the same arguments
+    @return Results and gas of the plain call, the miss and the hit
+    """
+    # EXTCODESIZE warms the account, so no timed call pays the cold access (EIP-2929)
+    assert MEMO.address.is_contract
+
+    results: uint256[3] = empty(uint256[3])
+    gas: uint256[3] = empty(uint256[3])
+    start: uint256 = msg.gas
+    results[0] = staticcall MEMO.cdf(x, u, o)
+    gas[0] = start - msg.gas
+    start = msg.gas
+    results[1] = extcall MEMO.cdf_cached(x, u, o)
+    gas[1] = start - msg.gas
+    start = msg.gas
+    results[2] = extcall MEMO.cdf_cached(x, u, o)
+    gas[2] = start - msg.gas
+    return results, gas
+
+
+@external
+def ppf_twice(x: int256, u: int256, o: int256) -> (int256[3], uint256[3]):
+    """
+    @notice ppf, then ppf_cached twice with the same arguments
+    @return Results and gas of the plain call, the miss and the hit
+    """
+    assert MEMO.address.is_contract
+
+    results: int256[3] = empty(int256[3])
+    gas: uint256[3] = empty(uint256[3])
+    start: uint256 = msg.gas
+    results[0] = staticcall MEMO.ppf(x, u, o)
+    gas[0] = start - msg.gas
+    start = msg.gas
+    results[1] = extcall MEMO.ppf_cached(x, u, o)
+    gas[1] = start - msg.gas
+    start = msg.gas
+    results[2] = extcall MEMO.ppf_cached(x, u, o)
+    gas[2] = start - msg.gas
+    return results, gas
+
+
+@external
+def cdf_cached_gas(x: int256, u: int256, o: uint256) -> (uint256, uint256):
+    """
+    @notice One cdf_cached call and its gas
+    """
+    start: uint256 = msg.gas
+    result: uint256 = extcall MEMO.cdf_cached(x, u, o)
+    return result, start - msg.gas
+
+
+@external
+def ppf_cached_gas(x: int256, u: int256, o: int256) -> (int256, uint256):
+    """
+    @notice One ppf_cached call and its gas
+    """
+    start: uint256 = msg.gas
+    result: int256 = extcall MEMO.ppf_cached(x, u, o)
+    return result, start - msg.gas
+
+
+@external
+def cdf_shared(peer: address, x: int256, u: int256, o: uint256) -> (uint256[2], uint256[2]):
+    """
+    @notice cdf_cached from this contract, then from `peer`, another MemoCaller
+    @return Results and gas of this contract's call and the peer's
+    """
+    assert MEMO.address.is_contract
+
+    start: uint256 = msg.gas
+    result: uint256 = extcall MEMO.cdf_cached(x, u, o)
+    gas: uint256 = start - msg.gas
+    peer_result: uint256 = 0
+    peer_gas: uint256 = 0
+    peer_result, peer_gas = extcall MemoCaller(peer).cdf_cached_gas(x, u, o)
+    return [result, peer_result], [gas, peer_gas]
+
+
+@external
+def ppf_shared(peer: address, x: int256, u: int256, o: int256) -> (int256[2], uint256[2]):
+    """
+    @notice ppf_cached from this contract, then from `peer`, another MemoCaller
+    @return Results and gas of this contract's call and the peer's
+    """
+    assert MEMO.address.is_contract
+
+    start: uint256 = msg.gas
+    result: int256 = extcall MEMO.ppf_cached(x, u, o)
+    gas: uint256 = start - msg.gas
+    peer_result: int256 = 0
+    peer_gas: uint256 = 0
+    peer_result, peer_gas = extcall MemoCaller(peer).ppf_cached_gas(x, u, o)
+    return [result, peer_result], [gas, peer_gas]
@@ -0,0 +1,29 @@
+# @version ^0.4.0
+
+# vygauss example: consumer contract that inlines the gaussian_core math
+# `import gaussian_core` compiles the internals into this contract, so cdf and ppf
+# cost internal jumps instead of an external CALL to a deployed gaussian.vy
+
+from .. import gaussian_core
+
+ONE: constant(uint256) = gaussian_core.ONE
+
+
+@external
+@pure
+def probability_in_range(lower: int256, upper: int256, u: int256, o: uint256) -> uint256:
+    """
+    @notice P(lower <= X <= upper) for X ~ N(u, o^2), all values in WAD
+    """
+    assert lower <= upper, "empty range"
+    return gaussian_core._cdf_internal(upper, u, o) - gaussian_core._cdf_internal(lower, u, o)
+
+
+@external
+@pure
+def quantile(p: int256, u: int256, o: int256) -> int256:
+    """
+    @notice Value below which X ~ N(u, o^2) falls with probability p, all values in WAD
+    """
+    assert p > 0 and p < convert(ONE, int256), "p out of range"
+    return gaussian_core._ppf_internal(p, u, o)
@@ -0,0 +1,38 @@
+# @version ^0.4.0
+
+# vygauss example: the same consumer as range_probability.vy, calling a deployed
+# gaussian.vy over STATICCALL instead of importing gaussian_core. Kept for the
+# inlined vs external gas comparison in scripts/gas_benchmark.py
+
+interface Gaussian:
+    def cdf(x: int256, u: int256, o: uint256) -> uint256: pure
+    def ppf(x: int256, u: int256, o: int256) -> int256: pure
+
+ONE_SIGNED: constant(int256) = 10 ** 18
+
+GAUSSIAN: public(immutable(Gaussian))
+
+
+@deploy
+def __init__(gaussian: address):
+    GAUSSIAN = Gaussian(gaussian)
+
+
+@external
+@view
+def probability_in_range(lower: int256, upper: int256, u: int256, o: uint256) -> uint256:
+    """
+    @notice P(lower <= X <= upper) for X ~ N(u, o^2), all values in WAD
+    """
+    assert lower <= upper, "empty range"
+    return staticcall GAUSSIAN.cdf(upper, u, o) - staticcall GAUSSIAN.cdf(lower, u, o)
+
+
+@external
+@view
+def quantile(p: int256, u: int256, o: int256) -> int256:
+    """
+    @notice Value below which X ~ N(u, o^2) falls with probability p, all values in WAD
+    """
+    assert p > 0 and p < ONE_SIGNED, "p out of range"
+    return staticcall GAUSSIAN.ppf(p, u, o)
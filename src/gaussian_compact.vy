@@ -0,0 +1,11 @@
+# @version ^0.4.0
+# pragma optimize codesize
+# pragma experimental-codegen
+
+# vygauss: bytecode-size-optimized build of gaussian.vy, same ABI
+# Built with Venom and optimize=codesize.
+# Deploy this where deployment gas matters more than call gas
+
+import gaussian
+
+exports: gaussian.__interface__
@@ -0,0 +1,766 @@
+# @version ^0.4.0
+
+# vygauss: Vyper library for statistical functions with error < 1e-8
+# Ported from solgauss (Solidity)
+# Importable core: constants and @internal functions only. Consumers `import gaussian_core`
+# and call these directly to skip the external CALL, src/gaussian.vy wraps them as externals
+
+ONE: constant(uint256) = 10 ** 18
+ONE_SIGNED: constant(int256) = 10 ** 18
+ONE_SQUARED: constant(int256) = 10 ** 36
+TWO: constant(uint256) = 2 * 10 ** 18
+POW: constant(uint256) = 96
+SQRT2_WAD: constant(int256) = 1414213562373095048
+SQRT2_96: constant(int256) = 112045541949572279837463876454
+
+POW96_VAL: constant(int256) = 79228162514264337593543950336
+
+# ERFC coefficients - numerator
+ERFC_NUM_0: constant(int256) = 2390663486789119588702562760758
+ERFC_NUM_1: constant(int256) = 30799163124163494728815611822912
+ERFC_NUM_2: constant(int256) = 217009993805181888096653824035967
+ERFC_NUM_3: constant(int256) = 872769759520831409727955510614625
+ERFC_NUM_4: constant(int256) = 1770156059949187207368715502030199
+ERFC_NUM_5: constant(int256) = 491827887548901059160308996468717
+ERFC_NUM_6: constant(int256) = 2951903062606160425784903342898012
+ERFC_NUM_7: constant(int256) = 10696943466755803971902744822517940
+ERFC_NUM_8: constant(int256) = 66754282175154591985610265743670774
+ERFC_NUM_9: constant(int256) = 118123357223642876698647512612484570
+ERFC_NUM_10: constant(int256) = 74612267035072815575090161964147929
+
+# ERFC coefficients - denominator
+ERFC_DEN_0: constant(int256) = 233007495570756707611067185269
+ERFC_DEN_1: constant(int256) = 1000982532171916462620503333604
+ERFC_DEN_2: constant(int256) = 1193288078754614002642444061841
+ERFC_DEN_3: constant(int256) = 2623865187999034433680727904743
+
+# ERFC upper bound (4.0523 scaled by 2^96)
+ERFC_UPPER: constant(int256) = 321056282956553358679555000716
+
+# ERFC scale factor (signed negative)
+ERFC_SCALE: constant(int256) = -35166673128386
+
+# ERFINV boundaries (input scaled by 2^96)
+# 0.99 WAD scaled by 2^96 is 0xf5c28f5c28f5c28f5c28f5c2
+ERFINV_0_99: constant(int256) = 76059036013693764089802192322
+# 0.9999 WAD scaled by 2^96 is 0xfd70a3d70a3d70a3d70a3d70  
+ERFINV_0_9999: constant(int256) = 78435880889121694217608510832
+
+# ERFINV 0-0.99 coefficients - numerator (from hex values)
+ERFINV1_NUM_0: constant(int256) = 331353699369447034452059835477
+ERFINV1_NUM_1: constant(int256) = 258233142497643179939648346147
+ERFINV1_NUM_2: constant(int256) = 2488781860465959717234601326710
+ERFINV1_NUM_3: constant(int256) = 2738590283898461018322627916641
+ERFINV1_NUM_4: constant(int256) = 944583020602364863721848760500
+ERFINV1_NUM_5: constant(int256) = 2878671694187401374675030938962
+ERFINV1_NUM_6: constant(int256) = 1173946478208979691168897580971
+ERFINV1_NUM_7: constant(int256) = 78571753881288783598
+
+# ERFINV 0-0.99 coefficients - denominator
+ERFINV1_DEN_0: constant(int256) = 315108062651758531662122605793
+ERFINV1_DEN_1: constant(int256) = 87703403749895136110982270537
+ERFINV1_DEN_2: constant(int256) = 1044658544818372072826136154071
+ERFINV1_DEN_3: constant(int256) = 1291137726893549314369655859999
+ERFINV1_DEN_4: constant(int256) = 235581255707931908410929886899
+ERFINV1_DEN_5: constant(int256) = 1064239241597319929447490324331
+ERFINV1_DEN_6: constant(int256) = 434005836621884562572279122113
+
+ERFINV1_SCALE: constant(int256) = 327636457319539409
+
+# ERFINV 0.99-0.9999 coefficients - numerator
+ERFINV2_NUM_0: constant(int256) = 33673697534270478588220456830
+ERFINV2_NUM_1: constant(int256) = 397848153802874170266269747741
+ERFINV2_NUM_2: constant(int256) = 580109727101714805548766417663
+ERFINV2_NUM_3: constant(int256) = 227816579248216510236099340590
+
+# ERFINV 0.99-0.9999 coefficients - denominator
+ERFINV2_DEN_0: constant(int256) = 358111721368516139011808808945
+ERFINV2_DEN_1: constant(int256) = 601292241278275875325241663854
+ERFINV2_DEN_2: constant(int256) = 445186027765516940870479236216
+ERFINV2_DEN_3: constant(int256) = 122777379491721666491792761570
+
+ERFINV2_SCALE: constant(int256) = -160778573757846368
+
+# ERFINV high-range (0.9999-1) coefficients (from Solidity hex values)
+ERFINV3_NUM_0: constant(int256) = 774545014278341407       # 0xabfbc96369c431f
+ERFINV3_NUM_1: constant(int256) = 22723844989269184583     # 0x13b5b509f246e1047
+ERFINV3_NUM_2: constant(int256) = 241780725177450611770    # 0xd1b61b08a2a49c43a
+ERFINV3_NUM_3: constant(int256) = 1270458252452368382580   # 0x44df26696ddaf67a74
+ERFINV3_NUM_4: constant(int256) = 3647848324763204605040   # 0xc5c010a43e4e965470
+ERFINV3_NUM_5: constant(int256) = 5769497221460691405500   # 0x138c3dbb2cfe7ba4abc
+ERFINV3_NUM_6: constant(int256) = 4630337846156545295900   # 0xfb02d89a7f8035061c
+ERFINV3_NUM_7: constant(int256) = 1423437110749683577340   # 0x4d2a287e88a740f1fc
+
+ERFINV3_DEN_0: constant(int256) = 1485985001               # 0x589254e9
+ERFINV3_DEN_1: constant(int256) = 774414590651577          # 0x2c0537295acb9
+ERFINV3_DEN_2: constant(int256) = 21494160384252876        # 0x4c5cd33272dbcc
+ERFINV3_DEN_3: constant(int256) = 209450652105127491       # 0x2e81e4224b33643
+ERFINV3_DEN_4: constant(int256) = 975478320017874271       # 0xd89985d1ec29d5f
+ERFINV3_DEN_5: constant(int256) = 2370766162602453236      # 0x20e6a743976f68f4
+ERFINV3_DEN_6: constant(int256) = 2903651444541994617      # 0x284bd79ac779b679
+ERFINV3_DEN_7: constant(int256) = 1414213562373095048      # 0x13a04bbdfdc9be88 (sqrt(2) * WAD)
+
+ERFINV3_SCALE: constant(int256) = 1000000000000000         # 0x38d7ea4c68000 (1e15)
+
+# ERFINV high-range in 2^96: 1.6 offset, ln(m) = s * P(s^2) minimax coefficients
+# and a linear guess A + B * l for sqrt(l) over l = -ln((1 - z) / 2) in [5.3, 67.3]
+ERFINV3_R_OFFSET: constant(int256) = 126765060022822940149670320537
+ERFINV3_LN_0: constant(int256) = 23708544720220034826185874190
+ERFINV3_LN_1: constant(int256) = 31671339532854229811237368015
+ERFINV3_LN_2: constant(int256) = 52818892799194926969079159434
+ERFINV3_LN_3: constant(int256) = 158456324920090528924775823183
+ERFINV3_SQRT_A: constant(int256) = 155845100658936807681559403582
+ERFINV3_SQRT_B: constant(int256) = 8257062497409302451288973695
+
+# Fast tier: lower-degree minimax fits from scripts/minimax.py, error < 2e-6 instead of 1e-8
+# erfc (6, 4) fitted on [0, 3.6], max error 1.5e-6. The fit crosses 0 at 3.5725, so it is cut
+# at 3.57 and erfc is 0 beyond (erfc(3.57) = 4.4e-7)
+ERFC_FAST_UPPER: constant(int256) = 282844540175923685208951902699  # 3.57 scaled by 2^96
+ERFC_FAST_NUM_0: constant(int256) = 2520842227107123867052290439166
+ERFC_FAST_NUM_1: constant(int256) = 28049176503230700708784573082749
+ERFC_FAST_NUM_2: constant(int256) = 153412032146303949224692859785015
+ERFC_FAST_NUM_3: constant(int256) = 451202819055775969019408665648247
+ERFC_FAST_NUM_4: constant(int256) = 689279114958760514774323785612181
+ERFC_FAST_NUM_5: constant(int256) = 432012743935397600440767964456286
+
+ERFC_FAST_DEN_0: constant(int256) = 169006610001494300521291702193
+ERFC_FAST_DEN_1: constant(int256) = 610047385832188054667556676326
+ERFC_FAST_DEN_2: constant(int256) = 551980842098068830300463781380
+ERFC_FAST_DEN_3: constant(int256) = 1181916054165100405178075938060
+
+ERFC_FAST_SCALE: constant(int256) = 2735840152260243
+
+# erfinv (5, 5) on [0, ERFINV_0_99), max error 3.3e-7
+ERFINV1_FAST_NUM_0: constant(int256) = 44940962446490494804976771113
+ERFINV1_FAST_NUM_1: constant(int256) = 912288272196053601725686784145
+ERFINV1_FAST_NUM_2: constant(int256) = 1404430612055795260602476569023
+ERFINV1_FAST_NUM_3: constant(int256) = 616718488954108170529084033825
+ERFINV1_FAST_NUM_4: constant(int256) = 225027757438271680850384
+
+ERFINV1_FAST_DEN_0: constant(int256) = 517480877879396057503971197621
+ERFINV1_FAST_DEN_1: constant(int256) = 492127913901319562128664283434
+ERFINV1_FAST_DEN_2: constant(int256) = 1216774329709473079151622758806
+ERFINV1_FAST_DEN_3: constant(int256) = 2264431720725670514353775386048
+ERFINV1_FAST_DEN_4: constant(int256) = 994047844049414543142050241974
+
+ERFINV1_FAST_SCALE: constant(int256) = -1428391908685201867
+
+# erfinv (2, 3) on [ERFINV_0_99, ERFINV_0_9999), max error 5.5e-7
+ERFINV2_FAST_NUM_0: constant(int256) = 161891450466871777320494482126
+ERFINV2_FAST_NUM_1: constant(int256) = 82676657730757245837101914588
+
+ERFINV2_FAST_DEN_0: constant(int256) = 266940591454371618370860886570
+ERFINV2_FAST_DEN_1: constant(int256) = 297065458495903325937928149050
+ERFINV2_FAST_DEN_2: constant(int256) = 109355595510702764549227801820
+
+ERFINV2_FAST_SCALE: constant(int256) = -466719920047948273
+
+# erfinv tail (3, 2) in r, WAD layout with a 1e18 scale, max error 3.2e-7
+ERFINV3_FAST_NUM_0: constant(int256) = 352307243204700618100
+ERFINV3_FAST_NUM_1: constant(int256) = 3300877834800503058498
+ERFINV3_FAST_NUM_2: constant(int256) = 7965898049477891535773
+ERFINV3_FAST_NUM_3: constant(int256) = 4336406798706202906301
+
+ERFINV3_FAST_DEN_0: constant(int256) = 352123379859462491237
+ERFINV3_FAST_DEN_1: constant(int256) = 2747675603481146596557
+ERFINV3_FAST_DEN_2: constant(int256) = 4307908553149019609562
+
+INV_SQRT2_96: constant(int256) = 56022770974786139918731938227
+# 1/sqrt(2) scaled by 2^192, lets normal_distribution.vy fold its fixed o into one multiplier
+INV_SQRT2_192: constant(int256) = 4438581203289767414339175591698529914022621046959442208844
+
+# Maximum number of inputs accepted by the *_batch functions
+MAX_BATCH: constant(uint256) = 128
+
+# Constants for Solady's lnWad polynomial approximation
+# Lookup table for fine log2 bits (packed as bytes32)
+LN_LOOKUP: constant(uint256) = 112615256668934141757608348301524576118889381898850656584596385199644032892927
+LN_MAGIC: constant(uint256) = 175629608733387594055579892975202555070
+
+# lnWad polynomial coefficients
+LN_P0: constant(int256) = 3273285459638523848632254066296
+LN_P1: constant(int256) = 24828157081833163892658089445524
+LN_P2: constant(int256) = 43456485725739037958740375743393
+LN_P3: constant(int256) = 11111509109440967052023855526967
+LN_P4: constant(int256) = 45023709667254063763336534515857
+LN_P5: constant(int256) = 14706773417378608786704636184526
+LN_P6: constant(int256) = 795164235651350426258249787498
+
+LN_Q0: constant(int256) = 5573035233440673466300451813936
+LN_Q1: constant(int256) = 71694874799317883764090561454958
+LN_Q2: constant(int256) = 283447036172924575727196451306956
+LN_Q3: constant(int256) = 401686690394027663651624208769553
+LN_Q4: constant(int256) = 204048457590392012362485061816622
+LN_Q5: constant(int256) = 31853899698501571402653359427138
+LN_Q6: constant(int256) = 909429971244387300277376558375
+
+# Scale factors for lnWad
+LN_SCALE: constant(int256) = 1677202110996718588342820967067443963516166
+LN_LN2_SCALE: constant(int256) = 16597577552685614221487285958193947469193820559219878177908093499208371
+LN_OFFSET: constant(int256) = 600920179829731861736702779321621459595472258049074101567377883020018308
+
+# Constants for Solady's expWad (6,7) rational approximation
+# Inputs at or below ln(1e-18) round to 0, inputs at or above ln((2^255 - 1) / 1e18) overflow
+EXP_LOWER: constant(int256) = -41446531673892822313
+EXP_UPPER: constant(int256) = 135305999368893231589
+POW5_18: constant(int256) = 3814697265625
+LN2_96: constant(int256) = 54916777467707473351141471128
+
+EXP_Y0: constant(int256) = 1346386616545796478920950773328
+EXP_Y1: constant(int256) = 57155421227552351082224309758442
+EXP_P0: constant(int256) = 94201549194550492254356042504812
+EXP_P1: constant(int256) = 28719021644029726153956944680412240
+EXP_P2: constant(int256) = 4385272521454847904659076985693276
+
+EXP_Q0: constant(int256) = 2855989394907223263936484059900
+EXP_Q1: constant(int256) = 50020603652535783019961831881945
+EXP_Q2: constant(int256) = 533845033583426703283633433725380
+EXP_Q3: constant(int256) = 3604857256930695427073651918091429
+EXP_Q4: constant(int256) = 14423608567350463180887372962807573
+EXP_Q5: constant(int256) = 26449188498355588339934803723976023
+
+# Scale factor s * 2^k * 1e18 / 2^96 for expWad, result in 2^213 basis
+EXP_SCALE: constant(uint256) = 3822833074963236453042738258902158003155416615667
+
+# 1/sqrt(2*pi) in WAD
+INV_SQRT_2PI_WAD: constant(int256) = 398942280401432677
+
+# sqrt(-ln(1e-18)) scaled by 2^96: the density rounds to 0 in WAD for |z| beyond this
+PDF_UPPER: constant(int256) = 510062835242827376956428313944
+
+# ln(erfc(z)) past 0.5 is -z^2 - ln(z * sqrt(pi)) - P(s) / Q(s) with s = 1 / z^2 in (0, 4]:
+# a (6, 6) minimax rational from scripts/minimax.py in place of the asymptotic series, error 1.11e-9
+LOG_ERFC_TAIL: constant(int256) = 2 ** 95  # 0.5 scaled by 2^96
+LN2_WAD: constant(int256) = 693147180559945309
+LN_SQRT_PI_WAD: constant(int256) = 572364942924700087
+
+LOG_ERFC_NUM_0: constant(int256) = 23568662619379707222
+LOG_ERFC_NUM_1: constant(int256) = 553675458922979494109
+LOG_ERFC_NUM_2: constant(int256) = 2360110319367953918531
+LOG_ERFC_NUM_3: constant(int256) = 2809133868654610235602
+LOG_ERFC_NUM_4: constant(int256) = 1050668223277788060484
+LOG_ERFC_NUM_5: constant(int256) = 108517736979908469786
+LOG_ERFC_NUM_6: constant(int256) = 240421650508
+
+LOG_ERFC_DEN_0: constant(int256) = 11394177799265139047
+LOG_ERFC_DEN_1: constant(int256) = 531150588312647226038
+LOG_ERFC_DEN_2: constant(int256) = 4186675332619124317892
+LOG_ERFC_DEN_3: constant(int256) = 9673973574699917150528
+LOG_ERFC_DEN_4: constant(int256) = 7915764503612844544395
+LOG_ERFC_DEN_5: constant(int256) = 2372605697564344330948
+LOG_ERFC_DEN_6: constant(int256) = 217035751964167366464
+
+
+@internal
+@pure
+def _sqrt(x: uint256) -> uint256:
+    if x == 0:
+        return 0
+
+    z: uint256 = 181
+
+    r: uint256 = 0
+    if x > 340282366920938463463374607431768211455:
+        r = 128
+    if (x >> r) > 18446744073709551615:
+        r = r + 64
+    if (x >> r) > 4294967295:
+        r = r + 32
+    if (x >> r) > 65535:
+        r = r + 16
+
+    z = z << (r >> 1)
+    z = unsafe_mul(z, unsafe_add((x >> r), 65536)) >> 18
+
+    z = unsafe_add(z, unsafe_div(x, z)) >> 1
+    z = unsafe_add(z, unsafe_div(x, z)) >> 1
+    z = unsafe_add(z, unsafe_div(x, z)) >> 1
+    z = unsafe_add(z, unsafe_div(x, z)) >> 1
+    z = unsafe_add(z, unsafe_div(x, z)) >> 1
+    z = unsafe_add(z, unsafe_div(x, z)) >> 1
+    z = unsafe_add(z, unsafe_div(x, z)) >> 1
+
+    if unsafe_div(x, z) < z:
+        z = unsafe_sub(z, 1)
+
+    return z
+
+
+@internal
+@pure
+def _ln_wad(x: int256) -> int256:
+    """
+    @notice Compute ln(x) where x is WAD-scaled (1e18), returns WAD-scaled result
+    @dev Port of Solady's lnWad using (8,8) rational polynomial approximation
+    """
+    assert x > 0, "ln undefined"
+    
+    _x: uint256 = convert(x, uint256)
+    
+    # Compute r = 255 - floor(log2(x)) using bit comparisons
+    # r starts as bits indicating magnitude
+    r: uint256 = 0
+    if _x > 340282366920938463463374607431768211455:  # > 2^128 - 1
+        r = 128
+    if (_x >> r) > 18446744073709551615:  # > 2^64 - 1
+        r = r | 64
+    if (_x >> r) > 4294967295:  # > 2^32 - 1
+        r = r | 32
+    if (_x >> r) > 65535:  # > 2^16 - 1
+        r = r | 16
+    if (_x >> r) > 255:  # > 2^8 - 1
+        r = r | 8
+    
+    # Fine-tune r using lookup table for the remaining bits
+    # In Solidity: shr(shr(r, x), magic) means magic >> (x >> r)
+    shifted: uint256 = _x >> r
+    lookup_index: uint256 = (LN_MAGIC >> shifted) & 31
+    # Extract byte from lookup table: byte at position lookup_index
+    lookup_byte: uint256 = (LN_LOOKUP >> (248 - 8 * lookup_index)) & 255
+    r = r ^ lookup_byte
+    
+    # Reduce x to range [1, 2) * 2^96
+    # x = x * 2^(159 - r) >> 159 = x << r >> 159
+    x_reduced: int256 = convert((_x << r) >> 159, int256)
+    
+    p: int256 = unsafe_add(LN_P0, x_reduced)
+    p = unsafe_add(unsafe_mul(p, x_reduced) >> 96, LN_P1)
+    p = unsafe_add(unsafe_mul(p, x_reduced) >> 96, LN_P2)
+    p = unsafe_sub(unsafe_mul(p, x_reduced) >> 96, LN_P3)
+    p = unsafe_sub(unsafe_mul(p, x_reduced) >> 96, LN_P4)
+    p = unsafe_sub(unsafe_mul(p, x_reduced) >> 96, LN_P5)
+    p = unsafe_sub(unsafe_mul(p, x_reduced), LN_P6 << 96)  # Leave in 2^192 basis
+
+    # q polynomial
+    q: int256 = unsafe_add(x_reduced, LN_Q0)
+    q = unsafe_add(unsafe_mul(x_reduced, q) >> 96, LN_Q1)
+    q = unsafe_add(unsafe_mul(x_reduced, q) >> 96, LN_Q2)
+    q = unsafe_add(unsafe_mul(x_reduced, q) >> 96, LN_Q3)
+    q = unsafe_add(unsafe_mul(x_reduced, q) >> 96, LN_Q4)
+    q = unsafe_add(unsafe_mul(x_reduced, q) >> 96, LN_Q5)
+    q = unsafe_add(unsafe_mul(x_reduced, q) >> 96, LN_Q6)
+
+    # p / q (no scaling needed, p is already 2^96 too large)
+    p = unsafe_div(p, q)
+
+    # Apply scale factor: s * 5^18 * 2^96
+    p = unsafe_mul(LN_SCALE, p)
+
+    # Add ln(2) * k * 5^18 * 2^192 where k = 159 - r
+    # Note: r can be > 159, so we compute as signed to avoid underflow
+    p = unsafe_add(p, unsafe_mul(LN_LN2_SCALE, unsafe_sub(159, convert(r, int256))))
+
+    # Add ln(2^96 / 10^18) * 5^18 * 2^192
+    p = unsafe_add(p, LN_OFFSET)
+    
+    # Base conversion: divide by 2^174 (shift right 174)
+    result: int256 = p >> 174
+    
+    return result
+
+
+@internal
+@pure
+def _exp_wad(x: int256) -> int256:
+    """
+    @notice Compute e^x where x is WAD-scaled (1e18), returns WAD-scaled result
+    @dev Port of Solady's expWad using (6,7) rational polynomial approximation
+    """
+    if x <= EXP_LOWER:
+        return 0
+    assert x < EXP_UPPER, "exp overflow"
+
+    # Convert to 2^96 basis: multiply by 1e18 / 2^96 = 5^18 / 2^78
+    x_96: int256 = unsafe_div(x << 78, POW5_18)
+
+    # Reduce to (-ln2 / 2, ln2 / 2) * 2^96 so that e^x = e^x' * 2^k
+    k: int256 = unsafe_add(unsafe_div(x_96 << 96, LN2_96), 2 ** 95) >> 96
+    x_96 = unsafe_sub(x_96, unsafe_mul(k, LN2_96))
+
+    # p polynomial (monic, scaled at the end)
+    y: int256 = unsafe_add(x_96, EXP_Y0)
+    y = unsafe_add(unsafe_mul(y, x_96) >> 96, EXP_Y1)
+    p: int256 = unsafe_sub(unsafe_add(y, x_96), EXP_P0)
+    p = unsafe_add(unsafe_mul(p, y) >> 96, EXP_P1)
+    p = unsafe_add(unsafe_mul(p, x_96), EXP_P2 << 96)  # Leave in 2^192 basis
+
+    # q polynomial
+    q: int256 = unsafe_sub(x_96, EXP_Q0)
+    q = unsafe_add(unsafe_mul(q, x_96) >> 96, EXP_Q1)
+    q = unsafe_sub(unsafe_mul(q, x_96) >> 96, EXP_Q2)
+    q = unsafe_add(unsafe_mul(q, x_96) >> 96, EXP_Q3)
+    q = unsafe_sub(unsafe_mul(q, x_96) >> 96, EXP_Q4)
+    q = unsafe_add(unsafe_mul(q, x_96) >> 96, EXP_Q5)
+
+    # p / q (q has no real roots, p is already 2^96 too large)
+    r: uint256 = convert(unsafe_div(p, q), uint256)
+
+    # Apply scale factor, 2^k and base conversion in one shift from the 2^213 basis
+    return convert(unsafe_mul(r, EXP_SCALE) >> convert(unsafe_sub(195, k), uint256), int256)
+
+
+@internal
+@pure
+def _erfc_internal(x: int256) -> uint256:
+    mask: int256 = x >> 255
+    z: int256 = (x ^ mask) - mask
+    
+    y: uint256 = 0
+    
+    if z < ERFC_UPPER:
+        num: int256 = unsafe_sub(z, ERFC_NUM_0)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFC_NUM_1)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFC_NUM_2)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFC_NUM_3)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFC_NUM_4)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFC_NUM_5)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFC_NUM_6)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFC_NUM_7)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFC_NUM_8)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFC_NUM_9)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFC_NUM_10)
+
+        denom: int256 = unsafe_sub(z, ERFC_DEN_0)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFC_DEN_1)
+        denom = unsafe_sub((unsafe_mul(denom, z) >> POW), ERFC_DEN_2)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFC_DEN_3)
+
+        y = convert(unsafe_div(unsafe_mul(ERFC_SCALE, num), denom), uint256)
+
+    if x < 0:
+        y = unsafe_sub(TWO, y)
+    
+    return y
+
+
+@internal
+@pure
+def _log_erfc_internal(x: int256) -> int256:
+    """
+    @notice ln(erfc(x)), x scaled by 2^96, result in WAD
+    @dev Below LOG_ERFC_TAIL this is _ln_wad of _erfc_internal. Past it, erfc shrinks towards
+         its absolute error and then rounds to 0, so the asymptotic form is used instead.
+         Reverts for x above ~2.4e20, where x^2 in WAD overflows.
+    """
+    if x < LOG_ERFC_TAIL:
+        return self._ln_wad(convert(self._erfc_internal(x), int256))
+
+    x_wad: int256 = unsafe_div(x * ONE_SIGNED, POW96_VAL)
+    x_sq: int256 = unsafe_div(x_wad * x_wad, ONE_SIGNED)
+
+    # s = 1 / x^2 in 2^96, at most 4 since x >= 0.5
+    s: int256 = unsafe_div(POW96_VAL << POW, x)
+    s = unsafe_mul(s, s) >> POW
+
+    num: int256 = unsafe_add((unsafe_mul(LOG_ERFC_NUM_0, s) >> POW), LOG_ERFC_NUM_1)
+    num = unsafe_add((unsafe_mul(num, s) >> POW), LOG_ERFC_NUM_2)
+    num = unsafe_add((unsafe_mul(num, s) >> POW), LOG_ERFC_NUM_3)
+    num = unsafe_add((unsafe_mul(num, s) >> POW), LOG_ERFC_NUM_4)
+    num = unsafe_add((unsafe_mul(num, s) >> POW), LOG_ERFC_NUM_5)
+    num = unsafe_add((unsafe_mul(num, s) >> POW), LOG_ERFC_NUM_6)
+
+    denom: int256 = unsafe_add((unsafe_mul(LOG_ERFC_DEN_0, s) >> POW), LOG_ERFC_DEN_1)
+    denom = unsafe_add((unsafe_mul(denom, s) >> POW), LOG_ERFC_DEN_2)
+    denom = unsafe_add((unsafe_mul(denom, s) >> POW), LOG_ERFC_DEN_3)
+    denom = unsafe_add((unsafe_mul(denom, s) >> POW), LOG_ERFC_DEN_4)
+    denom = unsafe_add((unsafe_mul(denom, s) >> POW), LOG_ERFC_DEN_5)
+    denom = unsafe_add((unsafe_mul(denom, s) >> POW), LOG_ERFC_DEN_6)
+
+    correction: int256 = unsafe_div(unsafe_mul(num, ONE_SIGNED), denom)
+    return -unsafe_add(unsafe_add(x_sq, self._ln_wad(x_wad)), unsafe_add(LN_SQRT_PI_WAD, correction))
+
+
+@internal
+@pure
+def _pdf_internal(z: int256, o: int256) -> uint256:
+    """
+    @notice Normal density for z = (u - x) / (o * sqrt(2)) scaled by 2^96, as computed by cdf
+    @dev exp(-z^2) = exp(-((x - u) / o)^2 / 2), so the cdf scaling is reused as is
+    """
+    mask: int256 = z >> 255
+    z_abs: int256 = (z ^ mask) - mask
+
+    if z_abs >= PDF_UPPER:
+        return 0
+
+    # z^2 from 2^192 basis to WAD
+    z_sq: int256 = unsafe_mul(unsafe_mul(z_abs, z_abs) >> POW, ONE_SIGNED) >> POW
+    density: int256 = unsafe_mul(self._exp_wad(-z_sq), INV_SQRT_2PI_WAD)
+    return convert(unsafe_div(density, o), uint256)
+
+
+@internal
+@pure
+def _erfinv_tail_r(z: int256) -> int256:
+    """
+    @notice r = sqrt(-ln((1 - z) / 2)) - 1.6 for the erfinv tail, z and r scaled by 2^96
+    @dev Stays in 2^96 without the _ln_wad / _sqrt round trip. Reverts for z >= 1
+    """
+    w: int256 = unsafe_sub(POW96_VAL, z)
+    assert w > 0, "erfinv undefined"
+    w_u: uint256 = convert(w, uint256)
+
+    # lz = 255 - floor(log2(w)) via Solady's bit scan, w <= 0.01 * 2^96 so the 2^128 check is skipped
+    lz: uint256 = 0
+    if w_u > 18446744073709551615:  # > 2^64 - 1
+        lz = 64
+    if (w_u >> lz) > 4294967295:  # > 2^32 - 1
+        lz = lz | 32
+    if (w_u >> lz) > 65535:  # > 2^16 - 1
+        lz = lz | 16
+    if (w_u >> lz) > 255:  # > 2^8 - 1
+        lz = lz | 8
+    lz = lz ^ ((LN_LOOKUP >> (248 - 8 * ((LN_MAGIC >> (w_u >> lz)) & 31))) & 255)
+
+    # w / 2 = m * 2^-k with m in [1/sqrt(2), sqrt(2)) * 2^96, so -ln(w / 2) = k * ln(2) - ln(m)
+    m: int256 = convert((w_u << lz) >> 159, int256)
+    k: int256 = unsafe_sub(convert(lz, int256), 158)
+    if m > SQRT2_96:
+        m = m >> 1
+        k = unsafe_sub(k, 1)
+
+    # ln(m) = 2 * atanh(s), s = (m - 1) / (m + 1) in (-0.172, 0.172), minimax in s^2
+    s: int256 = unsafe_div(unsafe_sub(m, POW96_VAL) << POW, unsafe_add(m, POW96_VAL))
+    s2: int256 = unsafe_mul(s, s) >> POW
+    p: int256 = unsafe_add(unsafe_mul(ERFINV3_LN_0, s2) >> POW, ERFINV3_LN_1)
+    p = unsafe_add(unsafe_mul(p, s2) >> POW, ERFINV3_LN_2)
+    p = unsafe_add(unsafe_mul(p, s2) >> POW, ERFINV3_LN_3)
+    l: int256 = unsafe_sub(unsafe_mul(k, LN2_96), unsafe_mul(s, p) >> POW)
+
+    # sqrt(l) for l in [5.3, 67.3]: linear minimax guess (9.5% error), then 3 Newton steps
+    r: int256 = unsafe_add(ERFINV3_SQRT_A, unsafe_mul(ERFINV3_SQRT_B, l) >> POW)
+    l = l << POW
+    r = unsafe_add(r, unsafe_div(l, r)) >> 1
+    r = unsafe_add(r, unsafe_div(l, r)) >> 1
+    r = unsafe_add(r, unsafe_div(l, r)) >> 1
+    return unsafe_sub(r, ERFINV3_R_OFFSET)
+
+
+@internal
+@pure
+def _erfinv_internal(x: int256) -> int256:
+    mask: int256 = x >> 255
+    z: int256 = (x ^ mask) - mask
+    
+    y: int256 = 0
+    
+    if z < ERFINV_0_99:
+        num: int256 = unsafe_sub(z, ERFINV1_NUM_0)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFINV1_NUM_1)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFINV1_NUM_2)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFINV1_NUM_3)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFINV1_NUM_4)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFINV1_NUM_5)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFINV1_NUM_6)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFINV1_NUM_7)
+
+        denom: int256 = unsafe_sub(z, ERFINV1_DEN_0)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFINV1_DEN_1)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFINV1_DEN_2)
+        denom = unsafe_sub((unsafe_mul(denom, z) >> POW), ERFINV1_DEN_3)
+        denom = unsafe_sub((unsafe_mul(denom, z) >> POW), ERFINV1_DEN_4)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFINV1_DEN_5)
+        denom = unsafe_sub((unsafe_mul(denom, z) >> POW), ERFINV1_DEN_6)
+
+        y = unsafe_div(unsafe_mul(ERFINV1_SCALE, num), denom)
+
+    elif z < ERFINV_0_9999:
+        num: int256 = unsafe_sub(z, ERFINV2_NUM_0)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFINV2_NUM_1)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFINV2_NUM_2)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFINV2_NUM_3)
+
+        denom: int256 = unsafe_sub(z, ERFINV2_DEN_0)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFINV2_DEN_1)
+        denom = unsafe_sub((unsafe_mul(denom, z) >> POW), ERFINV2_DEN_2)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFINV2_DEN_3)
+
+        y = unsafe_div(unsafe_mul(ERFINV2_SCALE, num), denom)
+        
+    else:
+        r: int256 = self._erfinv_tail_r(z)
+
+        # r is 2^96 scaled, so the WAD coefficients stay WAD after each multiply and shift
+        num: int256 = unsafe_add((unsafe_mul(ERFINV3_NUM_0, r) >> POW), ERFINV3_NUM_1)
+        num = unsafe_add((unsafe_mul(num, r) >> POW), ERFINV3_NUM_2)
+        num = unsafe_add((unsafe_mul(num, r) >> POW), ERFINV3_NUM_3)
+        num = unsafe_add((unsafe_mul(num, r) >> POW), ERFINV3_NUM_4)
+        num = unsafe_add((unsafe_mul(num, r) >> POW), ERFINV3_NUM_5)
+        num = unsafe_add((unsafe_mul(num, r) >> POW), ERFINV3_NUM_6)
+        num = unsafe_add((unsafe_mul(num, r) >> POW), ERFINV3_NUM_7)
+
+        denom: int256 = unsafe_add((unsafe_mul(ERFINV3_DEN_0, r) >> POW), ERFINV3_DEN_1)
+        denom = unsafe_add((unsafe_mul(denom, r) >> POW), ERFINV3_DEN_2)
+        denom = unsafe_add((unsafe_mul(denom, r) >> POW), ERFINV3_DEN_3)
+        denom = unsafe_add((unsafe_mul(denom, r) >> POW), ERFINV3_DEN_4)
+        denom = unsafe_add((unsafe_mul(denom, r) >> POW), ERFINV3_DEN_5)
+        denom = unsafe_add((unsafe_mul(denom, r) >> POW), ERFINV3_DEN_6)
+        denom = unsafe_add((unsafe_mul(denom, r) >> POW), ERFINV3_DEN_7)
+
+        y = unsafe_div(unsafe_mul(num, ERFINV3_SCALE), denom)
+    
+    if x < 0:
+        y = -y
+    
+    return y
+
+
+@internal
+@pure
+def _erfcinv_internal(x: int256) -> int256:
+    x_96: int256 = unsafe_div(unsafe_sub(ONE_SIGNED, x) << POW, ONE_SIGNED)
+    return self._erfinv_internal(x_96)
+
+
+@internal
+@pure
+def _cdf_internal(x: int256, u: int256, o: uint256) -> uint256:
+    """
+    @notice Normal cdf, all values in WAD
+    """
+    z: int256 = unsafe_div(unsafe_mul(unsafe_sub(u, x), INV_SQRT2_96), convert(o, int256))
+    return self._erfc_internal(z) >> 1
+
+
+@internal
+@pure
+def _log_cdf_internal(x: int256, u: int256, o: uint256) -> int256:
+    """
+    @notice ln(cdf(x)), all values in WAD, finite however far x is below u
+    """
+    z: int256 = unsafe_div(unsafe_mul(unsafe_sub(u, x), INV_SQRT2_96), convert(o, int256))
+    return unsafe_sub(self._log_erfc_internal(z), LN2_WAD)
+
+
+@internal
+@pure
+def _log_sf_internal(x: int256, u: int256, o: uint256) -> int256:
+    """
+    @notice ln(1 - cdf(x)), all values in WAD, finite however far x is above u
+    """
+    z: int256 = unsafe_div(unsafe_mul(unsafe_sub(x, u), INV_SQRT2_96), convert(o, int256))
+    return unsafe_sub(self._log_erfc_internal(z), LN2_WAD)
+
+
+@internal
+@pure
+def _ppf_internal(x: int256, u: int256, o: int256) -> int256:
+    """
+    @notice Normal ppf (inverse cdf), all values in WAD
+    """
+    erfcinv_val: int256 = self._erfcinv_internal(unsafe_mul(2, x))
+    return unsafe_sub(u, unsafe_div(unsafe_mul(unsafe_mul(o, SQRT2_WAD), erfcinv_val), ONE_SQUARED))
+
+
+@internal
+@pure
+def _erfc_fast_internal(x: int256) -> uint256:
+    """
+    @notice erfc with the fast tier (6, 4) rational, absolute error < 2e-6
+    """
+    mask: int256 = x >> 255
+    z: int256 = (x ^ mask) - mask
+
+    y: uint256 = 0
+
+    if z < ERFC_FAST_UPPER:
+        num: int256 = unsafe_sub(z, ERFC_FAST_NUM_0)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFC_FAST_NUM_1)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFC_FAST_NUM_2)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFC_FAST_NUM_3)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFC_FAST_NUM_4)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFC_FAST_NUM_5)
+
+        denom: int256 = unsafe_sub(z, ERFC_FAST_DEN_0)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFC_FAST_DEN_1)
+        denom = unsafe_sub((unsafe_mul(denom, z) >> POW), ERFC_FAST_DEN_2)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFC_FAST_DEN_3)
+
+        y = convert(unsafe_div(unsafe_mul(ERFC_FAST_SCALE, num), denom), uint256)
+
+    if x < 0:
+        y = unsafe_sub(TWO, y)
+
+    return y
+
+
+@internal
+@pure
+def _erfinv_fast_internal(x: int256) -> int256:
+    """
+    @notice erfinv with the fast tier rationals, absolute error < 1e-6
+    @dev Same branches and _erfinv_tail_r reduction as _erfinv_internal, lower-degree rationals
+    """
+    mask: int256 = x >> 255
+    z: int256 = (x ^ mask) - mask
+
+    y: int256 = 0
+
+    if z < ERFINV_0_99:
+        num: int256 = unsafe_add(z, ERFINV1_FAST_NUM_0)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFINV1_FAST_NUM_1)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFINV1_FAST_NUM_2)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFINV1_FAST_NUM_3)
+        num = unsafe_sub((unsafe_mul(num, z) >> POW), ERFINV1_FAST_NUM_4)
+
+        denom: int256 = unsafe_sub(z, ERFINV1_FAST_DEN_0)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFINV1_FAST_DEN_1)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFINV1_FAST_DEN_2)
+        denom = unsafe_sub((unsafe_mul(denom, z) >> POW), ERFINV1_FAST_DEN_3)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFINV1_FAST_DEN_4)
+
+        y = unsafe_div(unsafe_mul(ERFINV1_FAST_SCALE, num), denom)
+
+    elif z < ERFINV_0_9999:
+        num: int256 = unsafe_sub(z, ERFINV2_FAST_NUM_0)
+        num = unsafe_add((unsafe_mul(num, z) >> POW), ERFINV2_FAST_NUM_1)
+
+        denom: int256 = unsafe_sub(z, ERFINV2_FAST_DEN_0)
+        denom = unsafe_add((unsafe_mul(denom, z) >> POW), ERFINV2_FAST_DEN_1)
+        denom = unsafe_sub((unsafe_mul(denom, z) >> POW), ERFINV2_FAST_DEN_2)
+
+        y = unsafe_div(unsafe_mul(ERFINV2_FAST_SCALE, num), denom)
+
+    else:
+        r: int256 = self._erfinv_tail_r(z)
+
+        num: int256 = unsafe_add((unsafe_mul(ERFINV3_FAST_NUM_0, r) >> POW), ERFINV3_FAST_NUM_1)
+        num = unsafe_add((unsafe_mul(num, r) >> POW), ERFINV3_FAST_NUM_2)
+        num = unsafe_add((unsafe_mul(num, r) >> POW), ERFINV3_FAST_NUM_3)
+
+        denom: int256 = unsafe_add((unsafe_mul(ERFINV3_FAST_DEN_0, r) >> POW), ERFINV3_FAST_DEN_1)
+        denom = unsafe_add((unsafe_mul(denom, r) >> POW), ERFINV3_FAST_DEN_2)
+
+        y = unsafe_div(unsafe_mul(num, ONE_SIGNED), denom)
+
+    if x < 0:
+        y = -y
+
+    return y
+
+
+@internal
+@pure
+def _erfcinv_fast_internal(x: int256) -> int256:
+    x_96: int256 = unsafe_div(unsafe_sub(ONE_SIGNED, x) << POW, ONE_SIGNED)
+    return self._erfinv_fast_internal(x_96)
+
+
+@internal
+@pure
+def _cdf_fast_internal(x: int256, u: int256, o: uint256) -> uint256:
+    """
+    @notice Normal cdf with the fast tier erfc, absolute error < 1e-6, all values in WAD
+    """
+    z: int256 = unsafe_div(unsafe_mul(unsafe_sub(u, x), INV_SQRT2_96), convert(o, int256))
+    return self._erfc_fast_internal(z) >> 1
+
+
+@internal
+@pure
+def _ppf_fast_internal(x: int256, u: int256, o: int256) -> int256:
+    """
+    @notice Normal ppf with the fast tier erfcinv, error < 1e-6 * o, all values in WAD
+    """
+    erfcinv_val: int256 = self._erfcinv_fast_internal(unsafe_mul(2, x))
+    return unsafe_sub(u, unsafe_div(unsafe_mul(unsafe_mul(o, SQRT2_WAD), erfcinv_val), ONE_SQUARED))
@@ -0,0 +1,41 @@
+# @version ^0.4.0
+
+# vygauss: gaussian.vy plus cdf and ppf entry points memoized in transient storage (EIP-1153)
+# cdf_cached and ppf_cached store each result under the hash of its arguments, so repeating
+# a call later in the same transaction costs a TLOAD instead of the evaluation. The cache is
+# shared by every caller, the results only depend on the arguments. Needs Cancun.
+# Both write transient storage: call them with extcall, a staticcall reverts
+
+import gaussian
+import gaussian_core
+
+exports: gaussian.__interface__
+
+# Result + 1 per argument hash, 0 is a miss. A ppf result of -1 wei stores 0 and is
+# recomputed on every call
+cdf_cache: transient(HashMap[bytes32, uint256])
+ppf_cache: transient(HashMap[bytes32, int256])
+
+
+@external
+def cdf_cached(x: int256, u: int256, o: uint256) -> uint256:
+    key: bytes32 = keccak256(abi_encode(x, u, o))
+    cached: uint256 = self.cdf_cache[key]
+    if cached != 0:
+        return unsafe_sub(cached, 1)
+
+    y: uint256 = gaussian_core._cdf_internal(x, u, o)
+    self.cdf_cache[key] = unsafe_add(y, 1)
+    return y
+
+
+@external
+def ppf_cached(x: int256, u: int256, o: int256) -> int256:
+    key: bytes32 = keccak256(abi_encode(x, u, o))
+    cached: int256 = self.ppf_cache[key]
+    if cached != 0:
+        return unsafe_sub(cached, 1)
+
+    y: int256 = gaussian_core._ppf_internal(x, u, o)
+    self.ppf_cache[key] = unsafe_add(y, 1)
+    return y
@@ -0,0 +1,249 @@
+# @version ^0.4.0
+
+# vygauss: segmented erfc variant of gaussian.vy
+# Deploy this instead of gaussian.vy to get a piecewise polynomial erfc/cdf with
+# about half the multiplies of the degree-11/4 rational and no division.
+# erfinv, erfcinv, ppf and pdf are re-exported unchanged from gaussian.vy.
+# log_cdf, log_sf and the fast tier are left out, exporting them adds ~23 gas of
+# dispatch to ppf.
+# Coefficients are generated by scripts/erfc_segments.py
+
+import gaussian
+import gaussian_core
+
+exports: (
+    gaussian.erfinv,
+    gaussian.erfcinv,
+    gaussian.ppf,
+    gaussian.pdf,
+    gaussian.erfinv_batch,
+    gaussian.ppf_batch,
+)
+
+POW: constant(uint256) = gaussian_core.POW
+TWO_SIGNED: constant(int256) = 2 * 10 ** 18
+MAX_BATCH: constant(uint256) = gaussian_core.MAX_BATCH
+
+# Segments of width 0.5 (scaled by 2^96) on [0, ERFC_UPPER), the last one runs to ERFC_UPPER
+ERFC_SEG_WIDTH: constant(int256) = 2 ** 95
+
+# Per segment: center and WAD coefficients of a polynomial in t = z - center (constant term first)
+# [0.0000, 0.5000): degree 7, max error 1.19e-09
+ERFC_SEG0_MID: constant(int256) = 19807040628566084398385987584
+ERFC_SEG0_0: constant(int256) = 723673610960351225
+ERFC_SEG0_1: constant(int256) = -1060014129070675875
+ERFC_SEG0_2: constant(int256) = 265002954290231832
+ERFC_SEG0_3: constant(int256) = 309170631310039602
+ERFC_SEG0_4: constant(int256) = -126934521312726810
+ERFC_SEG0_5: constant(int256) = -80040619045169069
+ERFC_SEG0_6: constant(int256) = 39340355767247602
+ERFC_SEG0_7: constant(int256) = 15843159213193947
+
+# [0.5000, 1.0000): degree 7, max error 3.93e-10
+ERFC_SEG1_MID: constant(int256) = 59421121885698253195157962752
+ERFC_SEG1_0: constant(int256) = 288844366623517608
+ERFC_SEG1_1: constant(int256) = -642931069659059079
+ERFC_SEG1_2: constant(int256) = 482198160076265366
+ERFC_SEG1_3: constant(int256) = -26788556984439161
+ERFC_SEG1_4: constant(int256) = -150675632652676288
+ERFC_SEG1_5: constant(int256) = 53223692279397609
+ERFC_SEG1_6: constant(int256) = 26582870666109698
+ERFC_SEG1_7: constant(int256) = -17945845857760633
+
+# [1.0000, 1.5000): degree 7, max error 6.86e-10
+ERFC_SEG2_MID: constant(int256) = 99035203142830421991929937920
+ERFC_SEG2_0: constant(int256) = 77099871076082048
+ERFC_SEG2_1: constant(int256) = -236521122347424845
+ERFC_SEG2_2: constant(int256) = 295651744892295366
+ERFC_SEG2_3: constant(int256) = -167535846235988424
+ERFC_SEG2_4: constant(int256) = 6132017046038294
+ERFC_SEG2_5: constant(int256) = 47185146271405874
+ERFC_SEG2_6: constant(int256) = -20597545251434523
+ERFC_SEG2_7: constant(int256) = -3732251078942206
+
+# [1.5000, 2.0000): degree 7, max error 1.04e-10
+ERFC_SEG3_MID: constant(int256) = 138649284399962590788701913088
+ERFC_SEG3_0: constant(int256) = 13328328861336450
+ERFC_SEG3_1: constant(int256) = -52774995823659133
+ERFC_SEG3_2: constant(int256) = 92356201600326741
+ERFC_SEG3_3: constant(int256) = -90157339238431622
+ERFC_SEG3_4: constant(int256) = 48105534396652231
+ERFC_SEG3_5: constant(int256) = -6619999123692020
+ERFC_SEG3_6: constant(int256) = -9049599632272749
+ERFC_SEG3_7: constant(int256) = 5947051132821019
+
+# [2.0000, 2.5000): degree 6, max error 9.36e-10
+ERFC_SEG4_MID: constant(int256) = 178263365657094759585473888256
+ERFC_SEG4_0: constant(int256) = 1462716586681152
+ERFC_SEG4_1: constant(int256) = -7142300054929797
+ERFC_SEG4_2: constant(int256) = 16070191148791932
+ERFC_SEG4_3: constant(int256) = -21726971805655456
+ERFC_SEG4_4: constant(int256) = 19086795304443000
+ERFC_SEG4_5: constant(int256) = -10581229928936390
+ERFC_SEG4_6: constant(int256) = 2795148626337617
+
+# [2.5000, 3.0000): degree 6, max error 6.23e-10
+ERFC_SEG5_MID: constant(int256) = 217877446914226928382245863424
+ERFC_SEG5_0: constant(int256) = 100621922119637
+ERFC_SEG5_1: constant(int256) = -586294286659310
+ERFC_SEG5_2: constant(int256) = 1612264646006221
+ERFC_SEG5_3: constant(int256) = -2758205693157419
+ERFC_SEG5_4: constant(int256) = 3257828482606482
+ERFC_SEG5_5: constant(int256) = -2825851342146364
+ERFC_SEG5_6: constant(int256) = 1666593762989468
+
+# [3.0000, 3.5000): degree 6, max error 1.86e-10
+ERFC_SEG6_MID: constant(int256) = 257491528171359097179017838592
+ERFC_SEG6_0: constant(int256) = 4302779463675
+ERFC_SEG6_1: constant(int256) = -29193639666676
+ERFC_SEG6_2: constant(int256) = 94866519090792
+ERFC_SEG6_3: constant(int256) = -195219767196927
+ERFC_SEG6_4: constant(int256) = 286289510324064
+ERFC_SEG6_5: constant(int256) = -332609764922626
+ERFC_SEG6_6: constant(int256) = 272477494981111
+
+# [3.5000, 4.0523): degree 5, max error 3.13e-10
+ERFC_SEG7_MID: constant(int256) = 297105609428491265975789813760
+ERFC_SEG7_0: constant(int256) = 113937761259
+ERFC_SEG7_1: constant(int256) = -878671857070
+ERFC_SEG7_2: constant(int256) = 3252360982613
+ERFC_SEG7_3: constant(int256) = -8134397435041
+ERFC_SEG7_4: constant(int256) = 15865536844815
+ERFC_SEG7_5: constant(int256) = -17236108686582
+
+
+@internal
+@pure
+def _erfc_internal(x: int256) -> uint256:
+    """
+    @notice erfc with the same scaling as gaussian_core._erfc_internal: input 2^96, output WAD
+    @dev Segment picked by a 3-level comparison tree, then one Horner polynomial of degree 5-7
+    """
+    mask: int256 = x >> 255
+    z: int256 = (x ^ mask) - mask
+
+    y: int256 = 0
+
+    if z < gaussian_core.ERFC_UPPER:
+        if z < 4 * ERFC_SEG_WIDTH:
+            if z < 2 * ERFC_SEG_WIDTH:
+                if z < ERFC_SEG_WIDTH:
+                    t: int256 = unsafe_sub(z, ERFC_SEG0_MID)
+                    y = unsafe_add((unsafe_mul(ERFC_SEG0_7, t) >> POW), ERFC_SEG0_6)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG0_5)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG0_4)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG0_3)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG0_2)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG0_1)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG0_0)
+                else:
+                    t: int256 = unsafe_sub(z, ERFC_SEG1_MID)
+                    y = unsafe_add((unsafe_mul(ERFC_SEG1_7, t) >> POW), ERFC_SEG1_6)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG1_5)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG1_4)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG1_3)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG1_2)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG1_1)
+                    y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG1_0)
+            elif z < 3 * ERFC_SEG_WIDTH:
+                t: int256 = unsafe_sub(z, ERFC_SEG2_MID)
+                y = unsafe_add((unsafe_mul(ERFC_SEG2_7, t) >> POW), ERFC_SEG2_6)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG2_5)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG2_4)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG2_3)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG2_2)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG2_1)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG2_0)
+            else:
+                t: int256 = unsafe_sub(z, ERFC_SEG3_MID)
+                y = unsafe_add((unsafe_mul(ERFC_SEG3_7, t) >> POW), ERFC_SEG3_6)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG3_5)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG3_4)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG3_3)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG3_2)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG3_1)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG3_0)
+        elif z < 6 * ERFC_SEG_WIDTH:
+            if z < 5 * ERFC_SEG_WIDTH:
+                t: int256 = unsafe_sub(z, ERFC_SEG4_MID)
+                y = unsafe_add((unsafe_mul(ERFC_SEG4_6, t) >> POW), ERFC_SEG4_5)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG4_4)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG4_3)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG4_2)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG4_1)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG4_0)
+            else:
+                t: int256 = unsafe_sub(z, ERFC_SEG5_MID)
+                y = unsafe_add((unsafe_mul(ERFC_SEG5_6, t) >> POW), ERFC_SEG5_5)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG5_4)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG5_3)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG5_2)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG5_1)
+                y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG5_0)
+        elif z < 7 * ERFC_SEG_WIDTH:
+            t: int256 = unsafe_sub(z, ERFC_SEG6_MID)
+            y = unsafe_add((unsafe_mul(ERFC_SEG6_6, t) >> POW), ERFC_SEG6_5)
+            y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG6_4)
+            y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG6_3)
+            y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG6_2)
+            y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG6_1)
+            y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG6_0)
+        else:
+            t: int256 = unsafe_sub(z, ERFC_SEG7_MID)
+            y = unsafe_add((unsafe_mul(ERFC_SEG7_5, t) >> POW), ERFC_SEG7_4)
+            y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG7_3)
+            y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG7_2)
+            y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG7_1)
+            y = unsafe_add((unsafe_mul(y, t) >> POW), ERFC_SEG7_0)
+
+    if x < 0:
+        y = unsafe_sub(TWO_SIGNED, y)
+
+    return convert(y, uint256)
+
+
+@external
+@pure
+def erfc(x: int256) -> uint256:
+    return self._erfc_internal(x)
+
+
+@external
+@pure
+def cdf(x: int256, u: int256, o: uint256) -> uint256:
+    z: int256 = unsafe_div(unsafe_mul(unsafe_sub(u, x), gaussian_core.INV_SQRT2_96), convert(o, int256))
+    return self._erfc_internal(z) >> 1
+
+
+@external
+@pure
+def cdf_pdf(x: int256, u: int256, o: uint256) -> (uint256, uint256):
+    o_signed: int256 = convert(o, int256)
+    z: int256 = unsafe_div(unsafe_mul(unsafe_sub(u, x), gaussian_core.INV_SQRT2_96), o_signed)
+    return self._erfc_internal(z) >> 1, gaussian_core._pdf_internal(z, o_signed)
+
+
+@external
+@pure
+def erfc_batch(xs: DynArray[int256, MAX_BATCH]) -> uint256[MAX_BATCH]:
+    # Fixed-size result like gaussian.erfc_batch, entries past len(xs) are 0
+    ys: uint256[MAX_BATCH] = empty(uint256[MAX_BATCH])
+    i: uint256 = 0
+    for x: int256 in xs:
+        ys[i] = self._erfc_internal(x)
+        i = unsafe_add(i, 1)
+    return ys
+
+
+@external
+@pure
+def cdf_batch(xs: DynArray[int256, MAX_BATCH], u: int256, o: uint256) -> uint256[MAX_BATCH]:
+    # Same division as cdf, so every entry equals cdf(xs[i], u, o)
+    o_signed: int256 = convert(o, int256)
+    ys: uint256[MAX_BATCH] = empty(uint256[MAX_BATCH])
+    i: uint256 = 0
+    for x: int256 in xs:
+        z: int256 = unsafe_div(unsafe_mul(unsafe_sub(u, x), gaussian_core.INV_SQRT2_96), o_signed)
+        ys[i] = self._erfc_internal(z) >> 1
+        i = unsafe_add(i, 1)
+    return ys
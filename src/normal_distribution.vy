@@ -0,0 +1,53 @@
+# @version ^0.4.0
+
+# vygauss: normal distribution with a fixed mean and standard deviation
+# u and o are set at deployment, and the per-call (u, o) work of gaussian.vy is precomputed
+# into immutables, so cdf and ppf take a single argument and cdf needs no division.
+# Deploy many instances cheaply through src/normal_distribution_factory.vy
+
+import gaussian_core
+
+POW: constant(uint256) = gaussian_core.POW
+ONE_SQUARED: constant(int256) = gaussian_core.ONE_SQUARED
+
+MEAN: public(immutable(int256))
+SIGMA: public(immutable(uint256))
+
+# o * sqrt(2) in WAD^2, the ppf scale
+O_SQRT2: immutable(int256)
+
+# 2^192 / (o * sqrt(2)), so the cdf argument (u - x) / (o * sqrt(2)) scaled by 2^96 is (u - x) * k >> 96
+CDF_K: immutable(int256)
+
+
+@deploy
+def __init__(u: int256, o: uint256):
+    """
+    @param u Mean in WAD
+    @param o Standard deviation in WAD
+    """
+    assert o > 0, "zero sigma"
+    MEAN = u
+    SIGMA = o
+    O_SQRT2 = convert(o, int256) * gaussian_core.SQRT2_WAD
+    CDF_K = gaussian_core.INV_SQRT2_192 // convert(o, int256)
+
+
+@external
+@view
+def cdf(x: int256) -> uint256:
+    """
+    @notice Cumulative probability of x in WAD
+    """
+    z: int256 = unsafe_mul(unsafe_sub(MEAN, x), CDF_K) >> POW
+    return gaussian_core._erfc_internal(z) >> 1
+
+
+@external
+@view
+def ppf(p: int256) -> int256:
+    """
+    @notice Value with cumulative probability p, both in WAD (0 < p < 1)
+    """
+    erfcinv_val: int256 = gaussian_core._erfcinv_internal(unsafe_mul(2, p))
+    return unsafe_sub(MEAN, unsafe_div(unsafe_mul(O_SQRT2, erfcinv_val), ONE_SQUARED))
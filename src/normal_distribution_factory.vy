@@ -0,0 +1,30 @@
+# @version ^0.4.0
+
+# vygauss: deploys normal_distribution.vy instances from a blueprint
+# Each instance is a minimal create_from_blueprint copy, so creating one costs the
+# runtime code deposit and the constructor, with no initcode in calldata
+
+event DistributionCreated:
+    distribution: indexed(address)
+    u: int256
+    o: uint256
+
+BLUEPRINT: public(immutable(address))
+
+
+@deploy
+def __init__(blueprint: address):
+    """
+    @param blueprint normal_distribution.vy deployed as an ERC-5202 blueprint
+    """
+    BLUEPRINT = blueprint
+
+
+@external
+def create(u: int256, o: uint256) -> address:
+    """
+    @notice Deploy a normal distribution with mean u and standard deviation o, both in WAD
+    """
+    distribution: address = create_from_blueprint(BLUEPRINT, u, o)
+    log DistributionCreated(distribution=distribution, u=u, o=o)
+    return distribution
@@ -1,21 +1,67 @@
+import os
 import pytest
-import subprocess
-import json
+import sys
+from functools import partial
+from hypothesis import HealthCheck, settings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import compile_cache  # noqa: E402
+import reference_tables  # noqa: E402
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+# Every contract the tests deploy, compiled into the cache before xdist workers start
+CONTRACTS = [
+    "gaussian.vy",
+    "gaussian_compact.vy",
+    "gaussian_segmented.vy",
+    "gaussian_memo.vy",
+    "black_scholes.vy",
+    "normal_distribution.vy",
+    "normal_distribution_factory.vy",
+    "examples/range_probability.vy",
+    "examples/range_probability_external.vy",
+    "examples/memo_caller.vy",
+]
+
+# Long differential fuzzing run: pytest --hypothesis-profile venom-fuzz
+settings.register_profile(
+    "venom-fuzz",
+    max_examples=5000,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+
+
+def pytest_sessionstart(session):
+    # With -n, the controller fills the compilation cache once and workers only unpickle.
+    # Without it, contracts compile lazily on first use.
+    is_worker = hasattr(session.config, "workerinput")
+    if not is_worker and getattr(session.config.option, "numprocesses", None):
+        for contract in CONTRACTS:
+            compile_cache.warm(SRC_DIR / contract)
 
 
 @pytest.fixture(scope="session")
-def compiled_contract():
-    result = subprocess.run(
-        ["vyper", "-f", "abi,bytecode", "src/gaussian.vy"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"Compilation failed: {result.stderr}")
+def src_dir():
+    return SRC_DIR
+
+
+@pytest.fixture(scope="session")
+def gaussian():
+    """gaussian.vy, deployed once per session (once per xdist worker) and shared by every module.
+
+    titanoboa's pytest plugin runs each test inside boa.env.anchor(), so state changes made by
+    a test are rolled back and the deployment never has to be repeated.
+    """
+    return compile_cache.load(SRC_DIR / "gaussian.vy")
 
-    output = result.stdout.strip()
-    abi_str, bytecode = output.split("\n")
-    return {"abi": json.loads(abi_str), "bytecode": bytecode}
+
+@pytest.fixture(scope="session")
+def compiled_contract():
+    """ABI, bytecode and source map of gaussian.vy from the compilation cache."""
+    return compile_cache.compile_artifacts(SRC_DIR / "gaussian.vy")
 
 
 @pytest.fixture
@@ -26,3 +72,22 @@ def wad():
 @pytest.fixture
 def pow96():
     return 2**96
+
+
+@pytest.fixture(scope="session")
+def reference_table():
+    """Loads the cached mpmath table for a reference_tables.Grid, generating it on first use."""
+    # xdist workers already run in parallel, a process pool per worker would oversubscribe
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return partial(reference_tables.load, workers=1)
+    return reference_tables.load
+
+
+@pytest.fixture(scope="session")
+def reference_value(reference_table):
+    """Cached mpmath value floor(f(x) * 1e18) at one input, a single-point reference table."""
+
+    def value(function: str, x: int, u: int = 0, o: int = 10**18) -> int:
+        return reference_table(reference_tables.Grid(function, x, x, 1, u, o))[0][1]
+
+    return value
@@ -0,0 +1,86 @@
+import pytest
+import boa
+import compile_cache
+from mpmath import mp, erfc, exp, log, mpf, floor, pi, sqrt
+from pathlib import Path
+
+mp.dps = 50
+
+WAD = 10**18
+ERROR_TOLERANCE = 10**10
+
+
+def get_black_scholes_python(s: int, k: int, t: int, v: int, r: int) -> dict:
+    s_f, k_f, t_f, v_f, r_f = (mpf(a) / 10**18 for a in (s, k, t, v, r))
+    d1 = (log(s_f / k_f) + (r_f + v_f**2 / 2) * t_f) / (v_f * sqrt(t_f))
+    d2 = d1 - v_f * sqrt(t_f)
+    n_d1 = erfc(-d1 / sqrt(2)) / 2
+    n_d2 = erfc(-d2 / sqrt(2)) / 2
+    strike_pv = k_f * exp(-r_f * t_f)
+    call = s_f * n_d1 - strike_pv * n_d2
+    return {
+        "call": int(floor(call * 10**18)),
+        "put": int(floor((call - s_f + strike_pv) * 10**18)),
+        "call_delta": int(floor(n_d1 * 10**18)),
+        "put_delta": int(floor((n_d1 - 1) * 10**18)),
+        "vega": int(floor(s_f * exp(-(d1**2) / 2) / sqrt(2 * pi) * sqrt(t_f) * 10**18)),
+    }
+
+
+@pytest.fixture(scope="session")
+def black_scholes():
+    contract_path = Path(__file__).parent.parent / "src" / "black_scholes.vy"
+    return compile_cache.load(contract_path)
+
+
+# (spot, strike, time in years, volatility, rate), all WAD
+OPTIONS = [
+    (100 * WAD, 100 * WAD, WAD, WAD // 5, WAD // 20),
+    (100 * WAD, 80 * WAD, WAD // 2, 3 * WAD // 10, 0),
+    (100 * WAD, 150 * WAD, 2 * WAD, WAD // 2, WAD // 10),
+    (2000 * WAD, 2500 * WAD, WAD // 12, 8 * WAD // 10, -WAD // 100),
+    (WAD, WAD, WAD // 365, WAD // 10, 0),
+    (100 * WAD, 10 * WAD, WAD, WAD // 5, 0),
+    (10 * WAD, 100 * WAD, WAD, WAD // 5, 0),
+]
+
+
+class TestBlackScholes:
+    @pytest.mark.parametrize("s,k,t,v,r", OPTIONS)
+    def test_call_put_known_values(self, black_scholes, s, k, t, v, r):
+        expected = get_black_scholes_python(s, k, t, v, r)
+        call, put = black_scholes.bs_call_put(s, k, t, v, r)
+
+        # Prices carry the 1e-8 cdf error scaled by the notional
+        tolerance = ERROR_TOLERANCE * max(s, k) // WAD
+        assert abs(call - max(expected["call"], 0)) < tolerance
+        assert abs(put - max(expected["put"], 0)) < tolerance
+
+    @pytest.mark.parametrize("s,k,t,v,r", OPTIONS)
+    def test_single_sided_match_call_put(self, black_scholes, s, k, t, v, r):
+        call, put = black_scholes.bs_call_put(s, k, t, v, r)
+        assert black_scholes.bs_call(s, k, t, v, r) == call
+        assert black_scholes.bs_put(s, k, t, v, r) == put
+
+    @pytest.mark.parametrize("s,k,t,v,r", OPTIONS)
+    def test_greeks_known_values(self, black_scholes, s, k, t, v, r):
+        expected = get_black_scholes_python(s, k, t, v, r)
+        call, put, call_delta, put_delta, vega = black_scholes.bs_call_put_greeks(s, k, t, v, r)
+
+        assert (call, put) == black_scholes.bs_call_put(s, k, t, v, r)
+        assert abs(call_delta - expected["call_delta"]) < ERROR_TOLERANCE
+        assert abs(put_delta - expected["put_delta"]) < ERROR_TOLERANCE
+        assert abs(vega - expected["vega"]) < ERROR_TOLERANCE * s // WAD
+
+    def test_put_call_parity_at_the_money_forward(self, black_scholes):
+        # With r = 0 and S = K, call and put are equal
+        call, put = black_scholes.bs_call_put(100 * WAD, 100 * WAD, WAD, WAD // 5, 0)
+        assert abs(call - put) <= 1
+
+    def test_zero_volatility_reverts(self, black_scholes):
+        with boa.reverts("zero volatility or time"):
+            black_scholes.bs_call(100 * WAD, 100 * WAD, WAD, 0, 0)
+
+    def test_zero_time_reverts(self, black_scholes):
+        with boa.reverts("zero volatility or time"):
+            black_scholes.bs_call(100 * WAD, 100 * WAD, 0, WAD // 5, 0)
@@ -0,0 +1,91 @@
+import compile_cache
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+LIBRARY = """
+@internal
+@pure
+def _double(x: uint256) -> uint256:
+    return x * {factor}
+"""
+
+CONSUMER = """
+import library
+
+@external
+@pure
+def double(x: uint256) -> uint256:
+    return library._double(x)
+"""
+
+
+def write_contracts(directory: Path, factor: int = 2) -> Path:
+    (directory / "library.vy").write_text(LIBRARY.format(factor=factor))
+    consumer = directory / "consumer.vy"
+    consumer.write_text(CONSUMER)
+    return consumer
+
+
+def key(path: Path, **settings) -> str:
+    return compile_cache.cache_key(path.read_text(), path, **settings)
+
+
+class TestCacheKey:
+    def test_key_depends_on_settings(self, tmp_path):
+        consumer = write_contracts(tmp_path)
+        keys = {
+            key(consumer),
+            key(consumer, experimental_codegen=True),
+            key(consumer, experimental_codegen=False),
+            key(consumer, optimize="codesize"),
+        }
+        assert len(keys) == 4
+
+    def test_key_depends_on_titanoboa_version(self, tmp_path, monkeypatch):
+        consumer = write_contracts(tmp_path)
+        before = key(consumer)
+        monkeypatch.setattr(compile_cache, "version", lambda package: "0.0.0")
+        assert key(consumer) != before
+
+    def test_key_depends_on_imported_source(self, tmp_path):
+        consumer = write_contracts(tmp_path)
+        before = key(consumer)
+        write_contracts(tmp_path, factor=3)
+        assert key(consumer) != before
+
+    def test_gaussian_dependencies(self):
+        source = (SRC_DIR / "examples" / "range_probability.vy").read_text()
+        deps = compile_cache.dependencies(source, SRC_DIR / "examples" / "range_probability.vy")
+        assert (SRC_DIR / "gaussian_core.vy").resolve() in deps
+
+
+class TestCache:
+    def test_changed_import_recompiles(self, tmp_path):
+        consumer = write_contracts(tmp_path)
+        cache_dir = tmp_path / "cache"
+        assert compile_cache.load_partial(consumer, cache_dir=cache_dir).deploy().double(5) == 10
+
+        write_contracts(tmp_path, factor=3)
+        assert compile_cache.load_partial(consumer, cache_dir=cache_dir).deploy().double(5) == 15
+
+    def test_hit_from_disk_matches_compile(self, tmp_path):
+        consumer = write_contracts(tmp_path)
+        cache_dir = tmp_path / "cache"
+        compiled = compile_cache.load_partial(consumer, True, cache_dir=cache_dir)
+
+        compile_cache._deployers.clear()
+        cached = compile_cache.load_partial(consumer, True, cache_dir=cache_dir)
+        assert cached is not compiled
+        assert cached.compiler_data.bytecode == compiled.compiler_data.bytecode
+        assert cached.deploy().double(21) == 42
+
+    def test_artifacts(self, tmp_path):
+        consumer = write_contracts(tmp_path)
+        result = compile_cache.compile_artifacts(consumer, cache_dir=tmp_path / "cache")
+        deployer = compile_cache.load_partial(consumer, cache_dir=tmp_path / "cache")
+
+        assert [f["name"] for f in result["abi"]] == ["double"]
+        assert result["bytecode"] == "0x" + deployer.compiler_data.bytecode.hex()
+        assert result["bytecode_runtime"] == "0x" + deployer.compiler_data.bytecode_runtime.hex()
+        assert len(result["source_map"]["pc_pos_map"]) > 0
@@ -1,30 +1,13 @@
 import pytest
 import boa
-from mpmath import mp, erf, erfinv as mp_erfinv, mpf, floor, sqrt
-from pathlib import Path
-
-mp.dps = 50
+from emulator import C
+from reference_tables import Grid
 
 WAD = 10**18
 POW96 = 2**96
 ERROR_TOLERANCE = 10**10
 
 
-def get_erfc_python(x_wad: int) -> int:
-    x_float = mpf(x_wad) / 10**18
-    result = mpf(1) - erf(x_float)
-    return int(floor(result * 10**18))
-
-
-def get_cdf_python(x: int, u: int, o: int) -> int:
-    x_f = mpf(x) / 10**18
-    u_f = mpf(u) / 10**18
-    o_f = mpf(o) / 10**18
-    z = -(x_f - u_f) / (o_f * sqrt(2))
-    result = (1 - erf(z)) / 2
-    return int(floor(abs(result) * 10**18))
-
-
 def to_x96(x_wad: int) -> int:
     return (x_wad * POW96) // WAD
 
@@ -35,12 +18,6 @@ def from_signed_int256(val: int) -> int:
     return val
 
 
-@pytest.fixture(scope="module")
-def gaussian():
-    contract_path = Path(__file__).parent.parent / "src" / "gaussian.vy"
-    return boa.load(str(contract_path))
-
-
 class TestErfc:
     @pytest.mark.parametrize(
         "x_wad",
@@ -56,10 +33,10 @@ class TestErfc:
             -2 * WAD,
         ],
     )
-    def test_erfc_known_values(self, gaussian, x_wad):
+    def test_erfc_known_values(self, gaussian, reference_value, x_wad):
         x_96 = to_x96(x_wad)
         actual = gaussian.erfc(x_96)
-        expected = get_erfc_python(x_wad)
+        expected = reference_value("erfc", x_96)
 
         error = abs(actual - expected)
         assert error < ERROR_TOLERANCE, f"erfc({x_wad / WAD}) error {error} >= {ERROR_TOLERANCE}"
@@ -97,9 +74,9 @@ class TestCdf:
             (0, -WAD, 2 * WAD),
         ],
     )
-    def test_cdf_known_values(self, gaussian, x, u, o):
+    def test_cdf_known_values(self, gaussian, reference_value, x, u, o):
         actual = gaussian.cdf(x, u, o)
-        expected = get_cdf_python(x, u, o)
+        expected = reference_value("cdf", x, u, o)
 
         error = abs(actual - expected)
         assert error < ERROR_TOLERANCE, (
@@ -129,6 +106,36 @@ class TestCdf:
             prev = result
 
 
+class TestPdf:
+    @pytest.mark.parametrize(
+        "x,u,o",
+        [
+            (0, 0, WAD),
+            (WAD, 0, WAD),
+            (-3 * WAD, 0, WAD),
+            (2 * WAD, WAD, WAD // 3),
+            (0, -WAD, 2 * WAD),
+            (6 * WAD, 0, WAD),
+            (20 * WAD, 0, WAD),
+        ],
+    )
+    def test_pdf_known_values(self, gaussian, reference_value, x, u, o):
+        actual = gaussian.pdf(x, u, o)
+        expected = reference_value("pdf", x, u, o)
+
+        error = abs(actual - expected)
+        assert error < ERROR_TOLERANCE, (
+            f"pdf({x / WAD}, {u / WAD}, {o / WAD}) error {error} >= {ERROR_TOLERANCE}"
+        )
+
+    def test_pdf_symmetry(self, gaussian):
+        assert gaussian.pdf(WAD, 0, WAD) == gaussian.pdf(-WAD, 0, WAD)
+
+    @pytest.mark.parametrize("x,u,o", [(0, 0, WAD), (WAD, 0, WAD), (-2 * WAD, WAD, 2 * WAD)])
+    def test_cdf_pdf_matches_separate_calls(self, gaussian, x, u, o):
+        assert gaussian.cdf_pdf(x, u, o) == (gaussian.cdf(x, u, o), gaussian.pdf(x, u, o))
+
+
 class TestErfinv:
     @pytest.mark.parametrize(
         "x_wad",
@@ -142,15 +149,10 @@ class TestErfinv:
             -9 * WAD // 10,
         ],
     )
-    def test_erfinv_known_values(self, gaussian, x_wad):
+    def test_erfinv_known_values(self, gaussian, reference_value, x_wad):
         x_96 = to_x96(x_wad)
         actual = from_signed_int256(gaussian.erfinv(x_96))
-
-        x_float = mpf(x_wad) / 10**18
-        try:
-            expected = int(floor(mp_erfinv(x_float) * 10**18))
-        except:
-            expected = 0
+        expected = reference_value("erfinv", x_96)
 
         error = abs(actual - expected)
         assert error < ERROR_TOLERANCE, f"erfinv({x_wad / WAD}) error {error} >= {ERROR_TOLERANCE}"
@@ -166,6 +168,32 @@ class TestErfinv:
 
         assert abs(y_pos + y_neg) < ERROR_TOLERANCE
 
+    @pytest.mark.parametrize(
+        "one_minus_x_96",
+        [
+            POW96 // 100,
+            POW96 // 200,
+            POW96 // 1000,
+            POW96 // 10**4,
+            POW96 // 10**6,
+            POW96 // 10**12,
+            POW96 // 10**18,
+            POW96 // 10**24,
+            1,
+        ],
+    )
+    def test_erfinv_tail(self, gaussian, reference_value, one_minus_x_96):
+        x_96 = POW96 - one_minus_x_96
+
+        for sign in [1, -1]:
+            actual = from_signed_int256(gaussian.erfinv(sign * x_96))
+            error = abs(actual - reference_value("erfinv", sign * x_96))
+            assert error < ERROR_TOLERANCE, f"erfinv(1 - {one_minus_x_96}/2^96) error {error}"
+
+    def test_erfinv_at_one_reverts(self, gaussian):
+        with boa.reverts("erfinv undefined"):
+            gaussian.erfinv(POW96)
+
 
 class TestErfcinv:
     @pytest.mark.parametrize(
@@ -177,14 +205,9 @@ class TestErfcinv:
             3 * WAD // 2,
         ],
     )
-    def test_erfcinv_known_values(self, gaussian, x_wad):
+    def test_erfcinv_known_values(self, gaussian, reference_value, x_wad):
         actual = from_signed_int256(gaussian.erfcinv(x_wad))
-
-        x_float = mpf(x_wad) / 10**18
-        try:
-            expected = int(floor(mp_erfinv(1 - x_float) * 10**18))
-        except:
-            expected = 0
+        expected = reference_value("erfcinv", x_wad)
 
         error = abs(actual - expected)
         assert error < ERROR_TOLERANCE, f"erfcinv({x_wad / WAD}) error {error} >= {ERROR_TOLERANCE}"
@@ -217,3 +240,173 @@ class TestCdfPpfInverse:
             assert error < ERROR_TOLERANCE * 100, (
                 f"cdf(ppf({p / WAD})) != {p / WAD}, got {p_back / WAD}"
             )
+
+
+class TestBatch:
+    """The *_batch functions return MAX_BATCH slots, the first len(xs) hold the results."""
+
+    def test_erfc_batch_matches_single(self, gaussian):
+        xs = [to_x96(x) for x in [0, WAD // 2, WAD, 3 * WAD, 5 * WAD, -WAD, -5 * WAD]]
+        assert gaussian.erfc_batch(xs)[: len(xs)] == [gaussian.erfc(x) for x in xs]
+
+    def test_erfinv_batch_matches_single(self, gaussian):
+        xs = [to_x96(int(x * WAD)) for x in [0, 0.5, 0.9, 0.98, 0.995, -0.5, -0.995]]
+        assert gaussian.erfinv_batch(xs)[: len(xs)] == [gaussian.erfinv(x) for x in xs]
+
+    def test_ppf_batch_matches_single(self, gaussian):
+        ps = [int(p * WAD) for p in [0.01, 0.25, 0.5, 0.75, 0.99]]
+        u, o = WAD, 2 * WAD
+        assert gaussian.ppf_batch(ps, u, o)[: len(ps)] == [gaussian.ppf(p, u, o) for p in ps]
+
+    # x > u gives a negative z, and a small o a large |z| from nearby x
+    @pytest.mark.parametrize(
+        "u,o", [(0, WAD), (WAD, WAD), (-WAD, 2 * WAD), (0, WAD // 3), (0, 10**6), (WAD, 1)]
+    )
+    def test_cdf_batch_matches_single(self, gaussian, u, o):
+        xs = [-3 * WAD, -WAD, u - 7 * o, u - o // 3, u, u + 1, u + o // 3, u + 7 * o, 10 * WAD]
+        assert gaussian.cdf_batch(xs, u, o)[: len(xs)] == [gaussian.cdf(x, u, o) for x in xs]
+
+    def test_batch_empty(self, gaussian):
+        assert gaussian.erfc_batch([]) == [0] * 128
+        assert gaussian.cdf_batch([], 0, WAD) == [0] * 128
+
+    def test_batch_pads_with_zeros(self, gaussian):
+        assert gaussian.erfc_batch([to_x96(WAD)])[1:] == [0] * 127
+
+    def test_batch_max_size(self, gaussian):
+        xs = [to_x96(WAD)] * 128
+        assert gaussian.erfc_batch(xs) == [gaussian.erfc(xs[0])] * 128
+
+
+class TestDenseSweep:
+    """Dense grids against the cached mpmath tables from scripts/reference_tables.py."""
+
+    def test_erfc(self, gaussian, reference_table):
+        table = reference_table(Grid("erfc", -5 * POW96, 5 * POW96, 4001))
+        for rows in table.chunks(128):
+            actual = gaussian.erfc_batch([x for x, _ in rows])
+            for (x, expected), y in zip(rows, actual):
+                assert abs(y - expected) < ERROR_TOLERANCE, f"erfc({x / POW96}) error"
+
+    def test_erfinv(self, gaussian, reference_table):
+        table = reference_table(Grid("erfinv", -(POW96 - 1), POW96 - 1, 4001))
+        for rows in table.chunks(128):
+            actual = gaussian.erfinv_batch([x for x, _ in rows])
+            for (x, expected), y in zip(rows, actual):
+                assert abs(y - expected) < ERROR_TOLERANCE, f"erfinv({x / POW96}) error"
+
+    def test_erfcinv(self, gaussian, reference_table):
+        table = reference_table(Grid("erfcinv", 10**9, 2 * WAD - 10**9, 1001))
+        for x, expected in table:
+            actual = from_signed_int256(gaussian.erfcinv(x))
+            assert abs(actual - expected) < ERROR_TOLERANCE, f"erfcinv({x / WAD}) error"
+
+    def test_cdf(self, gaussian, reference_table):
+        u, o = 1000 * WAD, 50 * WAD
+        table = reference_table(Grid("cdf", u - 6 * o, u + 6 * o, 2001, u, o))
+        for rows in table.chunks(128):
+            actual = gaussian.cdf_batch([x for x, _ in rows], u, o)
+            for (x, expected), y in zip(rows, actual):
+                assert abs(y - expected) < ERROR_TOLERANCE, f"cdf({x / WAD}) error"
+
+    def test_ppf(self, gaussian, reference_table):
+        u, o = 1000 * WAD, 50 * WAD
+        table = reference_table(Grid("ppf", 10**9, WAD - 10**9, 2001, u, o))
+        for rows in table.chunks(128):
+            actual = gaussian.ppf_batch([x for x, _ in rows], u, o)
+            for (x, expected), y in zip(rows, actual):
+                # ppf error scales with o
+                assert abs(y - expected) < ERROR_TOLERANCE * o // WAD, f"ppf({x / WAD}) error"
+
+
+
+class TestLogCdf:
+    """ln(cdf) and ln(1 - cdf) against mpmath, relative to |expected| where it exceeds 1."""
+
+    LOG_TOLERANCE = 2 * 10**10  # 2e-8
+
+    def assert_close(self, actual: int, expected: int, label: str):
+        error = abs(from_signed_int256(actual) - expected)
+        assert error < self.LOG_TOLERANCE * max(WAD, abs(expected)) // WAD, f"{label} error {error}"
+
+    def test_log_cdf(self, gaussian, reference_table):
+        u, o = 1000 * WAD, 50 * WAD
+        table = reference_table(Grid("log_cdf", u - 40 * o, u + 10 * o, 2001, u, o))
+        for x, expected in table:
+            self.assert_close(gaussian.log_cdf(x, u, o), expected, f"log_cdf({x / WAD})")
+
+    def test_log_sf(self, gaussian, reference_table):
+        u, o = 1000 * WAD, 50 * WAD
+        table = reference_table(Grid("log_sf", u - 10 * o, u + 40 * o, 2001, u, o))
+        for x, expected in table:
+            self.assert_close(gaussian.log_sf(x, u, o), expected, f"log_sf({x / WAD})")
+
+    @pytest.mark.parametrize("sigmas", [5, 38, 100, 10**4, 10**9])
+    def test_beyond_cdf_cutoff(self, gaussian, reference_value, sigmas):
+        """cdf rounds to 0 past ERFC_UPPER, log_cdf keeps following the tail."""
+        x = -sigmas * WAD
+        assert gaussian.cdf(x, 0, WAD) < 10**12
+        expected = reference_value("log_cdf", x)
+        self.assert_close(gaussian.log_cdf(x, 0, WAD), expected, f"log_cdf(-{sigmas} sigma)")
+
+    def test_log_sf_mirrors_log_cdf(self, gaussian):
+        u, o = WAD, 3 * WAD
+        for x in [-20 * WAD, -WAD, 0, WAD // 3, 7 * WAD, 50 * WAD]:
+            assert gaussian.log_sf(x, u, o) == gaussian.log_cdf(2 * u - x, u, o)
+
+    def test_monotonic_across_tail_switch(self, gaussian):
+        # z = 0.5 is 0.5 * sqrt(2) = 0.7071 sigma below the mean
+        xs = [-int(0.7071 * WAD) + i * 10**12 for i in range(-50, 51)]
+        ys = [from_signed_int256(gaussian.log_cdf(x, 0, WAD)) for x in xs]
+        assert ys == sorted(ys)
+
+
+class TestFastTier:
+    """erfc_fast / cdf_fast / ppf_fast against the mpmath tables, at their documented bounds."""
+
+    ERFC_TOLERANCE = 2 * 10**12  # 2e-6
+    CDF_TOLERANCE = 10**12  # 1e-6
+    PPF_TOLERANCE = 10**12  # 1e-6 * o
+
+    def test_erfc(self, gaussian, reference_table):
+        table = reference_table(Grid("erfc", -5 * POW96, 5 * POW96, 4001))
+        for x, expected in table:
+            error = abs(gaussian.erfc_fast(x) - expected)
+            assert error < self.ERFC_TOLERANCE, f"erfc_fast({x / POW96}) error {error}"
+
+    def test_erfc_cutoff(self, gaussian):
+        """The fit crosses 0 just past ERFC_FAST_UPPER, below it the result must not underflow."""
+        upper = C["ERFC_FAST_UPPER"]
+        assert 0 < gaussian.erfc_fast(upper - 1) < self.ERFC_TOLERANCE
+        assert gaussian.erfc_fast(upper) == 0
+        assert gaussian.erfc_fast(-upper) == 2 * WAD
+
+    def test_cdf(self, gaussian, reference_table):
+        u, o = 1000 * WAD, 50 * WAD
+        table = reference_table(Grid("cdf", u - 6 * o, u + 6 * o, 2001, u, o))
+        for x, expected in table:
+            error = abs(gaussian.cdf_fast(x, u, o) - expected)
+            assert error < self.CDF_TOLERANCE, f"cdf_fast({x / WAD}) error {error}"
+
+    def test_ppf(self, gaussian, reference_table):
+        u, o = 1000 * WAD, 50 * WAD
+        table = reference_table(Grid("ppf", 10**9, WAD - 10**9, 2001, u, o))
+        for x, expected in table:
+            error = abs(from_signed_int256(gaussian.ppf_fast(x, u, o)) - expected)
+            assert error < self.PPF_TOLERANCE * o // WAD, f"ppf_fast({x / WAD}) error {error}"
+
+    def test_ppf_erfinv_range2(self, gaussian, reference_table):
+        """p in [5e-5, 5e-3], where erfinv takes its (2, 3) fast rational."""
+        u, o = 0, WAD
+        table = reference_table(Grid("ppf", 5 * 10**13, 5 * 10**15, 2001, u, o))
+        for x, expected in table:
+            error = abs(from_signed_int256(gaussian.ppf_fast(x, u, o)) - expected)
+            assert error < self.PPF_TOLERANCE, f"ppf_fast({x / WAD}) error {error}"
+
+    @pytest.mark.parametrize("p", [WAD // 100, WAD // 10**3, 10**12, 10**6, 1])
+    def test_ppf_tail(self, gaussian, reference_value, p):
+        """Probabilities below 0.005 take the fast erfinv tail, down to 1 wei."""
+        for x in [p, WAD - p]:
+            actual = from_signed_int256(gaussian.ppf_fast(x, 0, WAD))
+            error = abs(actual - reference_value("ppf", x))
+            assert error < self.PPF_TOLERANCE, f"ppf_fast({x / WAD}) error {error}"
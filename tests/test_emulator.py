@@ -0,0 +1,141 @@
+import random
+import sys
+import pytest
+import boa
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import compile_cache  # noqa: E402
+import emulator  # noqa: E402
+
+WAD = 10**18
+POW96 = 2**96
+MAX_BATCH = 128
+SAMPLE_BATCHES = 16
+
+HARNESS = """
+import gaussian_core
+
+@external
+@pure
+def sqrt(x: uint256) -> uint256:
+    return gaussian_core._sqrt(x)
+
+@external
+@pure
+def ln_wad(x: int256) -> int256:
+    return gaussian_core._ln_wad(x)
+"""
+
+
+@pytest.fixture(scope="session")
+def harness(src_dir):
+    # Exposes the gaussian_core internals that gaussian.vy has no external for
+    return compile_cache.loads(HARNESS, filename=src_dir / "emulator_harness.vy")
+
+
+def sample(rng: random.Random, low: int, high: int, edges: list) -> list:
+    """Edge cases first, then uniform and log-uniform magnitudes in [low, high]."""
+    xs = [x for x in edges if low <= x <= high]
+    while len(xs) < SAMPLE_BATCHES * MAX_BATCH:
+        if rng.random() < 0.5:
+            xs.append(rng.randint(low, high))
+        else:
+            x = rng.randint(0, 2 ** rng.randint(0, max(abs(low), abs(high)).bit_length()))
+            xs.append(min(max(x if rng.random() < 0.5 or low >= 0 else -x, low), high))
+    return xs
+
+
+def batches(xs: list):
+    for i in range(0, len(xs), MAX_BATCH):
+        yield xs[i : i + MAX_BATCH]
+
+
+ERFC_EDGES = [0, 1, -1, emulator.C["ERFC_UPPER"], emulator.C["ERFC_UPPER"] - 1, 4 * POW96]
+ERFINV_EDGES = [
+    0,
+    emulator.C["ERFINV_0_99"] - 1,
+    emulator.C["ERFINV_0_99"],
+    emulator.C["ERFINV_0_9999"] - 1,
+    emulator.C["ERFINV_0_9999"],
+    POW96 - 1,
+    -(POW96 - 1),
+]
+
+
+class TestEmulatorDifferential:
+    def test_erfc(self, gaussian):
+        xs = sample(random.Random(1), -6 * POW96, 6 * POW96, ERFC_EDGES + [-x for x in ERFC_EDGES])
+        for batch in batches(xs):
+            expected = gaussian.erfc_batch(batch)[: len(batch)]
+            assert [emulator.erfc(x) for x in batch] == expected
+            assert list(emulator.batch_erfc(batch)) == expected
+
+    def test_erfinv(self, gaussian):
+        xs = sample(random.Random(2), -(POW96 - 1), POW96 - 1, ERFINV_EDGES)
+        for batch in batches(xs):
+            expected = gaussian.erfinv_batch(batch)[: len(batch)]
+            assert [emulator.erfinv(x) for x in batch] == expected
+            assert list(emulator.batch_erfinv(batch)) == expected
+
+    def test_erfcinv(self, gaussian):
+        xs = sample(random.Random(3), 1, 2 * WAD - 1, [1, WAD, 2 * WAD - 1])
+        for x in xs[:MAX_BATCH]:
+            assert emulator.erfcinv(x) == gaussian.erfcinv(x)
+        for batch in batches(xs):
+            assert list(emulator.batch_erfcinv(batch)) == [emulator.erfcinv(x) for x in batch]
+
+    @pytest.mark.parametrize("u,o", [(0, WAD), (1000 * WAD, 50 * WAD), (-WAD, 10**12)])
+    def test_cdf(self, gaussian, u, o):
+        xs = sample(random.Random(4), u - 10 * o, u + 10 * o, [u, u - 1, u + 1])
+        for batch in batches(xs):
+            expected = gaussian.cdf_batch(batch, u, o)[: len(batch)]
+            assert [emulator.cdf(x, u, o) for x in batch] == expected
+            assert list(emulator.batch_cdf(batch, u, o)) == expected
+
+    @pytest.mark.parametrize("u,o", [(0, WAD), (1000 * WAD, 50 * WAD), (-WAD, 10**12)])
+    def test_ppf(self, gaussian, u, o):
+        xs = sample(random.Random(5), 1, WAD - 1, [1, WAD // 2, WAD - 1])
+        for batch in batches(xs):
+            expected = gaussian.ppf_batch(batch, u, o)[: len(batch)]
+            assert [emulator.ppf(x, u, o) for x in batch] == expected
+            assert list(emulator.batch_ppf(batch, u, o)) == expected
+
+    def test_sqrt(self, harness):
+        xs = sample(random.Random(6), 0, 2**256 - 1, [0, 1, 2, 3, 4, 2**128, 2**256 - 1])
+        for x in xs[: 2 * MAX_BATCH]:
+            assert emulator.sqrt(x) == harness.sqrt(x)
+
+    def test_ln_wad(self, harness):
+        xs = sample(random.Random(7), 1, 2**255 - 1, [1, WAD - 1, WAD, WAD + 1, 2**255 - 1])
+        for x in xs[: 2 * MAX_BATCH]:
+            assert emulator.ln_wad(x) == harness.ln_wad(x)
+
+
+class TestEmulatorReverts:
+    @pytest.mark.parametrize("x", [POW96, -POW96, 2 * POW96])
+    def test_erfinv_undefined(self, gaussian, x):
+        with boa.reverts("erfinv undefined"):
+            gaussian.erfinv(x)
+        with pytest.raises(emulator.Revert, match="erfinv undefined"):
+            emulator.erfinv(x)
+        with pytest.raises(emulator.Revert, match="erfinv undefined"):
+            emulator.batch_erfinv([0, x])
+
+    def test_ln_undefined(self, harness):
+        with boa.reverts("ln undefined"):
+            harness.ln_wad(0)
+        with pytest.raises(emulator.Revert, match="ln undefined"):
+            emulator.ln_wad(0)
+
+    def test_erfc_int256_min(self, gaussian):
+        with boa.reverts():
+            gaussian.erfc(-(2**255))
+        with pytest.raises(emulator.Revert):
+            emulator.erfc(-(2**255))
+
+    def test_cdf_sigma_above_int256(self, gaussian):
+        with boa.reverts():
+            gaussian.cdf(0, 0, 2**255)
+        with pytest.raises(emulator.Revert):
+            emulator.cdf(0, 0, 2**255)
@@ -0,0 +1,73 @@
+import pytest
+import boa
+import compile_cache
+from mpmath import mp, erf, erfinv, mpf, floor, sqrt
+from pathlib import Path
+
+mp.dps = 50
+
+WAD = 10**18
+ERROR_TOLERANCE = 10**10
+
+
+def get_range_probability_python(lower: int, upper: int, u: int, o: int) -> int:
+    o_f = mpf(o) / 10**18
+    z_upper = (mpf(upper - u) / 10**18) / (o_f * sqrt(2))
+    z_lower = (mpf(lower - u) / 10**18) / (o_f * sqrt(2))
+    return int(floor((erf(z_upper) - erf(z_lower)) / 2 * 10**18))
+
+
+def get_quantile_python(p: int, u: int, o: int) -> int:
+    result = mpf(u) / 10**18 + mpf(o) / 10**18 * sqrt(2) * erfinv(2 * mpf(p) / 10**18 - 1)
+    return int(floor(result * 10**18))
+
+
+@pytest.fixture(scope="session")
+def examples_dir():
+    return Path(__file__).parent.parent / "src" / "examples"
+
+
+@pytest.fixture(scope="session")
+def inlined(examples_dir):
+    return compile_cache.load(examples_dir / "range_probability.vy")
+
+
+@pytest.fixture(scope="session")
+def external(examples_dir, gaussian):
+    return compile_cache.load(examples_dir / "range_probability_external.vy", gaussian.address)
+
+
+RANGES = [
+    (-WAD, WAD, 0, WAD),
+    (0, 3 * WAD, 0, WAD),
+    (900 * WAD, 1100 * WAD, 1000 * WAD, 50 * WAD),
+    (-5 * WAD, -WAD, WAD, 2 * WAD),
+    (WAD, WAD, 0, WAD),
+]
+
+
+class TestRangeProbability:
+    @pytest.mark.parametrize("lower,upper,u,o", RANGES)
+    def test_probability_in_range_known_values(self, inlined, lower, upper, u, o):
+        expected = get_range_probability_python(lower, upper, u, o)
+        assert abs(inlined.probability_in_range(lower, upper, u, o) - expected) < ERROR_TOLERANCE
+
+    @pytest.mark.parametrize("p", [WAD // 100, WAD // 4, WAD // 2, 975 * WAD // 1000])
+    def test_quantile_known_values(self, inlined, p):
+        expected = get_quantile_python(p, WAD, 2 * WAD)
+        assert abs(inlined.quantile(p, WAD, 2 * WAD) - expected) < 2 * ERROR_TOLERANCE
+
+    @pytest.mark.parametrize("lower,upper,u,o", RANGES)
+    def test_inlined_matches_external_call(self, inlined, external, lower, upper, u, o):
+        assert inlined.probability_in_range(lower, upper, u, o) == external.probability_in_range(
+            lower, upper, u, o
+        )
+        assert inlined.quantile(WAD // 3, u, o) == external.quantile(WAD // 3, u, o)
+
+    def test_empty_range_reverts(self, inlined):
+        with boa.reverts("empty range"):
+            inlined.probability_in_range(WAD, -WAD, 0, WAD)
+
+    def test_quantile_out_of_range_reverts(self, inlined):
+        with boa.reverts("p out of range"):
+            inlined.quantile(WAD, 0, WAD)
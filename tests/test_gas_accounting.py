@@ -0,0 +1,54 @@
+import gas_accounting
+import pytest
+from boa.profiling import GlobalProfile
+from gas_benchmark import BENCHMARK_INPUTS, load_gaussian
+
+
+@pytest.fixture(autouse=True, scope="module")
+def keep_gas_report():
+    """Calls under profiling() land in boa's session gas report, drop them again."""
+    previous = GlobalProfile._singleton
+    GlobalProfile.clear_singleton()
+    yield
+    GlobalProfile._singleton = previous
+
+
+@pytest.fixture(scope="module")
+def venom_gaussian():
+    return load_gaussian(True)
+
+
+class TestBreakdown:
+    @pytest.mark.parametrize("function", list(BENCHMARK_INPUTS))
+    @pytest.mark.parametrize("venom", [False, True])
+    def test_parts_sum_to_total(self, gaussian, venom_gaussian, function, venom):
+        contract = venom_gaussian if venom else gaussian
+        args = BENCHMARK_INPUTS[function][0]
+        with gas_accounting.profiling():
+            getattr(contract, function)(*args)
+            parts = gas_accounting.breakdown(contract)
+        assert sum(parts.values()) == contract._computation.get_gas_used()
+        assert parts['dispatch'] > 90
+        assert parts['compute'] > parts['dispatch']
+        if not venom and function in ('log_cdf', 'log_sf'):
+            # The standard build hands the arguments to the core internal with one
+            # CALLDATACOPY, which also pays for the memory it copies into
+            assert parts['abi_decode'] > 6 * len(args)
+        else:
+            # One CALLDATALOAD (3) and its offset PUSH (3) per word argument
+            assert parts['abi_decode'] == 6 * len(args)
+
+    def test_dispatch_differs_per_function(self, gaussian):
+        # Which pair shares a dispatch cost moves with the selector table, so compare them all
+        rows = {
+            function: gas_accounting.account(gaussian, function, inputs[:1])
+            for function, inputs in BENCHMARK_INPUTS.items()
+        }
+        assert len({row['dispatch'] for row in rows.values()}) > 1
+        erfc = gas_accounting.account(gaussian, 'erfc', BENCHMARK_INPUTS['erfc'])
+        assert erfc['total'] == pytest.approx(sum(erfc[c] for c in gas_accounting.CATEGORIES))
+
+    def test_requires_profiling(self, gaussian):
+        gaussian.erfc(0)
+        with pytest.raises(RuntimeError, match="profiling"):
+            gas_accounting.breakdown(gaussian)
@@ -0,0 +1,99 @@
+import compile_cache
+import gas_bound
+import pytest
+from gas_benchmark import BENCHMARK_INPUTS
+from pathlib import Path
+
+STRAIGHT_LINE = """
+@external
+@pure
+def noop() -> uint256:
+    return 0
+
+@external
+@pure
+def mix(x: uint256, y: uint256) -> uint256:
+    return unsafe_add(unsafe_mul(x, y), x >> 3)
+"""
+
+LOOPS = """
+@external
+@pure
+def fixed(x: uint256) -> uint256:
+    acc: uint256 = x
+    for i: uint256 in range(8):
+        acc = unsafe_add(acc, i)
+    return acc
+
+@external
+@pure
+def variable(n: uint256) -> uint256:
+    acc: uint256 = 0
+    for i: uint256 in range(n, bound=8):
+        acc = unsafe_add(acc, i)
+    return acc
+"""
+
+
+def load(source: str, name: str):
+    return compile_cache.loads(source, filename=Path(__file__).parent / name)
+
+
+@pytest.fixture(scope="module")
+def bounds(gaussian):
+    return gas_bound.contract_bounds(gaussian)
+
+
+class TestBound:
+    def test_straight_line_is_exact(self):
+        contract = load(STRAIGHT_LINE, "gas_bound_straight.vy")
+        bounds = gas_bound.contract_bounds(contract)
+        contract.noop()
+        assert bounds['noop'][0] == contract._computation.get_gas_used()
+        contract.mix(3, 5)
+        assert bounds['mix'][0] == contract._computation.get_gas_used()
+
+    def test_loops(self):
+        """A constant trip count is unrolled, one set by an argument cannot be bounded."""
+        contract = load(LOOPS, "gas_bound_loops.vy")
+        gas, _ = gas_bound.contract_bounds(contract, ['fixed'])['fixed']
+        contract.fixed(1)
+        assert gas == contract._computation.get_gas_used()
+        with pytest.raises(gas_bound.AnalysisError, match="loop"):
+            gas_bound.contract_bounds(contract, ['variable'])
+
+    def test_batch_functions_skipped(self, bounds):
+        assert 'erfc' in bounds and 'cdf_pdf' in bounds
+        assert not any(name.endswith('_batch') for name in bounds)
+
+
+class TestGaussian:
+    @pytest.mark.parametrize("function", list(BENCHMARK_INPUTS))
+    def test_bound_holds(self, gaussian, bounds, function):
+        gas, _ = bounds[function]
+        fn = getattr(gaussian, function)
+        observed = []
+        for args in BENCHMARK_INPUTS[function]:
+            fn(*args)
+            observed.append(gaussian._computation.get_gas_used())
+        assert max(observed) <= gas
+
+    @pytest.mark.parametrize("function", ['erfc', 'cdf', 'pdf'])
+    def test_tight_without_infeasible_paths(self, gaussian, bounds, function):
+        """Few branches, all reachable: some benchmark input takes the worst path."""
+        gas, _ = bounds[function]
+        fn = getattr(gaussian, function)
+        observed = []
+        for args in BENCHMARK_INPUTS[function]:
+            fn(*args)
+            observed.append(gaussian._computation.get_gas_used())
+        assert max(observed) == gas
+
+    def test_worst_path_takes_erfinv_tail(self, gaussian, bounds):
+        _, branches = bounds['erfinv']
+        source_map = gaussian.source_map["pc_raw_ast_map"]
+        lines = {source_map[pc].lineno for pc, _ in branches if pc in source_map}
+        tail_check = next(i for i, line in enumerate(
+            (Path(__file__).parent.parent / "src/gaussian_core.vy").read_text().splitlines(), 1)
+            if 'assert w > 0, "erfinv undefined"' in line)
+        assert tail_check in lines
@@ -0,0 +1,39 @@
+import pytest
+import compile_cache
+
+WAD = 10**18
+POW96 = 2**96
+
+
+# Probabilities from the body to the erfinv tail
+PROBABILITIES = [WAD // 100, WAD // 4, WAD // 2, 3 * WAD // 4, WAD - 10**15, WAD - 10**14]
+
+
+@pytest.fixture(scope="session")
+def compact(src_dir):
+    return compile_cache.load(src_dir / "gaussian_compact.vy")
+
+
+class TestCompactBuild:
+    def test_smaller_than_default_build(self, compact, gaussian):
+        compact_size = len(compact.compiler_data.bytecode_runtime)
+        assert compact_size < len(gaussian.compiler_data.bytecode_runtime)
+
+    def test_same_abi(self, compact, gaussian):
+        def names(c):
+            return sorted(f["name"] for f in c.abi if f["type"] == "function")
+
+        assert names(compact) == names(gaussian)
+
+    @pytest.mark.parametrize("x", [i * POW96 // 4 for i in range(-18, 19)])
+    def test_wad_functions_match(self, compact, gaussian, x):
+        assert compact.erfc(x) == gaussian.erfc(x)
+        assert compact.erfinv(x // 5) == gaussian.erfinv(x // 5)
+        x_wad = x * WAD // POW96
+        assert compact.cdf(x_wad, 0, WAD) == gaussian.cdf(x_wad, 0, WAD)
+        assert compact.cdf_pdf(x_wad, WAD, 2 * WAD) == gaussian.cdf_pdf(x_wad, WAD, 2 * WAD)
+
+    @pytest.mark.parametrize("p", PROBABILITIES)
+    def test_inverse_functions_match(self, compact, gaussian, p):
+        assert compact.ppf(p, WAD, 3 * WAD) == gaussian.ppf(p, WAD, 3 * WAD)
+        assert compact.erfcinv(2 * p) == gaussian.erfcinv(2 * p)
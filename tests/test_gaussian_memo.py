@@ -0,0 +1,82 @@
+import pytest
+import compile_cache
+from gas_benchmark import new_transaction
+
+WAD = 10**18
+
+# (x, u, o) for cdf, from the body to the saturated tail, which returns 0
+CDF_ARGS = [(0, 0, WAD), (WAD, 0, WAD), (-3 * WAD, WAD, 2 * WAD),
+            (1050 * WAD, 1000 * WAD, 50 * WAD), (-20 * WAD, 0, WAD)]
+# (p, u, o) for ppf, p = 1/2 with u = 0 returns 0
+PPF_ARGS = [(WAD // 2, 0, WAD), (WAD // 100, 0, WAD), (975 * WAD // 1000, WAD, 3 * WAD),
+            (WAD - 10**14, 1000 * WAD, 50 * WAD)]
+
+
+@pytest.fixture
+def memo(src_dir):
+    """Fresh deployment per test, each test starting a new transaction."""
+    new_transaction()
+    return compile_cache.load(src_dir / "gaussian_memo.vy")
+
+
+@pytest.fixture
+def callers(src_dir, memo):
+    """Two examples/memo_caller.vy consumers of `memo`."""
+    path = src_dir / "examples" / "memo_caller.vy"
+    return compile_cache.load(path, memo.address), compile_cache.load(path, memo.address)
+
+
+class TestMemo:
+    def test_exports_gaussian_abi(self, memo, gaussian):
+        def names(c):
+            return {f["name"] for f in c.abi if f["type"] == "function"}
+
+        assert names(memo) == names(gaussian) | {"cdf_cached", "ppf_cached"}
+
+    @pytest.mark.parametrize("args", CDF_ARGS)
+    def test_cdf_hit_matches_miss(self, callers, gaussian, args):
+        (plain, miss, hit), (plain_gas, miss_gas, hit_gas) = callers[0].cdf_twice(*args)
+        assert plain == miss == hit == gaussian.cdf(*args)
+        assert hit_gas < miss_gas and plain_gas < miss_gas
+
+    @pytest.mark.parametrize("args", PPF_ARGS)
+    def test_ppf_hit_matches_miss(self, callers, gaussian, args):
+        (plain, miss, hit), (plain_gas, miss_gas, hit_gas) = callers[0].ppf_twice(*args)
+        assert plain == miss == hit == gaussian.ppf(*args)
+        assert hit_gas < miss_gas and plain_gas < miss_gas
+
+    def test_hit_cheaper_than_plain(self, callers):
+        _, (plain_gas, _, hit_gas) = callers[0].cdf_twice(WAD, 0, WAD)
+        assert hit_gas < plain_gas
+
+    def test_key_covers_every_argument(self, memo, gaussian):
+        # Top-level calls share transient storage until new_transaction(), like one transaction
+        memo.cdf_cached(WAD, 0, WAD)
+        for args in [(2 * WAD, 0, WAD), (WAD, WAD, WAD), (WAD, 0, 2 * WAD)]:
+            assert memo.cdf_cached(*args) == gaussian.cdf(*args)
+
+    def test_cdf_and_ppf_caches_are_separate(self, memo, gaussian):
+        args = (WAD // 4, 0, WAD)
+        memo.cdf_cached(*args)
+        assert memo.ppf_cached(*args) == gaussian.ppf(*args)
+        assert memo.cdf_cached(*args) == gaussian.cdf(*args)
+
+    def test_shared_between_callers(self, callers):
+        first, second = callers
+        cdf, (miss_gas, hit_gas) = first.cdf_shared(second.address, WAD // 3, 0, WAD)
+        assert cdf[0] == cdf[1] and hit_gas < miss_gas
+        ppf, (miss_gas, hit_gas) = first.ppf_shared(second.address, WAD // 3, 0, WAD)
+        assert ppf[0] == ppf[1] and hit_gas < miss_gas
+
+    def test_empty_in_a_new_transaction(self, callers):
+        for args in CDF_ARGS:
+            _, first = callers[0].cdf_twice(*args)
+            new_transaction()
+            _, second = callers[0].cdf_twice(*args)
+            # The first cdf_cached of the new transaction misses again
+            assert second == first
+        for args in PPF_ARGS:
+            _, first = callers[0].ppf_twice(*args)
+            new_transaction()
+            _, second = callers[0].ppf_twice(*args)
+            assert second == first
@@ -0,0 +1,96 @@
+import pytest
+import compile_cache
+from reference_tables import Grid
+
+WAD = 10**18
+POW96 = 2**96
+ERROR_TOLERANCE = 10**10
+ERFC_UPPER = 321056282956553358679555000716
+
+
+@pytest.fixture(scope="session")
+def segmented(src_dir):
+    return compile_cache.load(src_dir / "gaussian_segmented.vy")
+
+
+# Both ends and the center of every 0.5-wide segment, plus the ERFC_UPPER cutoff
+SEGMENT_POINTS = [
+    i * POW96 // 4 + d
+    for i in range(16)
+    for d in (-1, 0, 1)
+    if 0 <= i * POW96 // 4 + d < ERFC_UPPER
+] + [ERFC_UPPER - 1, ERFC_UPPER, 5 * POW96]
+
+
+class TestSegmentedErfc:
+    @pytest.mark.parametrize("z", SEGMENT_POINTS)
+    def test_erfc_every_segment(self, segmented, reference_value, z):
+        for x in (z, -z):
+            error = abs(segmented.erfc(x) - reference_value("erfc", x))
+            assert error < ERROR_TOLERANCE, f"erfc({x / POW96}) error {error} >= {ERROR_TOLERANCE}"
+
+    def test_erfc_dense_grid(self, segmented, reference_table):
+        for x, expected in reference_table(Grid("erfc", -44 * POW96 // 10, 44 * POW96 // 10, 126)):
+            error = abs(segmented.erfc(x) - expected)
+            assert error < ERROR_TOLERANCE, f"erfc({x / POW96}) error {error} >= {ERROR_TOLERANCE}"
+
+    def test_erfc_matches_rational(self, segmented, gaussian):
+        for i in range(-45, 46):
+            x = i * POW96 // 10
+            assert abs(segmented.erfc(x) - gaussian.erfc(x)) < ERROR_TOLERANCE
+
+    def test_erfc_beyond_cutoff(self, segmented):
+        assert segmented.erfc(ERFC_UPPER) == 0
+        assert segmented.erfc(-ERFC_UPPER) == 2 * WAD
+
+    def test_erfc_monotonic(self, segmented):
+        prev = segmented.erfc(-ERFC_UPPER)
+        for i in range(-40, 41):
+            cur = segmented.erfc(i * POW96 // 10)
+            assert cur <= prev
+            prev = cur
+
+
+class TestSegmentedCdf:
+    @pytest.mark.parametrize(
+        "x,u,o",
+        [
+            (0, 0, WAD),
+            (WAD, 0, WAD),
+            (-WAD, 0, WAD),
+            (3 * WAD, 0, WAD),
+            (-5 * WAD, 0, WAD),
+            (1100 * WAD, 1000 * WAD, 50 * WAD),
+            (WAD // 2, WAD, WAD // 4),
+        ],
+    )
+    def test_cdf_known_values(self, segmented, reference_value, x, u, o):
+        error = abs(segmented.cdf(x, u, o) - reference_value("cdf", x, u, o))
+        assert error < ERROR_TOLERANCE
+
+    def test_cdf_pdf_matches_separate_calls(self, segmented):
+        x, u, o = 3 * WAD // 2, 0, WAD
+        assert segmented.cdf_pdf(x, u, o) == (segmented.cdf(x, u, o), segmented.pdf(x, u, o))
+
+    def test_batch_matches_single(self, segmented):
+        xs = [i * POW96 // 3 for i in range(-13, 14)]
+        assert segmented.erfc_batch(xs)[: len(xs)] == [segmented.erfc(x) for x in xs]
+        ws = [i * WAD // 2 for i in range(-8, 9)]
+        expected = [segmented.cdf(w, WAD, 2 * WAD) for w in ws]
+        assert segmented.cdf_batch(ws, WAD, 2 * WAD)[: len(ws)] == expected
+
+
+class TestSegmentedExports:
+    def test_abi_leaves_out_log_and_fast_tier(self, segmented, gaussian):
+        def names(c):
+            return {f["name"] for f in c.abi if f["type"] == "function"}
+
+        left_out = {"log_cdf", "log_sf", "erfc_fast", "cdf_fast", "ppf_fast"}
+        assert names(segmented) == names(gaussian) - left_out
+
+    def test_inverse_functions_match_gaussian(self, segmented, gaussian):
+        for x in (0, WAD // 3, -WAD // 2, 99 * WAD // 100):
+            assert segmented.erfinv(x) == gaussian.erfinv(x)
+        assert segmented.erfcinv(WAD // 10) == gaussian.erfcinv(WAD // 10)
+        assert segmented.ppf(WAD // 4, 0, WAD) == gaussian.ppf(WAD // 4, 0, WAD)
+        assert segmented.pdf(WAD, 0, WAD) == gaussian.pdf(WAD, 0, WAD)
@@ -0,0 +1,62 @@
+import compile_cache
+import minimax
+import pytest
+from mpmath import mpf, nint
+
+POW96 = 2**96
+
+# Coarser than the CLI's grid, enough for low degrees
+FIT_POINTS = 500
+
+
+def fit(target: str, n: int, m: int) -> minimax.Quantized:
+    t = minimax.TARGETS[target]
+    return minimax.quantize(minimax.remez(t.function, t.a, t.b, n, m, FIT_POINTS), t.layout)
+
+
+def inputs(target: str, count: int = 16) -> list:
+    t = minimax.TARGETS[target]
+    low, high = int(nint(mpf(t.a) * POW96)), int(nint(mpf(t.b) * POW96)) - 1
+    return [low + (high - low) * i // (count - 1) for i in range(count)]
+
+
+class TestRemez:
+    def test_erfc_matches_shipped_error(self):
+        """The shipped (11, 4) erfc constants are minimax, so a fit reproduces their error."""
+        target = minimax.TARGETS['erfc']
+        constants = fit('erfc', 11, 4)
+        error, _ = minimax.quantized_error(target, constants, target.a, target.b, points=500)
+        assert 6e-9 < error < 7e-9
+
+    def test_error_levels_with_degree(self):
+        target = minimax.TARGETS['erfinv2']
+        errors = [minimax.remez(target.function, target.a, target.b, n, n, FIT_POINTS).error
+                  for n in (1, 2, 3)]
+        assert errors[0] > errors[1] > errors[2]
+
+    def test_pareto(self):
+        rows = [
+            {'max_error': 1e-3, 'gas': 100},
+            {'max_error': 1e-4, 'gas': 100},
+            {'max_error': 1e-6, 'gas': 200},
+            {'max_error': 1e-5, 'gas': 250},
+            {'max_error': None, 'gas': 50},
+        ]
+        assert minimax.pareto(rows) == [rows[1], rows[2]]
+
+
+class TestHarness:
+    @pytest.mark.parametrize("target,n,m", [('erfinv2', 3, 2), ('erfinv3', 3, 3)])
+    def test_snippet_matches_emulation(self, target, n, m):
+        """The emitted Vyper computes exactly what the quantized error was measured on."""
+        prefix = minimax.TARGETS[target].prefix
+        constants = fit(target, n, m)
+        contract = compile_cache.loads(minimax.harness(prefix, constants),
+                                       filename=minimax.HARNESS_FILENAME)
+        for x in inputs(target):
+            assert contract.evaluate(x) == minimax.evaluate(constants, x, constants.scale)
+
+    def test_gas_is_marginal(self):
+        constants = fit('erfinv2', 2, 0)
+        x = inputs('erfinv2')[0]
+        assert 0 < minimax.measure_gas('ERFINV2', constants, x) < 200
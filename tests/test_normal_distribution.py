@@ -0,0 +1,83 @@
+import pytest
+import boa
+import compile_cache
+WAD = 10**18
+ERROR_TOLERANCE = 10**10
+
+# (mean, standard deviation) in WAD
+DISTRIBUTIONS = [
+    (0, WAD),
+    (1000 * WAD, 50 * WAD),
+    (-3 * WAD, WAD // 4),
+    (WAD // 2, 10**12),
+]
+
+
+@pytest.fixture(scope="session")
+def deployer(src_dir):
+    return compile_cache.load_partial(src_dir / "normal_distribution.vy")
+
+
+@pytest.fixture(scope="session")
+def factory(src_dir, deployer):
+    blueprint = deployer.deploy_as_blueprint()
+    return compile_cache.load(src_dir / "normal_distribution_factory.vy", blueprint.address)
+
+
+class TestNormalDistribution:
+    @pytest.mark.parametrize("u,o", DISTRIBUTIONS)
+    def test_cdf_known_values(self, deployer, reference_value, u, o):
+        dist = deployer.deploy(u, o)
+        for k in [-4, -2, -1, 0, 1, 2, 4]:
+            x = u + k * o // 2
+            assert abs(dist.cdf(x) - reference_value("cdf", x, u, o)) < ERROR_TOLERANCE
+
+    @pytest.mark.parametrize("u,o", DISTRIBUTIONS)
+    def test_ppf_known_values(self, deployer, reference_value, u, o):
+        dist = deployer.deploy(u, o)
+        for p in [WAD // 100, WAD // 4, WAD // 2, 3 * WAD // 4, 99 * WAD // 100]:
+            # ppf error scales with o
+            tolerance = ERROR_TOLERANCE * max(o, WAD) // WAD
+            assert abs(dist.ppf(p) - reference_value("ppf", p, u, o)) < tolerance
+
+    @pytest.mark.parametrize("u,o", DISTRIBUTIONS)
+    def test_matches_gaussian(self, deployer, gaussian, u, o):
+        dist = deployer.deploy(u, o)
+        assert dist.MEAN() == u
+        assert dist.SIGMA() == o
+        for p in [WAD // 10, WAD // 2, 9 * WAD // 10]:
+            assert dist.ppf(p) == gaussian.ppf(p, u, o)
+        for k in [-3, 0, 1, 5]:
+            x = u + k * o // 2
+            assert abs(dist.cdf(x) - gaussian.cdf(x, u, o)) <= 1
+
+    def test_zero_sigma_reverts(self, deployer):
+        with boa.reverts("zero sigma"):
+            deployer.deploy(0, 0)
+
+
+class TestNormalDistributionFactory:
+    def test_create(self, deployer, factory, reference_value):
+        dist = deployer.at(factory.create(1000 * WAD, 50 * WAD))
+        assert dist.MEAN() == 1000 * WAD
+        assert dist.SIGMA() == 50 * WAD
+        expected = reference_value("cdf", 1100 * WAD, 1000 * WAD, 50 * WAD)
+        assert abs(dist.cdf(1100 * WAD) - expected) < ERROR_TOLERANCE
+
+    def test_create_emits_event(self, factory):
+        address = factory.create(0, WAD)
+        event = factory.get_logs()[0]
+        assert event.distribution == address
+        assert (event.u, event.o) == (0, WAD)
+
+    def test_instances_are_independent(self, deployer, factory):
+        first = deployer.at(factory.create(0, WAD))
+        second = deployer.at(factory.create(5 * WAD, 2 * WAD))
+        assert first.address != second.address
+        assert (first.MEAN(), first.SIGMA()) == (0, WAD)
+        assert (second.MEAN(), second.SIGMA()) == (5 * WAD, 2 * WAD)
+        assert abs(second.ppf(WAD // 2) - 5 * WAD) < ERROR_TOLERANCE
+
+    def test_create_zero_sigma_reverts(self, factory):
+        with boa.reverts():
+            factory.create(0, 0)
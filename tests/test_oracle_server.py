@@ -0,0 +1,76 @@
+import oracle_server
+import pytest
+import threading
+from multiprocessing.pool import Pool
+
+WAD = 10**18
+
+# Outputs of the one-shot scripts before they became thin clients
+ONE_SHOT = [
+    ("erfc 0", "0x0000000000000000000000000000000000000000000000000de0b6b3a7640000"),
+    ("erfc -1234567890123456789",
+     "0x0000000000000000000000000000000000000000000000001aa24b35282a1100"),
+    ("erfinv 500000000000000000",
+     "0x000000000000000000000000000000000000000000000000069e6b042baa3e80"),
+    ("erfinv 1000000000000000000",
+     "0x0000000000000000000000000000000000000000000000000000000000000000"),
+    ("erfcinv 1500000000000000000",
+     "0xfffffffffffffffffffffffffffffffffffffffffffffffff96194fbd455c180"),
+    ("cdf -3500000000000000000 250000000000000000 2000000000000000000",
+     "0x000000000000000000000000000000000000000000000000006bfd54797b9050"),
+    ("ppf 25000000000000000 0 1000000000000000000",
+     "0xffffffffffffffffffffffffffffffffffffffffffffffffe4cccf23f0ee4e00"),
+    ("ppf 999000000000000000 1000000000000000000000 50000000000000000000",
+     "0x00000000000000000000000000000000000000000000003e961135421f100000"),
+]
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Unix socket server on a background thread, yields its address."""
+    address = str(tmp_path / "oracle.sock")
+    server = oracle_server.UnixServer(address, oracle_server._handler(None, 1))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield address
+    server.shutdown()
+    server.server_close()
+
+
+class TestOracles:
+    @pytest.mark.parametrize("request_line,expected", ONE_SHOT)
+    def test_matches_one_shot_scripts(self, request_line, expected):
+        assert oracle_server.handle(request_line) == expected
+
+    def test_errors(self):
+        assert oracle_server.handle("sf 1") == "error: unknown function sf"
+        assert oracle_server.handle("cdf 1 0 0").startswith("error: ZeroDivisionError")
+        assert oracle_server.handle("erfc").startswith("error: TypeError")
+
+
+class TestBatch:
+    def test_pool_keeps_order(self):
+        lines = [line + "\n" for line in oracle_server.requests(200)] + ["\n", "sf 1\n"]
+        serial, pooled = [], []
+        assert oracle_server.respond(lines, serial.append) == 201
+        with Pool(2) as pool:
+            oracle_server.respond(lines, pooled.append, pool, chunksize=16)
+        assert pooled == serial
+        assert serial[-1] == "error: unknown function sf\n"
+
+
+class TestClient:
+    def test_socket_round_trip(self, server):
+        for request_line, expected in ONE_SHOT:
+            function, *args = request_line.split()
+            assert oracle_server.call(function, args, server) == expected
+
+    def test_rejected_request(self, server):
+        with pytest.raises(ValueError, match="unknown function"):
+            oracle_server.call("sf", ["1"], server)
+
+    def test_unreachable_server_falls_back(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(oracle_server.ENV_ADDRESS, str(tmp_path / "missing.sock"))
+        request_line, expected = ONE_SHOT[0]
+        function, *args = request_line.split()
+        assert oracle_server.call(function, args) == expected
@@ -0,0 +1,211 @@
+import json
+import os
+import pytest
+import boa
+import compile_cache
+from collections import defaultdict
+from hypothesis import HealthCheck, given, settings, strategies as st
+from pathlib import Path
+from emulator import C
+
+WAD = 10**18
+POW96 = 2**96
+MAX_BATCH = 128
+INT256_MIN = -(2**255)
+INT256_MAX = 2**255 - 1
+UINT256_MAX = 2**256 - 1
+
+# Per-input gas of both builds, written here when the session ends
+GAS_DELTA_DIR = Path(__file__).parent / ".fuzz"
+
+# max_examples comes from the active profile, see "venom-fuzz" in conftest.py
+FUZZ = settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+
+
+def clamp(x: int, low: int = INT256_MIN, high: int = INT256_MAX) -> int:
+    return min(max(x, low), high)
+
+
+def near(points: list, spread: int, low: int = INT256_MIN, high: int = INT256_MAX):
+    """Points plus or minus up to `spread`, clamped to [low, high]."""
+    return st.builds(
+        lambda p, d: clamp(p + d, low, high), st.sampled_from(points), st.integers(-spread, spread)
+    )
+
+
+def biased(boundaries: list, body: tuple, low: int = INT256_MIN, high: int = INT256_MAX):
+    """Branch boundaries at two widths, a uniform body range, int256 extremes and anything."""
+    extremes = [0, 1, -1, 2, -2, INT256_MAX, INT256_MIN, INT256_MAX - 1, INT256_MIN + 1,
+                2**128, -(2**128), 2**192, -(2**192), POW96, -POW96, WAD, -WAD, 2 * WAD]
+    return st.one_of(
+        near(boundaries, 2**16, low, high),
+        near(boundaries, 2**64, low, high),
+        st.integers(*body),
+        st.sampled_from([clamp(x, low, high) for x in extremes]),
+        st.integers(low, high),
+    )
+
+
+def symmetric(points: list) -> list:
+    return sorted({p for x in points for p in (x, -x)})
+
+
+# 2^96 inputs of erfc and erfinv
+X96 = biased(
+    symmetric([0, C["ERFC_UPPER"], C["ERFC_FAST_UPPER"], C["ERFINV_0_99"], C["ERFINV_0_9999"],
+               POW96]),
+    (-5 * POW96, 5 * POW96),
+)
+# WAD probabilities, with the erfinv range boundaries mapped back to p
+P_WAD = biased(
+    [0, WAD // 2, WAD, 2 * WAD, WAD // 50, 49 * WAD // 50, WAD // 200, 199 * WAD // 200],
+    (0, 2 * WAD),
+)
+X_WAD = biased(symmetric([0, 5 * WAD, 6 * WAD, 10**30]), (-10 * WAD, 10 * WAD))
+MEAN = biased([0, WAD, 1000 * WAD], (-(10**24), 10**24))
+SIGMA_UINT = biased([1, WAD, 2**255, UINT256_MAX], (1, 10**24), 0, UINT256_MAX)
+SIGMA_INT = biased([1, WAD, 10**24], (1, 10**24))
+BATCH_X96 = st.lists(X96, max_size=MAX_BATCH)
+BATCH_P = st.lists(P_WAD, max_size=MAX_BATCH)
+BATCH_X = st.lists(X_WAD, max_size=MAX_BATCH)
+
+
+@pytest.fixture(scope="session")
+def builds(src_dir):
+    """(standard, Venom) gaussian.vy in the same boa environment."""
+    standard = compile_cache.load(src_dir / "gaussian.vy", experimental_codegen=False)
+    venom = compile_cache.load(src_dir / "gaussian.vy", experimental_codegen=True)
+    return standard, venom
+
+
+@pytest.fixture(scope="session")
+def gas_deltas():
+    """{function: [(args, standard gas, Venom gas)]}, summarized to GAS_DELTA_DIR at the end."""
+    deltas = defaultdict(list)
+    yield deltas
+
+    summary = {}
+    for function, rows in sorted(deltas.items()):
+        diff = [venom - standard for _, standard, venom in rows]
+        worst = sorted(rows, key=lambda r: r[1] - r[2])[:5]
+        summary[function] = {
+            'inputs': len(rows),
+            'mean_delta': round(sum(diff) / len(diff), 1),
+            'min_delta': min(diff),
+            'max_delta': max(diff),
+            'venom_cheaper': sum(d < 0 for d in diff),
+            'venom_costlier': sum(d > 0 for d in diff),
+            'worst_for_venom': [
+                {'args': args, 'standard': standard, 'venom': venom}
+                for args, standard, venom in worst
+            ],
+        }
+    GAS_DELTA_DIR.mkdir(exist_ok=True)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    path = GAS_DELTA_DIR / f"venom_gas_delta-{worker}.json"
+    path.write_text(json.dumps(summary, indent=2, default=str))
+
+
+def outcome(contract, function: str, *args) -> tuple:
+    """(reverted, raw return or revert data, gas) of one call, without decoding."""
+    calldata = getattr(contract, function).prepare_calldata(*args)
+    computation = boa.env.execute_code(to_address=contract.address, data=calldata)
+    return computation.is_error, computation.output, computation.get_gas_used()
+
+
+def check(builds, gas_deltas, function: str, *args) -> None:
+    standard, venom = builds
+    std_reverted, std_output, std_gas = outcome(standard, function, *args)
+    venom_reverted, venom_output, venom_gas = outcome(venom, function, *args)
+
+    assert venom_reverted == std_reverted, f"{function}{args}: revert mismatch"
+    assert venom_output == std_output, f"{function}{args}: output mismatch"
+    gas_deltas[function].append((args, std_gas, venom_gas))
+
+
+class TestVenomDifferential:
+    """The Venom build returns and reverts bit-identically to the standard build."""
+
+    @FUZZ
+    @given(x=X96)
+    def test_erfc(self, builds, gas_deltas, x):
+        check(builds, gas_deltas, "erfc", x)
+
+    @FUZZ
+    @given(x=X96)
+    def test_erfinv(self, builds, gas_deltas, x):
+        check(builds, gas_deltas, "erfinv", x)
+
+    @FUZZ
+    @given(x=P_WAD)
+    def test_erfcinv(self, builds, gas_deltas, x):
+        check(builds, gas_deltas, "erfcinv", x)
+
+    @FUZZ
+    @given(x=X_WAD, u=MEAN, o=SIGMA_UINT)
+    def test_cdf(self, builds, gas_deltas, x, u, o):
+        check(builds, gas_deltas, "cdf", x, u, o)
+
+    @FUZZ
+    @given(x=P_WAD, u=MEAN, o=SIGMA_INT)
+    def test_ppf(self, builds, gas_deltas, x, u, o):
+        check(builds, gas_deltas, "ppf", x, u, o)
+
+    @FUZZ
+    @given(x=X_WAD, u=MEAN, o=SIGMA_UINT)
+    def test_pdf(self, builds, gas_deltas, x, u, o):
+        check(builds, gas_deltas, "pdf", x, u, o)
+
+    @FUZZ
+    @given(x=X_WAD, u=MEAN, o=SIGMA_UINT)
+    def test_cdf_pdf(self, builds, gas_deltas, x, u, o):
+        check(builds, gas_deltas, "cdf_pdf", x, u, o)
+
+    @FUZZ
+    @given(x=X_WAD, u=MEAN, o=SIGMA_UINT)
+    def test_log_cdf(self, builds, gas_deltas, x, u, o):
+        check(builds, gas_deltas, "log_cdf", x, u, o)
+
+    @FUZZ
+    @given(x=X_WAD, u=MEAN, o=SIGMA_UINT)
+    def test_log_sf(self, builds, gas_deltas, x, u, o):
+        check(builds, gas_deltas, "log_sf", x, u, o)
+
+    @FUZZ
+    @given(x=X96)
+    def test_erfc_fast(self, builds, gas_deltas, x):
+        check(builds, gas_deltas, "erfc_fast", x)
+
+    @FUZZ
+    @given(x=X_WAD, u=MEAN, o=SIGMA_UINT)
+    def test_cdf_fast(self, builds, gas_deltas, x, u, o):
+        check(builds, gas_deltas, "cdf_fast", x, u, o)
+
+    @FUZZ
+    @given(x=P_WAD, u=MEAN, o=SIGMA_INT)
+    def test_ppf_fast(self, builds, gas_deltas, x, u, o):
+        check(builds, gas_deltas, "ppf_fast", x, u, o)
+
+
+class TestVenomDifferentialBatch:
+    """Up to MAX_BATCH inputs per call, for throughput."""
+
+    @FUZZ
+    @given(xs=BATCH_X96)
+    def test_erfc_batch(self, builds, gas_deltas, xs):
+        check(builds, gas_deltas, "erfc_batch", xs)
+
+    @FUZZ
+    @given(xs=BATCH_X96)
+    def test_erfinv_batch(self, builds, gas_deltas, xs):
+        check(builds, gas_deltas, "erfinv_batch", xs)
+
+    @FUZZ
+    @given(xs=BATCH_P, u=MEAN, o=SIGMA_INT)
+    def test_ppf_batch(self, builds, gas_deltas, xs, u, o):
+        check(builds, gas_deltas, "ppf_batch", xs, u, o)
+
+    @FUZZ
+    @given(xs=BATCH_X, u=MEAN, o=SIGMA_UINT)
+    def test_cdf_batch(self, builds, gas_deltas, xs, u, o):
+        check(builds, gas_deltas, "cdf_batch", xs, u, o)